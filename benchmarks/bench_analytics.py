@@ -0,0 +1,94 @@
+"""
+Benchmark for TaskManager.statistics().
+
+Writes a columnar snapshot holding the given number of tasks (random
+completion, priorities, due dates and description lengths), opens it the way
+the app does after compaction, and times statistics() on it, both untouched
+and after a few thousand changes made on top of the snapshot. With --objects
+it also times a manager holding the same tasks as Python objects.
+
+Reports whether NumPy was used; without it the array fallback gives the same
+results more slowly.
+
+Usage (from the repository root):
+    python benchmarks/bench_analytics.py --tasks 10000000
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from models.task import Task  # noqa: E402
+from storage.columnar import write_snapshot  # noqa: E402
+from task_manager import TaskManager  # noqa: E402
+from utils import analytics  # noqa: E402
+
+
+DESCRIPTIONS = ["", "Short note", "Pick up the parcel from the post office before noon",
+                "A longer description " * 8]
+
+
+def generate(count, seed):
+    """Yield count random tasks with consecutive IDs."""
+    rng = random.Random(seed)
+    dues = [None] + [f"2026-{month:02d}-{day:02d}" for month in range(1, 13) for day in range(1, 29)]
+    for task_id in range(1, count + 1):
+        yield Task.trusted(task_id, f"Task {task_id}", rng.choice(DESCRIPTIONS), rng.random() < 0.4,
+                           rng.choice(dues), rng.choice((None, 1, 2, 3, 4, 5)))
+
+
+def best_ms(call, repeat):
+    """Fastest of repeat calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TaskManager.statistics() benchmark")
+    parser.add_argument("--tasks", type=int, default=10_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--objects", action="store_true",
+                        help="Also time a manager holding the tasks as Python objects (needs much more memory)")
+    args = parser.parse_args(argv)
+
+    print(f"{args.tasks:,} tasks, NumPy {'available' if analytics.np is not None else 'not installed (array fallback)'}")
+    directory = tempfile.mkdtemp(prefix="todo-analytics-")
+    try:
+        path = os.path.join(directory, "tasks.snapshot")
+        start = time.perf_counter()
+        write_snapshot(path, generate(args.tasks, args.seed), args.tasks + 1)
+        print(f"{'write snapshot':<32} {(time.perf_counter() - start) * 1000:>10.1f} ms")
+
+        manager = TaskManager.open_snapshot(path)
+        print(f"{'statistics() on snapshot':<32} {best_ms(manager.statistics, args.repeat):>10.1f} ms")
+
+        rng = random.Random(args.seed)
+        for task_id in rng.sample(range(1, args.tasks + 1), min(3000, args.tasks)):
+            manager.toggle_task_completion(task_id)
+        manager.add_tasks((f"New {i}", "", False, "2026-05-05", 2) for i in range(1000))
+        manager.delete_tasks(range(1, min(1000, args.tasks) + 1))
+        print(f"{'statistics() after changes':<32} {best_ms(manager.statistics, args.repeat):>10.1f} ms")
+        manager.close()
+
+        if args.objects:
+            manager = TaskManager()
+            manager.add_tasks((task.title, task.description, task.completed, task.due, task.priority)
+                              for task in generate(args.tasks, args.seed))
+            print(f"{'statistics() on objects':<32} {best_ms(manager.statistics, args.repeat):>10.1f} ms")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Benchmark for the change feed.
+
+Keeps a consumer's copy of the tasks up to date after a few changes, once by
+re-reading every task (polling) and once by applying the change-feed events
+since its last position. Also reports what an attached feed costs writers.
+
+Usage (from the repository root):
+    python benchmarks/bench_change_feed.py --sizes 10000,100000,1000000 --changes 100
+"""
+import argparse
+import copy
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from task_manager import TaskManager  # noqa: E402
+
+
+def snapshot(manager):
+    """Copy every task's fields, as a polling consumer would."""
+    return {task.id: (task.title, task.description, task.completed, task.due, task.priority)
+            for task in manager.iter_tasks()}
+
+
+def make_changes(manager, count, size):
+    """Toggle, rename and delete a few tasks spread over the list."""
+    step = max(1, size // count)
+    for i in range(count):
+        task_id = 1 + (i * step) % size
+        if manager.get_task_by_id(task_id) is None:
+            continue
+        if i % 3 == 0:
+            manager.toggle_task_completion(task_id)
+        elif i % 3 == 1:
+            manager.update_task(task_id, title=f"Renamed {i}")
+        else:
+            manager.delete_task(task_id)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Change feed benchmark")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated task counts")
+    parser.add_argument("--changes", type=int, default=100, help="Changes between two catch-ups")
+    args = parser.parse_args(argv)
+
+    print(f"{'tasks':>10} {'poll ms':>10} {'feed ms':>10} {'toggle us':>10} {'with feed us':>13}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        manager = TaskManager()
+        manager.add_tasks((f"Task {i}", "", False, None, i % 5 + 1) for i in range(size))
+
+        start = time.perf_counter()
+        for task_id in range(1, 10_001):
+            manager.toggle_task_completion(1 + task_id % size)
+        toggle_plain = (time.perf_counter() - start) / 10_000 * 1e6
+
+        subscription = manager.subscribe()
+        mirror = {task.id: copy.copy(task) for task in manager.get_all_tasks()}
+        start = time.perf_counter()
+        for task_id in range(1, 10_001):
+            manager.toggle_task_completion(1 + task_id % size)
+        toggle_feed = (time.perf_counter() - start) / 10_000 * 1e6
+        for event in subscription.poll():
+            event.apply(mirror)
+
+        make_changes(manager, args.changes, size)
+        start = time.perf_counter()
+        snapshot(manager)
+        poll = (time.perf_counter() - start) * 1000
+
+        make_changes(manager, args.changes, size)
+        start = time.perf_counter()
+        for event in subscription.poll():
+            event.apply(mirror)
+        feed = (time.perf_counter() - start) * 1000
+
+        print(f"{size:>10,} {poll:>10.2f} {feed:>10.3f} {toggle_plain:>10.2f} {toggle_feed:>13.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
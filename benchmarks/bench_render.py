@@ -0,0 +1,70 @@
+"""
+Benchmark for the menu's render cache.
+
+Shows a list of tasks once, toggles one task and shows the list again, timing
+the redisplay through RenderCache against formatting every line again. Only the
+formatting and the single buffered write (to an in-memory buffer) are timed;
+reading the tasks is the same for both.
+
+Usage (from the repository root):
+    python benchmarks/bench_render.py --sizes 1000,10000,100000
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from main import task_block  # noqa: E402
+from task_manager import TaskManager  # noqa: E402
+from utils.render_cache import RenderCache  # noqa: E402
+
+
+def show(tasks, render):
+    """Format tasks with render and write them out in one call, like the menu does."""
+    out = io.StringIO()
+    out.write("\n".join([render(task) for task in tasks]) + "\n")
+    return out
+
+
+def best_ms(call, repeat):
+    """Fastest of repeat calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render cache benchmark")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated task counts")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    print(f"{'tasks':>10} {'cached ms':>10} {'uncached ms':>12} {'formatted':>10}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        manager = TaskManager()
+        manager.add_tasks((f"Task {i}", "Some description" if i % 2 else "", False, "2026-07-01", i % 5 + 1)
+                          for i in range(size))
+        tasks = manager.get_all_tasks()
+        cache = RenderCache(memory_budget=size * 400)
+        show(tasks, lambda task: cache.render("list", task, task_block))
+
+        def redisplay():
+            manager.toggle_task_completion(size // 2)
+            show(tasks, lambda task: cache.render("list", task, task_block))
+
+        misses = cache.misses
+        cached = best_ms(redisplay, args.repeat)
+        formatted = (cache.misses - misses) // args.repeat
+        uncached = best_ms(lambda: show(tasks, task_block), args.repeat)
+        print(f"{size:>10,} {cached:>10.2f} {uncached:>12.2f} {formatted:>10}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
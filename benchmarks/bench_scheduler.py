@@ -0,0 +1,98 @@
+"""
+Benchmark for the due date / priority queries.
+
+Times next_tasks(), the first page of overdue_tasks(), a sorted listing page
+and update_task() with the heap indexes in place, against sorting every task
+with sorted() for each query, on lists of increasing size where tasks get
+random due dates and priorities.
+
+Usage (from the repository root):
+    python benchmarks/bench_scheduler.py --sizes 10000,100000,1000000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from indexes.heap_index import due_key, priority_key  # noqa: E402
+from task_manager import TaskManager  # noqa: E402
+
+
+TODAY = "2026-07-01"
+PAGE = 20
+
+
+def build_manager(size, rng):
+    """Create an in-memory manager holding size tasks, a third of them completed."""
+    manager = TaskManager()
+    manager.add_tasks(
+        (f"Task {i}", "", i % 3 == 0,
+         rng.choice((None, f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}")),
+         rng.choice((None, 1, 2, 3, 4, 5)))
+        for i in range(size)
+    )
+    return manager
+
+
+def best_ms(call, repeat):
+    """Fastest of repeat calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Due date and priority query benchmark")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated task counts")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    print(f"{'tasks':>10} {'query':<22} {'heap ms':>10} {'sorted() ms':>12}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        manager = build_manager(size, rng)
+        tasks = manager.get_all_tasks()
+
+        start = time.perf_counter()
+        manager.next_tasks(PAGE)
+        manager.overdue_tasks(limit=PAGE, today=TODAY)
+        build = (time.perf_counter() - start) * 1000
+        print(f"{size:>10,} {'build both heaps':<22} {build:>10.2f}")
+
+        queries = {
+            "next_tasks": (
+                lambda: manager.next_tasks(PAGE),
+                lambda: sorted((task for task in tasks if not task.completed), key=priority_key)[:PAGE],
+            ),
+            "overdue page": (
+                lambda: manager.overdue_tasks(limit=PAGE, today=TODAY),
+                lambda: sorted((task for task in tasks if not task.completed and task.due and task.due < TODAY),
+                               key=due_key)[:PAGE],
+            ),
+            "list --sort due p.10": (
+                lambda: list(manager.iter_tasks(10 * PAGE, PAGE, sort="due")),
+                lambda: sorted(tasks, key=due_key)[10 * PAGE:11 * PAGE],
+            ),
+        }
+        for name, (indexed, full_sort) in queries.items():
+            print(f"{size:>10,} {name:<22} {best_ms(indexed, args.repeat):>10.3f} "
+                  f"{best_ms(full_sort, max(1, args.repeat // 10)):>12.2f}")
+
+        ids = [rng.randint(1, size) for _ in range(1000)]
+        start = time.perf_counter()
+        for task_id in ids:
+            manager.update_task(task_id, priority=rng.randint(1, 5), due=TODAY)
+        update = (time.perf_counter() - start) * 1e6 / len(ids)
+        print(f"{size:>10,} {'update_task (us)':<22} {update:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Scaling benchmark for ShardedTaskManager.
+
+Times bulk add, bulk mark, bulk delete, counts and full listings on a plain
+in-process TaskManager and on ShardedTaskManager with increasing shard
+counts, and prints each result's speedup over the plain manager. Bulk work
+only scales while there are free cores; on a single core the sharded
+manager pays its inter-process copying without any parallelism to win back.
+
+Finally checks that undo on two shards reverts exactly the last operation,
+also when a shard changed nothing or could not keep the operation in its
+own history. Exits with status 1 if it does not.
+
+Usage (from the repository root):
+    python benchmarks/bench_sharded.py --tasks 1000000 --shards 1,2,4,8
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from config import HISTORY_MEMORY_BUDGET  # noqa: E402
+from sharded_task_manager import ShardedTaskManager  # noqa: E402
+from task_manager import TaskManager  # noqa: E402
+
+
+def measure(manager, tasks):
+    """Time each workload once on a fresh manager; returns {workload: seconds}."""
+    rows = [(f"Task number {i}", f"Description of task {i}") for i in range(tasks)]
+    timings = {}
+
+    start = time.perf_counter()
+    ids = manager.add_tasks(rows)
+    timings["add_tasks"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    manager.set_completed(ids[::2], True)
+    timings["set_completed"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    manager.count_tasks(completed=False)
+    timings["count_tasks"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    manager.get_all_tasks()
+    timings["get_all_tasks"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    manager.delete_tasks(ids[::3])
+    timings["delete_tasks"] = time.perf_counter() - start
+    return timings
+
+
+def check_undo():
+    """Run the sharded undo regression cases; returns a list of failure messages."""
+    failures = []
+    manager = ShardedTaskManager(2, "memory")
+    try:
+        # The second mark changes nothing on the shard of task 2, so undo must leave task 2 marked
+        manager.add_tasks([(f"Task {i}", "") for i in range(4)])
+        manager.set_completed([2], True)
+        manager.set_completed([2, 1], True)
+        manager.undo()
+        completed = sorted(task.id for task in manager.iter_tasks(completed=True))
+        if completed != [2]:
+            failures.append(f"undo after a partly redundant mark left {completed} completed, expected [2]")
+    finally:
+        manager.close()
+
+    manager = ShardedTaskManager(2, "memory")
+    try:
+        # The even shard's half is larger than its whole history budget, so the add cannot be undone
+        tasks = 2 * (HISTORY_MEMORY_BUDGET // 1000 + 1)
+        manager.add_tasks((f"Task {i}", "x" * 1000 if i % 2 else "") for i in range(tasks))
+        undone = manager.undo()
+        if undone is not None or manager.count_tasks() != tasks:
+            failures.append(f"undo of an add too large for a shard's history returned {undone!r} "
+                            f"and left {manager.count_tasks()} of {tasks} tasks")
+    finally:
+        manager.close()
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ShardedTaskManager scaling benchmark")
+    parser.add_argument("--tasks", type=int, default=300_000)
+    parser.add_argument("--shards", default="1,2,4", help="Comma-separated shard counts")
+    args = parser.parse_args(argv)
+
+    print(f"{os.cpu_count()} CPU(s), {args.tasks:,} tasks")
+    baseline = measure(TaskManager(), args.tasks)
+    print(f"{'manager':<12}" + "".join(f"{name:>22}" for name in baseline))
+    print(f"{'plain':<12}" + "".join(f"{seconds:>21.3f}s" for seconds in baseline.values()))
+
+    for shards in (int(count) for count in args.shards.split(",")):
+        manager = ShardedTaskManager(shards, "memory")
+        try:
+            timings = measure(manager, args.tasks)
+        finally:
+            manager.close()
+        print(f"{f'{shards} shard(s)':<12}" + "".join(
+            f"{seconds:>11.3f}s ({baseline[name] / seconds:>5.2f}x)" for name, seconds in timings.items()
+        ))
+
+    failures = check_undo()
+    for failure in failures:
+        print(f"Undo check failed: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Startup latency benchmark for main.py.
+
+Measures, in fresh processes, how long the app takes to show the interactive
+menu (time-to-first-menu) and to run complete one-shot commands on a data
+directory holding a given number of tasks. Each command runs "cold" (index
+images deleted first, so indexes are rebuilt from every task and the images
+saved again on exit) and "warm" (the images saved by the previous run are
+restored). A bare interpreter start is reported as the floor.
+
+Run `python -m compileall src` first when PYTHONDONTWRITEBYTECODE is set, or
+every launch also pays for compiling the modules.
+
+Usage (from the repository root):
+    python benchmarks/bench_startup.py --tasks 100000 --runs 10
+"""
+import argparse
+import glob
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC_DIR)
+
+from config import EXIT_OPTION  # noqa: E402
+from storage.journal import JournalStorage  # noqa: E402
+from task_manager import TaskManager  # noqa: E402
+
+
+MAIN = os.path.join(SRC_DIR, "main.py")
+MENU_PROMPT = b"Select an option"
+
+SCENARIOS = {
+    "menu": None,  # Interactive: timed until the first menu prompt
+    "count": ["count"],
+    "list --status pending": ["list", "--status", "pending", "--limit", "20"],
+    "search": ["search", "milk"],
+}
+
+
+def populate(directory, tasks):
+    """Write tasks into a journal data directory, compacted into a snapshot."""
+    storage = JournalStorage(directory)
+    manager = TaskManager(storage)
+    manager.add_tasks((f"Task {i} buy milk", f"Description of task {i}") for i in range(tasks))
+    manager.set_completed(range(1, tasks + 1, 3), True)
+    storage.compact(manager.get_all_tasks(), tasks + 1)
+    manager.close()
+
+
+def time_menu(env):
+    """Seconds from spawning the interactive app until it prompts for a menu choice."""
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, MAIN], stdin=subprocess.PIPE,
+                               stdout=subprocess.PIPE, env=env)
+    output = b""
+    while MENU_PROMPT not in output:
+        chunk = os.read(process.stdout.fileno(), 65536)
+        if not chunk:
+            raise RuntimeError("main.py exited before showing the menu")
+        output += chunk
+    elapsed = time.perf_counter() - start
+    process.communicate(f"{EXIT_OPTION}\n".encode())
+    return elapsed
+
+
+def time_command(arguments, env):
+    """Seconds for one complete one-shot command."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, MAIN, *arguments], env=env, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def measure(arguments, env, directory, runs, warm):
+    """Best and median seconds over runs; cold runs delete the index images first."""
+    samples = []
+    for _ in range(runs):
+        if not warm:
+            for path in glob.glob(os.path.join(directory, "*.image")):
+                os.remove(path)
+        samples.append(time_menu(env) if arguments is None else time_command(arguments, env))
+    samples.sort()
+    return samples[0], samples[len(samples) // 2]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="main.py startup benchmark")
+    parser.add_argument("--tasks", type=int, default=100_000, help="Tasks in the data directory")
+    parser.add_argument("--runs", type=int, default=10, help="Process launches per scenario")
+    args = parser.parse_args(argv)
+
+    directory = tempfile.mkdtemp(prefix="todo-startup-")
+    try:
+        populate(directory, args.tasks)
+        env = dict(os.environ, TODO_DATA_DIR=directory, TODO_STORAGE_BACKEND="journal")
+        env.pop("TODO_METRICS", None)
+        env.pop("TODO_SHARDS", None)
+
+        floor = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-c", "pass"], check=True)
+            floor.append(time.perf_counter() - start)
+        print(f"{args.tasks:,} tasks, {args.runs} runs; best / median in ms")
+        print(f"{'python -c pass':<28} {min(floor) * 1000:>8.1f} {sorted(floor)[len(floor) // 2] * 1000:>8.1f}")
+
+        for name, arguments in SCENARIOS.items():
+            if arguments is None:
+                best, median = measure(arguments, env, directory, args.runs, True)
+                print(f"{name:<28} {best * 1000:>8.1f} {median * 1000:>8.1f}")
+                continue
+            for state, warm in (("cold", False), ("warm", True)):
+                if warm:
+                    time_command(arguments, env)  # Leaves the images the warm runs restore
+                best, median = measure(arguments, env, directory, args.runs, warm)
+                print(f"{name + ' (' + state + ')':<28} {best * 1000:>8.1f} {median * 1000:>8.1f}")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Benchmark for tag queries.
+
+Lists the pending tasks matching a few tag queries through the tag index,
+against scanning every task with a predicate, on lists of increasing size
+where tasks carry two or three tags out of a fixed vocabulary. Also reports
+how long update_task() takes to retag a task with the index in place.
+
+Usage (from the repository root):
+    python benchmarks/bench_tags.py --sizes 10000,100000,1000000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from task_manager import TaskManager  # noqa: E402
+
+
+# Tags with very different frequencies, so queries have small and large terms
+VOCABULARY = ["work", "home", "errands", "reading", "health"] + [f"project:p{i}" for i in range(200)]
+WEIGHTS = [200, 150, 80, 40, 20] + [1] * 200
+
+# (query, equivalent predicate on a task's tags)
+QUERIES = [
+    ("project:p7 and work", lambda tags: "project:p7" in tags and "work" in tags),
+    ("project:p7 and not home", lambda tags: "project:p7" in tags and "home" not in tags),
+    ("(project:p1 or project:p2) health", lambda tags: ("project:p1" in tags or "project:p2" in tags)
+     and "health" in tags),
+    ("work and home", lambda tags: "work" in tags and "home" in tags),
+]
+
+
+def build_manager(size, rng):
+    """Create an in-memory manager holding size tagged tasks, a third of them completed."""
+    manager = TaskManager()
+    manager.add_tasks(
+        (f"Task {i}", "", i % 3 == 0, None, None, rng.choices(VOCABULARY, WEIGHTS, k=rng.randint(2, 3)))
+        for i in range(size)
+    )
+    return manager
+
+
+def best_ms(call, repeat):
+    """Fastest of repeat calls, in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tag query benchmark")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated task counts")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    print(f"{'tasks':>10} {'query':<36} {'matches':>8} {'index ms':>10} {'scan ms':>10}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        manager = build_manager(size, rng)
+        start = time.perf_counter()
+        manager.tag_counts()
+        print(f"{size:>10,} {'(build the index)':<36} {'':>8} {(time.perf_counter() - start) * 1000:>10.1f}")
+
+        for query, matches in QUERIES:
+            found = list(manager.iter_tasks(completed=False, tags=query))
+            indexed = best_ms(lambda: list(manager.iter_tasks(completed=False, tags=query)), args.repeat)
+            scanned = best_ms(lambda: list(manager.iter_tasks(
+                completed=False, predicate=lambda task: matches(task.tags))), args.repeat)
+            print(f"{size:>10,} {query:<36} {len(found):>8,} {indexed:>10.3f} {scanned:>10.1f}")
+
+        start = time.perf_counter()
+        for task_id in range(1, 10_001):
+            manager.update_task(1 + task_id % size, tags=rng.choices(VOCABULARY, WEIGHTS, k=2))
+        retag = (time.perf_counter() - start) / 10_000 * 1e6
+        print(f"{size:>10,} {'update_task(tags=...) us':<36} {'':>8} {retag:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
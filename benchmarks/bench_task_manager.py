@@ -0,0 +1,213 @@
+"""
+Benchmark suite for the TaskManager hot paths.
+
+Measures add_task, get_task_by_id, update_task, toggle_task_completion,
+delete_task and get_all_tasks on lists of 1e3 to 1e6 tasks, reporting
+throughput, latency percentiles and peak memory. Results can be saved as a
+JSON baseline, and later runs compared against it to flag regressions.
+
+Usage (from the repository root):
+    python benchmarks/bench_task_manager.py --save              # record a baseline
+    python benchmarks/bench_task_manager.py --compare           # exit 1 on regressions
+    python benchmarks/bench_task_manager.py --sizes 1000,10000 --ops 2000
+
+Every operation is timed individually with perf_counter_ns, which adds
+roughly 0.1 us to each sample. Each size is run several times and the
+fastest run of each operation is kept, which filters out most scheduling
+noise. Baselines are only comparable on the same machine and Python version.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from task_manager import TaskManager  # noqa: E402
+
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Full listings copy the whole list, so they get a bounded number of samples
+LISTING_SAMPLE_BUDGET = 20_000_000  # Tasks copied per size
+
+
+def build_manager(size):
+    """Create an in-memory manager holding size tasks."""
+    manager = TaskManager()
+    manager.add_tasks((f"Task number {i}", f"Description of task {i}") for i in range(size))
+    return manager
+
+
+def time_calls(call, arguments):
+    """Call call(argument) for each argument; return per-call latencies (ns) and total seconds."""
+    clock = time.perf_counter_ns
+    latencies = []
+    append = latencies.append
+    began = clock()
+    for argument in arguments:
+        start = clock()
+        call(argument)
+        append(clock() - start)
+    return latencies, (clock() - began) / 1e9
+
+
+def summarize(latencies, seconds):
+    """Throughput and latency percentiles (in microseconds) of one measurement."""
+    latencies = sorted(latencies)
+
+    def percentile(fraction):
+        return latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] / 1000
+
+    return {
+        "samples": len(latencies),
+        "ops_per_sec": len(latencies) / seconds if seconds else float("inf"),
+        "p50_us": percentile(0.50),
+        "p95_us": percentile(0.95),
+        "p99_us": percentile(0.99),
+        "max_us": latencies[-1] / 1000,
+    }
+
+
+def bench_size(size, ops, seed):
+    """Run every timed benchmark on a list of the given size."""
+    rng = random.Random(seed)
+    manager = build_manager(size)
+    results = {}
+
+    ids = [rng.randint(1, size) for _ in range(ops)]
+    results["get_task_by_id"] = summarize(*time_calls(manager.get_task_by_id, ids))
+    results["update_task"] = summarize(*time_calls(
+        lambda task_id: manager.update_task(task_id, f"Updated title {task_id}"), ids))
+    results["toggle_task_completion"] = summarize(*time_calls(manager.toggle_task_completion, ids))
+
+    listing_samples = max(3, min(ops, LISTING_SAMPLE_BUDGET // size))
+    results["get_all_tasks"] = summarize(*time_calls(
+        lambda _: manager.get_all_tasks(), range(listing_samples)))
+
+    doomed = rng.sample(range(1, size + 1), min(ops, size))
+    results["delete_task"] = summarize(*time_calls(manager.delete_task, doomed))
+    results["add_task"] = summarize(*time_calls(
+        lambda i: manager.add_task(f"New task {i}", "Added during the benchmark"), range(ops)))
+    return results
+
+
+def measure_memory(size):
+    """Peak traced memory (bytes) of building a list of the given size and listing it once."""
+    tracemalloc.start()
+    try:
+        manager = build_manager(size)
+        manager.get_all_tasks()
+        return {"peak_bytes": tracemalloc.get_traced_memory()[1]}
+    finally:
+        tracemalloc.stop()
+
+
+def best_of(size, ops, seed, repeat):
+    """Run bench_size repeat times and keep each operation's fastest run."""
+    best = {}
+    for attempt in range(repeat):
+        for name, summary in bench_size(size, ops, seed + attempt).items():
+            if name not in best or summary["ops_per_sec"] > best[name]["ops_per_sec"]:
+                best[name] = summary
+    return best
+
+
+def run(sizes, ops, seed, repeat, memory):
+    """Run the suite; results are keyed "operation@size"."""
+    results = {}
+    for size in sizes:
+        for name, summary in best_of(size, ops, seed, repeat).items():
+            results[f"{name}@{size}"] = summary
+            print(f"{name + '@' + str(size):<32} {summary['ops_per_sec']:>14,.0f} ops/s"
+                  f"   p50 {summary['p50_us']:>9.2f} us   p95 {summary['p95_us']:>9.2f} us"
+                  f"   p99 {summary['p99_us']:>9.2f} us")
+        if memory:
+            results[f"memory@{size}"] = measure_memory(size)
+            peak = results[f"memory@{size}"]["peak_bytes"]
+            print(f"{'memory@' + str(size):<32} peak {peak / 2**20:,.1f} MiB ({peak / size:,.0f} bytes/task)")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    List the measurements that regressed beyond threshold against a baseline.
+
+    Throughput must not drop, and p50 latency and peak memory must not grow,
+    by more than the threshold fraction. Tail percentiles are reported but
+    not judged, because they are too noisy on shared machines.
+    """
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        if "peak_bytes" in current:
+            checks = [("peak_bytes", current["peak_bytes"] / previous["peak_bytes"] - 1)]
+        else:
+            checks = [
+                ("ops_per_sec", 1 - current["ops_per_sec"] / previous["ops_per_sec"]),
+                ("p50_us", current["p50_us"] / previous["p50_us"] - 1 if previous["p50_us"] else 0),
+            ]
+        for metric, change in checks:
+            if change > threshold:
+                regressions.append(f"{key} {metric}: {previous[metric]:,.2f} -> {current[metric]:,.2f} "
+                                   f"({change:+.0%} worse)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="TaskManager benchmark suite")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated task counts to benchmark")
+    parser.add_argument("--ops", type=int, default=20_000,
+                        help="Timed calls per operation and size (deletes are capped at the size)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per size; the fastest run of each operation is kept")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the peak memory measurement")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--save", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--compare", action="store_true", help="Compare against the baseline")
+    parser.add_argument("--threshold", type=float, default=0.20,
+                        help="Allowed fractional slowdown before a result counts as a regression")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = run(sizes, args.ops, args.seed, args.repeat, not args.no_memory)
+
+    status = 0
+    if args.compare:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline["results"], args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  {line}")
+            status = 1
+        else:
+            print(f"\nNo regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+    if args.save:
+        document = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "ops": args.ops,
+            "repeat": args.repeat,
+            "results": results,
+        }
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2)
+        print(f"\nBaseline written to {args.baseline}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Benchmark for point-in-time views.
+
+Takes a frozen copy of the task list, once by copying every task (the only
+way to get one from get_all_tasks(), whose tasks later changes update in
+place) and once with view(). Then times toggles with and without an open
+view, and reading the whole view back.
+
+Finally checks that exporting a snapshot-backed list through its view keeps
+peak memory flat: the view reads a bounded chunk of tasks at a time, so the
+peak must not grow with the number of tasks. Exits with status 1 if it does.
+
+Usage (from the repository root):
+    python benchmarks/bench_views.py --sizes 10000,100000,1000000 --changes 10000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from task_manager import TaskManager  # noqa: E402
+from utils.import_export import export_tasks  # noqa: E402
+
+# Allowed growth of the export peak from the smallest to the largest list
+EXPORT_PEAK_SLACK_KB = 1024
+
+
+def toggle_us(manager, count, size):
+    """Average time of count toggles spread over the list, in microseconds."""
+    step = max(1, size // count)
+    start = time.perf_counter()
+    for i in range(count):
+        manager.toggle_task_completion(1 + (i * step) % size)
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def export_peak_kb(manager):
+    """Peak memory traced while exporting every task as JSONL, in KiB."""
+    with open(os.devnull, "w", encoding="utf-8") as out:
+        tracemalloc.start()
+        try:
+            export_tasks(manager, out)
+            return tracemalloc.get_traced_memory()[1] / 1024
+        finally:
+            tracemalloc.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Point-in-time view benchmark")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated task counts")
+    parser.add_argument("--changes", type=int, default=10_000, help="Toggles timed per measurement")
+    args = parser.parse_args(argv)
+
+    print(f"{'tasks':>10} {'copy ms':>10} {'view() us':>10} {'toggle us':>10} "
+          f"{'in view us':>11} {'read view ms':>13}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        manager = TaskManager()
+        manager.add_tasks((f"Task {i}", "", False, None, i % 5 + 1) for i in range(size))
+
+        start = time.perf_counter()
+        [task.copy() for task in manager.get_all_tasks()]
+        copy_ms = (time.perf_counter() - start) * 1000
+
+        plain = toggle_us(manager, args.changes, size)
+
+        view_us = float("inf")
+        for _ in range(5):
+            start = time.perf_counter()
+            view = manager.view()
+            view_us = min(view_us, (time.perf_counter() - start) * 1e6)
+            view.close()
+        view = manager.view()
+        in_view = toggle_us(manager, args.changes, size)
+
+        start = time.perf_counter()
+        count = sum(1 for _ in view)
+        read_ms = (time.perf_counter() - start) * 1000
+        assert count == size
+        view.close()
+
+        print(f"{size:>10,} {copy_ms:>10.1f} {view_us:>10.1f} {plain:>10.2f} {in_view:>11.2f} {read_ms:>13.1f}")
+
+    print(f"\n{'tasks':>10} {'export peak KiB':>16}")
+    peaks = []
+    with tempfile.TemporaryDirectory() as directory:
+        for size in (int(value) for value in args.sizes.split(",")):
+            path = os.path.join(directory, f"{size}.snapshot")
+            writer = TaskManager()
+            writer.add_tasks((f"Task {i}", "Some description", i % 3 == 0, None, i % 5 + 1) for i in range(size))
+            writer.save_snapshot(path)
+            del writer
+            manager = TaskManager.open_snapshot(path)
+            peaks.append(export_peak_kb(manager))
+            manager.close()
+            print(f"{size:>10,} {peaks[-1]:>16.0f}")
+
+    if peaks[-1] > peaks[0] + EXPORT_PEAK_SLACK_KB:
+        print(f"Export peak grew from {peaks[0]:.0f} KiB to {peaks[-1]:.0f} KiB")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
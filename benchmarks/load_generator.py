@@ -0,0 +1,115 @@
+"""
+Load generator for the Console Todo App socket server.
+
+Opens many connections, pipelines small requests on each (a fixed window of
+unanswered requests per connection), and reports throughput and latency
+percentiles.
+
+Usage (from the repository root):
+    python src/main.py --storage memory serve --port 8765 &
+    python benchmarks/load_generator.py --connect 127.0.0.1:8765 --connections 50 --requests 2000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from client import parse_address  # noqa: E402
+
+
+def percentile(sorted_values, fraction):
+    """Return the value at the given fraction of a sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def make_request(rng, number, known_ids, add_share, get_share):
+    """Build one random add, get or toggle request."""
+    roll = rng.random()
+    if roll < add_share or not known_ids:
+        return {"req": number, "op": "add", "title": f"load task {number}"}
+    task_id = rng.choice(known_ids)
+    if roll < add_share + get_share:
+        return {"req": number, "op": "get", "id": task_id}
+    return {"req": number, "op": "toggle", "ids": [task_id]}
+
+
+async def run_connection(address, requests, window, seed, shares, latencies, errors):
+    """Drive one pipelined connection and record per-request latency."""
+    kind, target = parse_address(address)
+    if kind == "unix":
+        reader, writer = await asyncio.open_unix_connection(target)
+    else:
+        reader, writer = await asyncio.open_connection(*target)
+
+    rng = random.Random(seed)
+    known_ids = []
+    sent_at = {}
+    slots = asyncio.Semaphore(window)
+
+    async def receive():
+        for _ in range(requests):
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - sent_at.pop(response["req"]))
+            slots.release()
+            if not response["ok"]:
+                errors.append(response.get("error"))
+            elif isinstance(response["result"].get("id"), int):
+                known_ids.append(response["result"]["id"])
+
+    receiver = asyncio.create_task(receive())
+    for number in range(requests):
+        await slots.acquire()
+        sent_at[number] = time.perf_counter()
+        writer.write((json.dumps(make_request(rng, number, known_ids, *shares)) + "\n").encode("utf-8"))
+        await writer.drain()
+    await receiver
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run(args):
+    """Run every connection concurrently and print a summary."""
+    latencies = []
+    errors = []
+    shares = (args.add_share, args.get_share)
+    began = time.perf_counter()
+    await asyncio.gather(*(
+        run_connection(args.connect, args.requests, args.window, seed, shares, latencies, errors)
+        for seed in range(args.connections)
+    ))
+    elapsed = time.perf_counter() - began
+
+    latencies.sort()
+    total = len(latencies)
+    print(f"{args.connections} connections x {args.requests} requests (window {args.window}): "
+          f"{total} requests in {elapsed:.2f}s = {total / elapsed:,.0f} req/s")
+    print("latency ms: " + ", ".join(
+        f"p{int(fraction * 100)}={percentile(latencies, fraction) * 1000:.2f}"
+        for fraction in (0.5, 0.9, 0.99)
+    ) + f", max={latencies[-1] * 1000:.2f}" if latencies else "no responses")
+    if errors:
+        print(f"{len(errors)} error response(s), e.g. {errors[0]}")
+    return 1 if errors else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load generator for the task socket server")
+    parser.add_argument("--connect", default="127.0.0.1:8765", help="HOST:PORT or unix:PATH")
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per connection")
+    parser.add_argument("--window", type=int, default=32, help="Unanswered requests allowed per connection")
+    parser.add_argument("--add-share", type=float, default=0.3, help="Fraction of requests that add tasks")
+    parser.add_argument("--get-share", type=float, default=0.5, help="Fraction of requests that read a task")
+    return asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Concurrency stress test for ThreadSafeTaskManager.
+
+Runs many threads against add_task, toggle_task_completion and get_all_tasks
+at once, then checks that IDs are unique and contiguous, that every task's
+final completion status matches the number of toggles it received, and that
+every listing a reader saw was internally consistent.
+
+Usage (from the repository root):
+    python benchmarks/stress_thread_safety.py --threads 16 --ops 5000
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from thread_safe_task_manager import ThreadSafeTaskManager  # noqa: E402
+
+
+def worker(manager, ops, seed, added, toggles, problems, start):
+    """Mix adds, toggles and full listings; record what this thread did."""
+    rng = random.Random(seed)
+    start.wait()
+    for _ in range(ops):
+        roll = rng.random()
+        if roll < 0.4:
+            added.append(manager.add_task(f"task from {seed}"))
+        elif roll < 0.8:
+            upper = manager.get_next_id() - 1
+            if upper >= 1:
+                task_id = rng.randint(1, upper)
+                if manager.toggle_task_completion(task_id):
+                    toggles[task_id] += 1
+        else:
+            ids = [task.id for task in manager.get_all_tasks()]
+            if len(ids) != len(set(ids)):
+                problems.append("duplicate IDs in a listing")
+            if ids != sorted(ids):
+                problems.append("listing out of insertion order")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--ops", type=int, default=5000, help="Operations per thread")
+    parser.add_argument("--prefill", type=int, default=1000, help="Tasks added before the threads start")
+    args = parser.parse_args(argv)
+
+    manager = ThreadSafeTaskManager()
+    manager.add_tasks((f"prefill {i}", "") for i in range(args.prefill))
+
+    start = threading.Barrier(args.threads)
+    added = [[] for _ in range(args.threads)]
+    toggles = [Counter() for _ in range(args.threads)]
+    problems = []
+    threads = [
+        threading.Thread(target=worker, args=(manager, args.ops, seed, added[seed], toggles[seed], problems, start))
+        for seed in range(args.threads)
+    ]
+
+    began = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - began
+
+    all_added = [task_id for ids in added for task_id in ids]
+    expected_total = args.prefill + len(all_added)
+    if len(all_added) != len(set(all_added)):
+        problems.append("add_task handed out duplicate IDs")
+    if manager.count_tasks() != expected_total:
+        problems.append(f"expected {expected_total} tasks, found {manager.count_tasks()}")
+    if manager.get_next_id() != expected_total + 1:
+        problems.append(f"next ID is {manager.get_next_id()}, expected {expected_total + 1}")
+    if [task.id for task in manager.get_all_tasks()] != list(range(1, expected_total + 1)):
+        problems.append("task IDs are not contiguous")
+
+    toggle_totals = sum(toggles, Counter())
+    for task in manager.iter_tasks():
+        if task.completed != bool(toggle_totals[task.id] % 2):
+            problems.append(f"task {task.id} completion does not match its {toggle_totals[task.id]} toggles")
+            break
+
+    total_ops = args.threads * args.ops
+    print(f"{args.threads} threads x {args.ops} ops = {total_ops} ops in {elapsed:.2f}s "
+          f"({total_ops / elapsed:,.0f} ops/s); {expected_total} tasks at the end")
+    if problems:
+        for problem in sorted(set(problems)):
+            print(f"FAIL: {problem}")
+        return 1
+    print("OK: no duplicate IDs, lost updates or inconsistent listings")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,427 @@
+"""
+Change feed for the Console Todo App.
+Publishes every task change as a sequence-numbered event that consumers read incrementally.
+"""
+import threading
+from collections import deque
+from typing import Callable, Dict, Iterable, List, MutableMapping, Optional
+from config import CHANGE_FEED_RETENTION
+from history import CHANGE_COMPLETED, CHANGE_DELETE, CHANGE_INSERT, CHANGE_UPDATE
+from models.task import Task
+
+
+# Event kinds
+EVENT_ADD = "add"
+EVENT_UPDATE = "update"
+EVENT_DELETE = "delete"
+EVENT_TOGGLE = "toggle"
+
+
+class ChangeFeedGap(Exception):
+    """
+    Raised when a consumer asks for events the feed no longer holds.
+
+    This happens when a subscriber fell more than its limit behind, or resumes
+    from a sequence number that is too old or from another session. The
+    consumer has to reload the full task list and resume from last_seq.
+
+    Attributes:
+        last_seq (int): The feed's latest sequence number when the gap was found
+    """
+
+    def __init__(self, message: str, last_seq: int):
+        super().__init__(message)
+        self.last_seq = last_seq
+
+
+class ChangeEvent:
+    """
+    One task change, as delivered to feed consumers.
+
+    Attributes:
+        seq (int): Sequence number; consecutive and increasing within a feed
+        kind (str): "add", "update", "delete" or "toggle"
+        task_id (int): The changed task
+        fields (dict): The task's new values: every field for "add", title,
+            description, due, priority and tags for "update", completed for
+            "toggle", and nothing for "delete"
+
+    Values are absolute, so applying an event a consumer has already seen
+    (e.g. one that was also reflected in a full listing) does no harm.
+    """
+    __slots__ = ("seq", "kind", "task_id", "fields")
+
+    def __init__(self, seq: int, kind: str, task_id: int, fields: Dict[str, object]):
+        self.seq = seq
+        self.kind = kind
+        self.task_id = task_id
+        self.fields = fields
+
+    @classmethod
+    def from_change(cls, seq: int, change: tuple) -> "ChangeEvent":
+        """
+        Build the event for one recorded change (see history.py).
+
+        Args:
+            seq (int): The change's sequence number
+            change (tuple): The change tuple
+
+        Returns:
+            ChangeEvent: The event
+        """
+        kind, task_id = change[0], change[1]
+        if kind == CHANGE_INSERT:
+            _, _, title, description, completed, due, priority, tags = change
+            return cls(seq, EVENT_ADD, task_id, {"title": title, "description": description,
+                                                 "completed": completed, "due": due, "priority": priority,
+                                                 "tags": tags})
+        if kind == CHANGE_UPDATE:
+            title, description, due, priority, tags = change[7:12]
+            return cls(seq, EVENT_UPDATE, task_id, {"title": title, "description": description,
+                                                    "due": due, "priority": priority, "tags": tags})
+        if kind == CHANGE_COMPLETED:
+            return cls(seq, EVENT_TOGGLE, task_id, {"completed": change[2]})
+        if kind == CHANGE_DELETE:
+            return cls(seq, EVENT_DELETE, task_id, {})
+        raise ValueError(f"Unknown change kind: {kind!r}")
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ChangeEvent":
+        """
+        Rebuild an event serialized by to_dict().
+
+        Args:
+            data (dict): The serialized event
+
+        Returns:
+            ChangeEvent: The event
+        """
+        fields = {name: value for name, value in data.items() if name not in ("seq", "kind", "id")}
+        if "tags" in fields:
+            fields["tags"] = tuple(fields["tags"])  # JSON has no tuples
+        return cls(data["seq"], data["kind"], data["id"], fields)
+
+    def apply(self, tasks: MutableMapping[int, Task]) -> None:
+        """
+        Apply the event to a consumer's ID-keyed copy of the tasks.
+
+        Args:
+            tasks (MutableMapping[int, Task]): The copy to bring up to date
+        """
+        if self.kind == EVENT_ADD:
+            tasks[self.task_id] = Task.trusted(self.task_id, **self.fields)
+        elif self.kind == EVENT_DELETE:
+            tasks.pop(self.task_id, None)
+        else:
+            task = tasks.get(self.task_id)
+            if task is not None:
+                for name, value in self.fields.items():
+                    setattr(task, name, value)
+
+    def to_dict(self) -> dict:
+        """Serialize the event, e.g. {"seq": 8, "kind": "toggle", "id": 3, "completed": true}."""
+        data = {"seq": self.seq, "kind": self.kind, "id": self.task_id, **self.fields}
+        if "tags" in data:
+            data["tags"] = list(data["tags"])
+        return data
+
+    def __repr__(self):
+        """Return a constructor-style representation of the event."""
+        return f"ChangeEvent(seq={self.seq!r}, kind={self.kind!r}, task_id={self.task_id!r}, fields={self.fields!r})"
+
+
+class ChangeFeed:
+    """
+    Sequence-numbered log of the most recent task changes.
+
+    TaskManager publishes every change it records, including those made by
+    undo and redo. The feed keeps the last `retention` changes in a ring
+    buffer, as the same change tuples the undo history holds, so publishing
+    is O(1) and never waits for consumers; events are only built when read.
+
+    Consumers track their own position: a Subscription is just a cursor into
+    the ring, so a slow subscriber costs writers nothing. One that falls
+    further behind than the ring (or its own limit) gets ChangeFeedGap and
+    must resynchronize.
+    """
+
+    def __init__(self, retention: int = CHANGE_FEED_RETENTION):
+        """
+        Initialize an empty feed.
+
+        Args:
+            retention (int): Number of recent changes kept for consumers to catch up
+        """
+        if retention <= 0:
+            raise ValueError("Change feed retention must be positive")
+        self.retention = retention
+        self.last_seq = 0
+        self._ring: List[Optional[tuple]] = [None] * retention
+        self._changed = threading.Condition(threading.Lock())
+        self._waiting = 0  # Consumers blocked on _changed
+        self._async_waiters: list = []
+        self._closed = False
+
+    def publish(self, change: tuple) -> int:
+        """
+        Append a change and wake waiting consumers.
+
+        Args:
+            change (tuple): The recorded change (see history.py)
+
+        Returns:
+            int: The change's sequence number
+        """
+        return self.publish_many((change,))
+
+    def publish_many(self, changes: Iterable[tuple]) -> int:
+        """
+        Append several changes at once, e.g. those of one bulk operation.
+
+        Consumers see either none or all of them.
+
+        Args:
+            changes (Iterable[tuple]): The recorded changes, in order
+
+        Returns:
+            int: The sequence number of the last change
+        """
+        with self._changed:
+            ring, retention, seq = self._ring, self.retention, self.last_seq
+            for change in changes:
+                seq += 1
+                ring[seq % retention] = change
+            self.last_seq = seq
+            self._wake()
+            return seq
+
+    def _wake(self) -> None:
+        """Wake blocked and async consumers (called with the lock held)."""
+        if self._waiting:
+            self._changed.notify_all()
+        if self._async_waiters:
+            waiters, self._async_waiters = self._async_waiters, []
+            for loop, future in waiters:
+                try:
+                    loop.call_soon_threadsafe(_resolve, future)
+                except RuntimeError:
+                    pass  # The consumer's event loop is closed
+
+    def skip(self, count: int) -> None:
+        """
+        Account for changes that happened but cannot be published.
+
+        Every consumer positioned before the skipped changes gets ChangeFeedGap
+        on its next read; new subscribers start after them.
+
+        Args:
+            count (int): Number of missed changes
+        """
+        with self._changed:
+            # Skipping a whole ring's worth keeps stale entries from being read as new ones
+            self.last_seq += max(count, self.retention + 1)
+            self._wake()
+
+    def read_changes(self, after: int, limit: Optional[int] = None,
+                     max_lag: Optional[int] = None) -> List[tuple]:
+        """
+        Return the raw change tuples following a sequence number, oldest first.
+
+        Args:
+            after (int): Sequence number of the last change the consumer has seen (0 for none)
+            limit (int, optional): Maximum number of changes (all available if None)
+            max_lag (int, optional): Raise ChangeFeedGap if more than this many changes are pending
+
+        Returns:
+            List[tuple]: The changes (see history.py); the first has sequence number after + 1
+        """
+        with self._changed:
+            last_seq = self.last_seq
+            if after > last_seq or after < 0:
+                raise ChangeFeedGap(f"Sequence number {after} is not from this change feed", last_seq)
+            pending = last_seq - after
+            if pending > self.retention or (max_lag is not None and pending > max_lag):
+                raise ChangeFeedGap(f"{pending} changes were missed; reload the task list", last_seq)
+            stop = last_seq if limit is None else min(last_seq, after + limit)
+            return [self._ring[seq % self.retention] for seq in range(after + 1, stop + 1)]
+
+    def read(self, after: int, limit: Optional[int] = None, max_lag: Optional[int] = None) -> List[ChangeEvent]:
+        """
+        Return the events following a sequence number, oldest first.
+
+        Args:
+            after (int): Sequence number of the last event the consumer has seen (0 for none)
+            limit (int, optional): Maximum number of events (all available if None)
+            max_lag (int, optional): Raise ChangeFeedGap if more than this many events are pending
+
+        Returns:
+            List[ChangeEvent]: The events, possibly none
+        """
+        changes = self.read_changes(after, limit, max_lag)
+        return [ChangeEvent.from_change(seq, change) for seq, change in enumerate(changes, start=after + 1)]
+
+    def _add_async_waiter(self, after: int, loop, future) -> bool:
+        """Register a future to complete on the next change; returns False if one is already there."""
+        with self._changed:
+            if self.last_seq > after or self._closed:
+                return False
+            self._async_waiters.append((loop, future))
+            return True
+
+    def subscribe(self, since: Optional[int] = None, callback: Optional[Callable[[ChangeEvent], None]] = None,
+                  max_lag: Optional[int] = None) -> "Subscription":
+        """
+        Start consuming events; see TaskManager.subscribe().
+
+        Args:
+            since (int, optional): Resume after this sequence number (from now if None)
+            callback (callable, optional): Called with every event from a background thread
+            max_lag (int, optional): Pending events allowed before the subscription gaps
+
+        Returns:
+            Subscription: The new subscription
+        """
+        with self._changed:
+            start = self.last_seq if since is None else since
+        subscription = Subscription(self, start, max_lag)
+        if callback is not None:
+            subscription._start_callback_thread(callback)
+        return subscription
+
+    def close(self) -> None:
+        """Wake every waiting consumer; subscriptions end once they have read what is left."""
+        with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+            self._wake()
+
+
+def _resolve(future) -> None:
+    """Complete a wake-up future unless it was cancelled."""
+    if not future.done():
+        future.set_result(None)
+
+
+class Subscription:
+    """
+    One consumer's position in a ChangeFeed.
+
+    Events can be taken one at a time like from a bounded queue (get(),
+    get_nowait()), in chunks (poll()), by iterating (blocking) or with
+    `async for` in an asyncio program. The backlog is bounded by max_lag
+    (and the feed's retention): a consumer that falls further behind gets
+    ChangeFeedGap instead of holding up writers. seq is the sequence number
+    of the last event handed out, to resume from later.
+    """
+
+    def __init__(self, feed: ChangeFeed, since: int, max_lag: Optional[int] = None):
+        """
+        Args:
+            feed (ChangeFeed): The feed to read
+            since (int): Sequence number of the last event already seen
+            max_lag (int, optional): Pending events allowed before reads raise ChangeFeedGap
+        """
+        self.feed = feed
+        self.seq = since
+        self.max_lag = max_lag
+        self.error: Optional[Exception] = None  # Why a callback subscription stopped, if it did
+        self._buffer: deque = deque()  # Events read from the feed but not handed out yet
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    def poll(self, limit: Optional[int] = None) -> List[ChangeEvent]:
+        """
+        Take every pending event (up to limit) without waiting.
+
+        Returns:
+            List[ChangeEvent]: The events, oldest first; empty if there are none
+        """
+        if self._buffer:
+            count = len(self._buffer) if limit is None else min(limit, len(self._buffer))
+            events = [self._buffer.popleft() for _ in range(count)]
+        else:
+            events = self.feed.read(self.seq, limit, self.max_lag)
+        if events:
+            self.seq = events[-1].seq
+        return events
+
+    def get_nowait(self) -> Optional[ChangeEvent]:
+        """Take the next event, or return None if there is none yet."""
+        if not self._buffer:
+            self._buffer.extend(self.feed.read(self.seq, None, self.max_lag))
+            if not self._buffer:
+                return None
+        event = self._buffer.popleft()
+        self.seq = event.seq
+        return event
+
+    def get(self, timeout: Optional[float] = None) -> Optional[ChangeEvent]:
+        """
+        Take the next event, waiting for one if necessary.
+
+        Args:
+            timeout (float, optional): Seconds to wait at most (forever if None)
+
+        Returns:
+            Optional[ChangeEvent]: The event, or None on timeout or once closed
+        """
+        event = self.get_nowait()
+        if event is None and not self._closed:
+            feed = self.feed
+            with feed._changed:
+                feed._waiting += 1
+                try:
+                    feed._changed.wait_for(lambda: feed.last_seq > self.seq or feed._closed or self._closed,
+                                           timeout)
+                finally:
+                    feed._waiting -= 1
+            event = self.get_nowait()
+        return event
+
+    def __iter__(self):
+        """Yield events as they arrive until the subscription or the feed is closed."""
+        while not self._closed:
+            event = self.get()
+            if event is None:
+                if self.feed._closed:
+                    return
+                continue
+            yield event
+
+    def __aiter__(self):
+        """Return the subscription itself for `async for`."""
+        return self
+
+    async def __anext__(self) -> ChangeEvent:
+        """Wait for the next event without blocking the event loop."""
+        import asyncio
+        loop = asyncio.get_running_loop()
+        while True:
+            event = self.get_nowait()
+            if event is not None:
+                return event
+            if self._closed or self.feed._closed:
+                raise StopAsyncIteration
+            future = loop.create_future()
+            if self.feed._add_async_waiter(self.seq, loop, future):
+                await future
+
+    def _start_callback_thread(self, callback: Callable[[ChangeEvent], None]) -> None:
+        """Deliver events to callback from a daemon thread, so a slow callback never blocks writers."""
+        def deliver():
+            try:
+                for event in self:
+                    callback(event)
+            except Exception as e:  # Recorded for the owner; the writers carry on
+                self.error = e
+
+        self._thread = threading.Thread(target=deliver, name="change-feed-callback", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the subscription (and its callback thread, after the event it is handling)."""
+        self._closed = True
+        with self.feed._changed:
+            self.feed._changed.notify_all()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
@@ -0,0 +1,617 @@
+"""
+Non-interactive command-line interface for the Console Todo App.
+Runs single commands (add, list, next, overdue, update, delete, toggle,
+search, stats, tags), a batch of
+commands read from stdin, or a streaming import/export, sharing one TaskManager
+for the whole run.
+"""
+import argparse
+import json
+import shlex
+import sys
+from typing import List, Optional
+from contextlib import nullcontext
+from change_feed import ChangeFeedGap
+from config import CHANGE_FEED_PAGE_SIZE, PAGE_SIZE, SEARCH_RESULT_LIMIT, METRICS_ENABLED, METRICS_FILE
+from models.task import UNCHANGED, format_schedule, format_tags
+from task_manager import SORT_ORDERS, TaskManager, create_task_manager
+from utils.validation import parse_id_ranges
+
+
+# "status" values accepted by list commands, mapped to TaskManager's completed filter
+STATUS_FILTERS = {"all": None, "pending": False, "completed": True}
+
+
+class CommandError(Exception):
+    """
+    Raised when a command is malformed or cannot be carried out.
+
+    Attributes:
+        code (str): "invalid" for bad input, "not_found" for unknown task IDs,
+            "gap" for change-feed positions no longer retained
+    """
+
+    def __init__(self, message: str, code: str = "invalid"):
+        super().__init__(message)
+        self.code = code
+
+
+def _not_found(task_id) -> CommandError:
+    """Build the error for a task ID that does not exist."""
+    return CommandError(f"Task with ID {task_id} does not exist", code="not_found")
+
+
+class _CommandParser(argparse.ArgumentParser):
+    """ArgumentParser that raises CommandError instead of exiting the process."""
+
+    def error(self, message):
+        raise CommandError(message)
+
+
+def _parse_ids(text: str) -> List[int]:
+    """Parse an ID list such as "3-500,712" or raise CommandError."""
+    is_valid, error_msg, task_ids = parse_id_ranges(str(text))
+    if not is_valid:
+        raise CommandError(error_msg)
+    return task_ids
+
+
+def _positive_int(text: str) -> int:
+    """Argument type for options that take a positive integer."""
+    try:
+        value = int(text)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {text!r}")
+    return value
+
+
+def _add_command_parsers(subparsers) -> None:
+    """Register the task commands shared by single-command and batch mode."""
+    add = subparsers.add_parser("add", help="Add a task")
+    add.add_argument("title")
+    add.add_argument("-d", "--description", default="")
+    add.add_argument("--due", default=None, help="Due date (YYYY-MM-DD)")
+    add.add_argument("-p", "--priority", default=None, help="Priority from 1 (most urgent) to 5")
+    add.add_argument("--tags", default=None, help="Tags separated by commas, e.g. 'work,project:website'")
+
+    listing = subparsers.add_parser("list", help="List tasks")
+    listing.add_argument("--offset", type=int, default=0)
+    listing.add_argument("--limit", type=int, default=None)
+    listing.add_argument("--status", choices=sorted(STATUS_FILTERS), default="all",
+                         help="Only pending or only completed tasks")
+    listing.add_argument("--sort", choices=SORT_ORDERS, default=None,
+                         help="Order by priority or due date instead of by ID")
+    listing.add_argument("--tags", default=None, metavar="QUERY",
+                         help="Only tasks matching a tag query, e.g. 'work and not someday'")
+
+    next_parser = subparsers.add_parser("next", help="Pending tasks to work on next, most urgent first")
+    next_parser.add_argument("--limit", type=int, default=PAGE_SIZE)
+
+    overdue = subparsers.add_parser("overdue", help="Pending tasks past their due date")
+    overdue.add_argument("--offset", type=int, default=0)
+    overdue.add_argument("--limit", type=int, default=None)
+    overdue.add_argument("--today", default=None, help="Reference date (defaults to the current date)")
+
+    count = subparsers.add_parser("count", help="Count tasks by completion status")
+    count.add_argument("--tags", default=None, metavar="QUERY", help="Only count tasks matching a tag query")
+
+    subparsers.add_parser("tags", help="Count tasks by tag")
+
+    stats = subparsers.add_parser("stats", help="Summary statistics: completion, priorities, "
+                                                "description lengths, due dates")
+    stats.add_argument("--today", default=None, help="Reference date for overdue tasks (defaults to the current date)")
+
+    update = subparsers.add_parser("update", help="Update a task's title, description, due date, priority or tags")
+    update.add_argument("id", type=int)
+    update.add_argument("-t", "--title", default=None)
+    update.add_argument("-d", "--description", default=None)
+    # Left out of the command when not given, so "none" can clear a value
+    update.add_argument("--due", default=argparse.SUPPRESS, help="New due date, or 'none' to clear it")
+    update.add_argument("-p", "--priority", default=argparse.SUPPRESS, help="New priority, or 'none' to clear it")
+    update.add_argument("--tags", default=argparse.SUPPRESS, help="New tags, or 'none' to clear them")
+
+    delete = subparsers.add_parser("delete", help="Delete tasks by ID or range, e.g. 3-500,712")
+    delete.add_argument("ids")
+
+    toggle = subparsers.add_parser("toggle", help="Toggle completion of tasks by ID or range")
+    toggle.add_argument("ids")
+
+    search = subparsers.add_parser("search", help="Full-text search")
+    search.add_argument("query")
+    search.add_argument("--limit", type=int, default=SEARCH_RESULT_LIMIT)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the top-level argument parser.
+
+    Returns:
+        argparse.ArgumentParser: Parser for `python main.py <command> ...`
+    """
+    parser = _CommandParser(prog="main.py", description="Console Todo App command mode")
+    parser.add_argument("--storage", choices=["journal", "sqlite", "memory"], default=None,
+                        help="Storage backend (defaults to config.STORAGE_BACKEND)")
+    parser.add_argument("--data-dir", default=None, help="Data directory (defaults to config.DATA_DIR)")
+    parser.add_argument("--shards", type=int, default=None,
+                        help="Spread tasks over this many worker processes (defaults to config.SHARD_COUNT)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--connect", metavar="ADDRESS", default=None,
+                        help="Use a running task server (HOST:PORT or unix:PATH) instead of local storage; "
+                             "without a command, starts the interactive menu against it")
+    parser.add_argument("--metrics", action="store_true",
+                        help="Record call counts and latencies (also enabled by TODO_METRICS=1)")
+    parser.add_argument("--metrics-file", metavar="PATH", default=METRICS_FILE,
+                        help="Write metrics here on exit (.json for JSON, otherwise Prometheus text); "
+                             "implies --metrics")
+    parser.add_argument("--profile", metavar="PREFIX", default=None,
+                        help="Profile the session with cProfile and tracemalloc and write "
+                             "PREFIX.prof, PREFIX.cpu.txt and PREFIX.memory.txt on exit")
+
+    # An explicit prog keeps argparse from building a help formatter (and
+    # importing shutil) just to derive it, which is measurable at startup
+    subparsers = parser.add_subparsers(dest="op", parser_class=_CommandParser, prog="main.py")
+    _add_command_parsers(subparsers)
+
+    batch = subparsers.add_parser("batch", help="Run newline-delimited commands from stdin")
+    batch.add_argument("--input", default="-", help="File to read commands from (default: stdin)")
+    batch.add_argument("--stop-on-error", action="store_true", help="Stop at the first failing command")
+
+    import_parser = subparsers.add_parser("import", help="Import tasks from a JSONL or CSV file")
+    import_parser.add_argument("file", help="Input file ('-' for stdin)")
+    import_parser.add_argument("--format", choices=["jsonl", "csv"], default=None,
+                               help="File format (guessed from the extension if omitted)")
+    import_parser.add_argument("--chunk-size", type=_positive_int, default=10_000, help="Records committed per chunk")
+    import_parser.add_argument("--workers", type=_positive_int, default=1, help="Parallel JSONL parser processes")
+    import_parser.add_argument("--skip-invalid", action="store_true", help="Skip invalid records instead of stopping")
+
+    export_parser = subparsers.add_parser("export", help="Export all tasks to a JSONL or CSV file")
+    export_parser.add_argument("file", help="Output file ('-' for stdout)")
+    export_parser.add_argument("--format", choices=["jsonl", "csv"], default=None,
+                               help="File format (guessed from the extension if omitted)")
+
+    serve = subparsers.add_parser("serve", help="Serve the task list to many clients over a socket")
+    serve.add_argument("--host", default=None, help="TCP host (defaults to config.SERVER_HOST)")
+    serve.add_argument("--port", type=int, default=None, help="TCP port (defaults to config.SERVER_PORT)")
+    serve.add_argument("--unix", metavar="PATH", default=None, help="Listen on a Unix socket instead of TCP")
+    return parser
+
+
+def _build_line_parser() -> argparse.ArgumentParser:
+    """Parser for one text command line in batch mode."""
+    parser = _CommandParser(prog="batch", add_help=False)
+    subparsers = parser.add_subparsers(dest="op", required=True, parser_class=_CommandParser, prog="batch")
+    _add_command_parsers(subparsers)
+    # Undo history lives as long as the manager, so undo and redo only make sense within one batch
+    subparsers.add_parser("undo")
+    subparsers.add_parser("redo")
+    return parser
+
+
+def _command_status(command: dict) -> Optional[bool]:
+    """Read the completion filter of a list command ("status": all/pending/completed)."""
+    status = command.get("status") or "all"
+    if status not in STATUS_FILTERS:
+        raise CommandError(f"Status must be one of: {', '.join(sorted(STATUS_FILTERS))}")
+    return STATUS_FILTERS[status]
+
+
+def execute_command(task_manager: TaskManager, command: dict) -> dict:
+    """
+    Carry out one command against a TaskManager.
+
+    Args:
+        task_manager (TaskManager): The manager to operate on
+        command (dict): The operation under "op" plus its arguments, e.g.
+            {"op": "add", "title": "Buy milk", "description": ""}
+
+    Besides the command-line operations, JSON commands may use "get" (id),
+    "add_many" (items: [[title, description, completed, due, priority, tags], ...]
+    or objects with those keys; only the title is required), "set_completed"
+    (ids, value), "undo", "redo", "metrics" (the process's metrics, when
+    enabled) and "changes" (since, limit: the change-feed events after
+    sequence number since, at most CHANGE_FEED_PAGE_SIZE, plus last_seq;
+    without since only last_seq, to start following from now).
+
+    Returns:
+        dict: A JSON-serializable result
+    """
+    op = command.get("op")
+    try:
+        if op == "add":
+            task_id = task_manager.add_task(command["title"], command.get("description") or "",
+                                            command.get("due"), command.get("priority"), command.get("tags"))
+            return {"id": task_id}
+
+        if op == "get":
+            task_id = int(command["id"])
+            task = task_manager.get_task_by_id(task_id)
+            if task is None:
+                raise _not_found(task_id)
+            return {"task": _task_data(task)}
+
+        if op == "count":
+            tags = command.get("tags")
+            return {
+                "total": task_manager.count_tasks(tags=tags),
+                "pending": task_manager.count_tasks(completed=False, tags=tags),
+                "completed": task_manager.count_tasks(completed=True, tags=tags),
+            }
+
+        if op == "tags":
+            return {"tags": task_manager.tag_counts()}
+
+        if op == "stats":
+            return task_manager.statistics(command.get("today"))
+
+        if op == "add_many":
+            items = [
+                (item["title"], item.get("description") or "", item.get("completed", False),
+                 item.get("due"), item.get("priority"), item.get("tags")) if isinstance(item, dict) else tuple(item)
+                for item in command["items"]
+            ]
+            return {"ids": task_manager.add_tasks(items)}
+
+        if op == "set_completed":
+            value = command["value"]
+            return {"changed": task_manager.set_completed(_command_ids(command), value)}
+
+        if op == "undo":
+            return {"undone": task_manager.undo()}
+
+        if op == "redo":
+            return {"redone": task_manager.redo()}
+
+        if op == "changes":
+            since = command.get("since")
+            limit = min(int(command.get("limit") or CHANGE_FEED_PAGE_SIZE), CHANGE_FEED_PAGE_SIZE)
+            try:
+                events, last_seq = task_manager.changes(None if since is None else int(since), limit)
+            except ChangeFeedGap as e:
+                raise CommandError(str(e), code="gap") from None
+            return {"events": [event.to_dict() for event in events], "last_seq": last_seq}
+
+        if op == "metrics":
+            from utils.metrics import get_registry
+            registry = get_registry()
+            if registry is None:
+                raise CommandError("Metrics are disabled; start with --metrics or TODO_METRICS=1")
+            return registry.to_dict()
+
+        if op == "list":
+            offset = command.get("offset") or 0
+            limit = command.get("limit")
+            completed = _command_status(command)
+            tags = command.get("tags")
+            tasks = [_task_data(task) for task in task_manager.iter_tasks(offset, limit, completed=completed,
+                                                                         sort=command.get("sort"), tags=tags)]
+            return {"total": task_manager.count_tasks(completed, tags), "tasks": tasks}
+
+        if op == "next":
+            limit = command.get("limit")
+            tasks = task_manager.next_tasks(PAGE_SIZE if limit is None else limit)
+            return {"tasks": [_task_data(task) for task in tasks]}
+
+        if op == "overdue":
+            offset = command.get("offset") or 0
+            today = command.get("today")
+            tasks = task_manager.overdue_tasks(offset, command.get("limit"), today)
+            return {"total": task_manager.count_overdue(today), "tasks": [_task_data(task) for task in tasks]}
+
+        if op == "update":
+            task_id = int(command["id"])
+            title = command.get("title")
+            description = command.get("description")
+            # An explicit null clears the due date, priority or tags; a missing key keeps them
+            due = command.get("due", UNCHANGED)
+            priority = command.get("priority", UNCHANGED)
+            tags = command.get("tags", UNCHANGED)
+            if (title is None and description is None
+                    and due is UNCHANGED and priority is UNCHANGED and tags is UNCHANGED):
+                raise CommandError("Nothing to update: give a title, description, due date, priority or tags")
+            if not task_manager.update_task(task_id, title, description, due, priority, tags):
+                raise _not_found(task_id)
+            return {"id": task_id, "updated": True}
+
+        if op == "delete":
+            task_ids = _command_ids(command)
+            for task_id in task_ids:
+                if task_manager.get_task_by_id(task_id) is None:
+                    raise _not_found(task_id)
+            return {"deleted": task_manager.delete_tasks(task_ids)}
+
+        if op == "toggle":
+            task_ids = _command_ids(command)
+            for task_id in task_ids:
+                if task_manager.get_task_by_id(task_id) is None:
+                    raise _not_found(task_id)
+            task_manager.toggle_tasks(task_ids)
+            return {"tasks": [{"id": task_id, "completed": task_manager.get_task_by_id(task_id).completed}
+                              for task_id in dict.fromkeys(task_ids)]}
+
+        if op == "search":
+            limit = command.get("limit") or SEARCH_RESULT_LIMIT
+            return {"tasks": [_task_data(task) for task in task_manager.search(command["query"], limit)]}
+
+    except KeyError as e:
+        raise CommandError(f"Missing field for '{op}': {e.args[0]}") from None
+    except (TypeError, ValueError) as e:
+        raise CommandError(str(e)) from None
+
+    raise CommandError(f"Unknown command: {op!r}")
+
+
+def _task_data(task) -> dict:
+    """Serialize a task for a command result, with its version so clients can tell changed tasks apart."""
+    data = task.to_dict()
+    data["version"] = task.version
+    return data
+
+
+def _command_ids(command: dict) -> List[int]:
+    """Read the target IDs of a command given as "ids" (list or range text) or "id"."""
+    if "ids" in command:
+        ids = command["ids"]
+        if isinstance(ids, list):
+            return [int(task_id) for task_id in ids]
+        return _parse_ids(ids)
+    return [int(command["id"])]
+
+
+def _print_text(command: dict, result: dict) -> None:
+    """Print a command result in the app's human-readable style."""
+    op = command["op"]
+    if op == "add":
+        print(f"Task added successfully with ID: {result['id']}")
+    elif op in ("list", "search", "next", "overdue"):
+        lines = []
+        for task in result["tasks"]:
+            status = "[x]" if task["completed"] else "[ ]"
+            schedule = format_schedule(task["due"], task["priority"])
+            line = f"{task['id']}. {status} {task['title']}" + (f" ({schedule})" if schedule else "")
+            lines.append(f"{line} {format_tags(task['tags'])}" if task["tags"] else line)
+            if task["description"]:
+                lines.append(f"    Description: {task['description']}")
+        if op in ("list", "overdue"):
+            lines.append(f"({len(result['tasks'])} of {result['total']} task(s) shown)")
+        elif not lines:
+            lines.append("No matching tasks.")
+        sys.stdout.write("\n".join(lines) + "\n")
+    elif op == "count":
+        print(f"{result['total']} task(s): {result['pending']} pending, {result['completed']} completed")
+    elif op == "tags":
+        counts = result["tags"]
+        lines = [f"#{tag}: {count} task(s)" for tag, count in counts.items()]
+        sys.stdout.write("\n".join(lines or ["No tags."]) + "\n")
+    elif op == "stats":
+        from utils.analytics import format_statistics
+        sys.stdout.write("\n".join(format_statistics(result)) + "\n")
+    elif op == "update":
+        print(f"Task {result['id']} updated successfully.")
+    elif op == "delete":
+        print(f"{result['deleted']} task(s) deleted successfully.")
+    elif op == "toggle":
+        for task in result["tasks"]:
+            print(f"Task {task['id']} marked as {'complete' if task['completed'] else 'incomplete'}.")
+
+
+def _line_to_command(line: str, line_parser: argparse.ArgumentParser) -> dict:
+    """Turn one batch input line (JSON object or shell-style command) into a command dict."""
+    if line.startswith("{"):
+        try:
+            command = json.loads(line)
+        except ValueError as e:
+            raise CommandError(f"Invalid JSON: {e}") from None
+        if not isinstance(command, dict):
+            raise CommandError("JSON commands must be objects")
+        return command
+
+    try:
+        words = shlex.split(line)
+    except ValueError as e:
+        raise CommandError(str(e)) from None
+    return vars(line_parser.parse_args(words))
+
+
+def run_batch(task_manager: TaskManager, lines, out, stop_on_error: bool = False) -> int:
+    """
+    Run newline-delimited commands and write one JSON result line per command.
+
+    Each input line is either a JSON object such as {"op": "add", "title": "x"}
+    or a shell-style command such as: add "Buy milk" -d "2 litres".
+    Blank lines and lines starting with '#' are skipped.
+
+    Args:
+        task_manager (TaskManager): The manager shared by every command
+        lines (Iterable[str]): Input lines
+        out: Text stream receiving the JSON result lines
+        stop_on_error (bool): Stop at the first failing command
+
+    Returns:
+        int: Number of failed commands
+    """
+    line_parser = _build_line_parser()
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    failures = 0
+
+    for number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            result = execute_command(task_manager, _line_to_command(line, line_parser))
+            out.write(encode({"line": number, "ok": True, "result": result}) + "\n")
+        except CommandError as e:
+            failures += 1
+            out.write(encode({"line": number, "ok": False, "error": str(e)}) + "\n")
+            if stop_on_error:
+                break
+
+    out.flush()
+    return failures
+
+
+def _report_error(args, error: Exception) -> int:
+    """Print why a command failed (as JSON with --json) and return the exit status 1."""
+    if args.json:
+        print(json.dumps({"ok": False, "error": str(error)}, ensure_ascii=False))
+    else:
+        print(f"Error: {error}", file=sys.stderr)
+    return 1
+
+
+def run_import(task_manager: TaskManager, args) -> int:
+    """Run the import command and report the outcome."""
+    from utils.import_export import detect_format, import_tasks
+
+    try:
+        fmt = args.format or detect_format(args.file)
+        if args.file == "-":
+            result = import_tasks(task_manager, sys.stdin, fmt, args.chunk_size, args.workers, args.skip_invalid)
+        else:
+            with open(args.file, encoding="utf-8", newline="") as stream:
+                result = import_tasks(task_manager, stream, fmt, args.chunk_size, args.workers, args.skip_invalid)
+    except (OSError, ValueError) as e:
+        return _report_error(args, e)
+
+    if args.json:
+        print(json.dumps({"ok": not result.rejected or args.skip_invalid, "result": result.to_dict()},
+                         ensure_ascii=False))
+    else:
+        print(f"Imported {result.imported} task(s), rejected {result.rejected}.")
+        for number, message in result.errors:
+            print(f"  Record {number}: {message}", file=sys.stderr)
+        if result.rejected and not args.skip_invalid:
+            print("Import stopped at the first invalid chunk; use --skip-invalid to continue past errors.",
+                  file=sys.stderr)
+    return 1 if result.rejected and not args.skip_invalid else 0
+
+
+def run_export(task_manager: TaskManager, args) -> int:
+    """Run the export command and report the outcome."""
+    from utils.import_export import detect_format, export_tasks
+
+    try:
+        fmt = args.format or detect_format(args.file)
+        if args.file == "-":
+            export_tasks(task_manager, sys.stdout, fmt)
+            sys.stdout.flush()
+            return 0
+
+        with open(args.file, "w", encoding="utf-8", newline="") as out:
+            count = export_tasks(task_manager, out, fmt)
+    except (OSError, ValueError) as e:
+        return _report_error(args, e)
+    if args.json:
+        print(json.dumps({"ok": True, "result": {"exported": count}}))
+    else:
+        print(f"Exported {count} task(s) to {args.file}.")
+    return 0
+
+
+def run_serve(task_manager: TaskManager, args) -> int:
+    """Run the socket server until interrupted."""
+    from server import serve_forever
+
+    try:
+        serve_forever(task_manager, host=args.host, port=args.port, unix_path=args.unix)
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+    return 0
+
+
+def run_cli(argv: List[str], task_manager: Optional[TaskManager] = None, interactive=None) -> int:
+    """
+    Entry point for command mode.
+
+    Args:
+        argv (List[str]): Command-line arguments (without the program name)
+        task_manager (TaskManager, optional): Manager to use instead of the configured backend
+        interactive (callable, optional): Called with the task manager when no command is
+            given (e.g. `main.py --connect HOST:PORT` opens the menu against a server)
+
+    Returns:
+        int: Process exit status (0 on success)
+    """
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except CommandError as e:
+        parser.print_usage(sys.stderr)
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+
+    if args.op is None and interactive is None:
+        parser.print_usage(sys.stderr)
+        print("Error: a command is required", file=sys.stderr)
+        return 2
+
+    owns_manager = task_manager is None
+    if owns_manager:
+        if args.connect:
+            from client import RemoteTaskManager
+            try:
+                task_manager = RemoteTaskManager(args.connect)
+            except (OSError, ValueError) as e:
+                print(f"Error: cannot connect to {args.connect}: {e}", file=sys.stderr)
+                return 1
+        else:
+            task_manager = create_task_manager(args.storage, args.data_dir, args.shards)
+
+    if args.metrics or args.metrics_file or METRICS_ENABLED:
+        from utils.metrics import instrument_task_manager
+        registry = instrument_task_manager(task_manager)
+    else:
+        registry = None
+
+    if args.profile:
+        from utils.profiling import profile_session
+        profiler = profile_session(args.profile)
+    else:
+        profiler = nullcontext([])
+
+    reports = []
+    try:
+        with profiler as reports:
+            return _run_parsed(task_manager, args, interactive)
+    finally:
+        if registry is not None and args.metrics_file:
+            registry.write(args.metrics_file)
+            print(f"Metrics written to {args.metrics_file}", file=sys.stderr)
+        for path in reports:
+            print(f"Profile written to {path}", file=sys.stderr)
+        if owns_manager:
+            task_manager.close()
+
+
+def _run_parsed(task_manager, args: argparse.Namespace, interactive) -> int:
+    """Carry out parsed command-line arguments; returns the process exit status."""
+    if args.op is None:
+        interactive(task_manager)
+        return 0
+    if args.op == "serve":
+        return run_serve(task_manager, args)
+    if args.op == "batch":
+        if args.input == "-":
+            failures = run_batch(task_manager, sys.stdin, sys.stdout, args.stop_on_error)
+        else:
+            with open(args.input, encoding="utf-8") as lines:
+                failures = run_batch(task_manager, lines, sys.stdout, args.stop_on_error)
+        return 1 if failures else 0
+    if args.op == "import":
+        return run_import(task_manager, args)
+    if args.op == "export":
+        return run_export(task_manager, args)
+
+    command = vars(args)
+    try:
+        result = execute_command(task_manager, command)
+    except CommandError as e:
+        return _report_error(args, e)
+
+    if args.json:
+        print(json.dumps({"ok": True, "result": result}, ensure_ascii=False))
+    else:
+        _print_text(command, result)
+    return 0
@@ -0,0 +1,287 @@
+"""
+Client for the Console Todo App socket server.
+RemoteTaskManager offers the TaskManager methods the app uses, carried out by a
+server started with `python main.py serve`.
+"""
+import json
+import socket
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from change_feed import ChangeEvent, ChangeFeedGap
+from config import PAGE_SIZE
+from models.task import UNCHANGED, Task
+
+
+# Tasks fetched per request when iterating with a client-side predicate
+FETCH_PAGE_SIZE = 1000
+
+# Protocol "status" value for each TaskManager completed filter
+STATUS_NAMES = {None: "all", False: "pending", True: "completed"}
+
+
+def parse_address(address: str) -> Tuple[str, object]:
+    """
+    Parse a server address.
+
+    Args:
+        address (str): "HOST:PORT" for TCP or "unix:PATH" for a Unix socket
+
+    Returns:
+        tuple: ("unix", path) or ("tcp", (host, port))
+    """
+    if address.startswith("unix:"):
+        return "unix", address[len("unix:"):]
+
+    host, separator, port = address.rpartition(":")
+    if not separator or not port.isdigit():
+        raise ValueError(f"Address must be HOST:PORT or unix:PATH, got {address!r}")
+    return "tcp", (host.strip("[]") or "127.0.0.1", int(port))
+
+
+def connect(address: str) -> socket.socket:
+    """
+    Open a socket to a task server.
+
+    Args:
+        address (str): "HOST:PORT" or "unix:PATH"
+
+    Returns:
+        socket.socket: The connected socket
+    """
+    kind, target = parse_address(address)
+    if kind == "unix":
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(target)
+        return sock
+    sock = socket.create_connection(target)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+class RemoteTaskManager:
+    """
+    Blocking client that mirrors the TaskManager interface over the socket protocol.
+
+    Invalid input raises ValueError as TaskManager does, and unknown IDs give
+    None/False results. Tasks returned are copies; changing them does not
+    change the server's tasks.
+    """
+
+    def __init__(self, address: str):
+        """
+        Connect to a running server.
+
+        Args:
+            address (str): "HOST:PORT" or "unix:PATH"
+        """
+        self.address = address
+        self._socket = connect(address)
+        self._reader = self._socket.makefile("rb")
+        self._next_request = 0
+
+    def call_many(self, commands: Iterable[dict]) -> List[dict]:
+        """
+        Send several requests in one write and read all the responses (pipelining).
+
+        Args:
+            commands (Iterable[dict]): Request bodies, e.g. {"op": "count"}
+
+        Returns:
+            List[dict]: The responses, in request order
+        """
+        payload = []
+        for command in commands:
+            self._next_request += 1
+            payload.append(json.dumps(dict(command, req=self._next_request), ensure_ascii=False))
+        if not payload:
+            return []
+
+        self._socket.sendall(("\n".join(payload) + "\n").encode("utf-8"))
+        responses = []
+        for _ in payload:
+            line = self._reader.readline()
+            if not line:
+                raise ConnectionError("Server closed the connection")
+            responses.append(json.loads(line))
+        return responses
+
+    def _call(self, op: str, **fields):
+        """Send one request and return its result, raising for errors other than not_found."""
+        return self._call_result(self.call_many([dict(fields, op=op)])[0])
+
+    @staticmethod
+    def _call_result(response: dict):
+        """Return a response's result, None for not_found, or raise for other errors."""
+        if response["ok"]:
+            return response["result"]
+        if response.get("code") == "not_found":
+            return None
+        if response.get("code") in ("internal", "read_only"):
+            raise RuntimeError(response["error"])
+        raise ValueError(response["error"])
+
+    def add_task(self, title: str, description: str = "", due: Optional[str] = None,
+                 priority: Optional[int] = None, tags=()) -> int:
+        """Add a task on the server and return its ID."""
+        return self._call("add", title=title, description=description, due=due, priority=priority,
+                          tags=list(tags) if isinstance(tags, (tuple, set, frozenset)) else tags)["id"]
+
+    def get_all_tasks(self) -> List[Task]:
+        """Fetch every task."""
+        return [Task.from_dict(task) for task in self._call("list")["tasks"]]
+
+    def iter_tasks(self, offset: int = 0, limit: Optional[int] = None, predicate=None,
+                   completed: Optional[bool] = None, sort: Optional[str] = None,
+                   tags: Optional[str] = None) -> Iterator[Task]:
+        """
+        Iterate tasks in insertion order (or by priority or due date with sort).
+
+        Without a predicate, only the requested slice is fetched (the status
+        and tag filters and sort are applied by the server). With one, tasks
+        are fetched in pages and filtered here.
+        """
+        status = STATUS_NAMES[completed]
+        if predicate is None:
+            result = self._call("list", offset=offset, limit=limit, status=status, sort=sort, tags=tags)
+            return iter([Task.from_dict(task) for task in result["tasks"]])
+        return self._iter_filtered(offset, limit, predicate, status, sort, tags)
+
+    def _iter_filtered(self, offset: int, limit: Optional[int], predicate, status: str,
+                       sort: Optional[str], tags: Optional[str]) -> Iterator[Task]:
+        """Fetch pages and apply a predicate client-side."""
+        skipped = yielded = 0
+        position = 0
+        while limit is None or yielded < limit:
+            page = self._call("list", offset=position, limit=FETCH_PAGE_SIZE, status=status, sort=sort,
+                              tags=tags)["tasks"]
+            if not page:
+                return
+            position += len(page)
+            for data in page:
+                task = Task.from_dict(data)
+                if not predicate(task):
+                    continue
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                yield task
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+
+    def count_tasks(self, completed: Optional[bool] = None, tags: Optional[str] = None) -> int:
+        """Return the number of tasks on the server (optionally only completed or pending ones, or matching tags)."""
+        counts = self._call("count", tags=tags)
+        return counts["total"] if completed is None else counts[STATUS_NAMES[completed]]
+
+    def tag_counts(self) -> Dict[str, int]:
+        """Return the number of tasks carrying each tag, in tag order."""
+        return self._call("tags")["tags"]
+
+    def __len__(self) -> int:
+        return self.count_tasks()
+
+    def get_task_by_id(self, task_id: int) -> Optional[Task]:
+        """Fetch one task, or None if it does not exist."""
+        result = self._call("get", id=task_id)
+        return None if result is None else Task.from_dict(result["task"])
+
+    def next_tasks(self, limit: int = PAGE_SIZE) -> List[Task]:
+        """Fetch the pending tasks to work on next, most urgent first."""
+        return [Task.from_dict(task) for task in self._call("next", limit=limit)["tasks"]]
+
+    def overdue_tasks(self, offset: int = 0, limit: Optional[int] = None,
+                      today: Optional[str] = None) -> List[Task]:
+        """Fetch pending tasks past their due date, most overdue first."""
+        result = self._call("overdue", offset=offset, limit=limit, today=today)
+        return [Task.from_dict(task) for task in result["tasks"]]
+
+    def count_overdue(self, today: Optional[str] = None) -> int:
+        """Return the number of pending tasks past their due date."""
+        return self._call("overdue", limit=0, today=today)["total"]
+
+    def statistics(self, today: Optional[str] = None) -> dict:
+        """Fetch summary statistics computed by the server."""
+        return self._call("stats", today=today)
+
+    def update_task(self, task_id: int, title: str = None, description: str = None,
+                    due=UNCHANGED, priority=UNCHANGED, tags=UNCHANGED) -> bool:
+        """Update a task; returns False if the ID does not exist."""
+        fields = {"title": title, "description": description}
+        # Only send the schedule fields and tags being changed: null clears them on the server
+        if due is not UNCHANGED:
+            fields["due"] = due
+        if priority is not UNCHANGED:
+            fields["priority"] = priority
+        if tags is not UNCHANGED:
+            fields["tags"] = list(tags) if isinstance(tags, (tuple, set, frozenset)) else tags
+        return self._call("update", id=task_id, **fields) is not None
+
+    def delete_task(self, task_id: int) -> bool:
+        """Delete a task; returns False if the ID does not exist."""
+        return self._call("delete", ids=[task_id]) is not None
+
+    def toggle_task_completion(self, task_id: int) -> bool:
+        """Toggle a task; returns False if the ID does not exist."""
+        return self._call("toggle", ids=[task_id]) is not None
+
+    def add_tasks(self, items, validated: bool = False) -> List[int]:
+        """
+        Add many tasks atomically; returns their IDs.
+
+        The server validates every item whatever validated says, since it
+        cannot trust what clients send.
+        """
+        return self._call("add_many", items=[list(item) for item in items])["ids"]
+
+    def delete_tasks(self, task_ids) -> int:
+        """Delete many tasks atomically; raises ValueError if any ID does not exist."""
+        result = self._call("delete", ids=list(task_ids))
+        if result is None:
+            raise ValueError("One or more task IDs do not exist")
+        return result["deleted"]
+
+    def set_completed(self, task_ids, value: bool) -> int:
+        """Set the completion status of many tasks atomically."""
+        return self._call("set_completed", ids=list(task_ids), value=value)["changed"]
+
+    def toggle_tasks(self, task_ids) -> int:
+        """Toggle many tasks atomically; raises ValueError if any ID does not exist."""
+        result = self._call("toggle", ids=list(task_ids))
+        if result is None:
+            raise ValueError("One or more task IDs do not exist")
+        return len(result["tasks"])
+
+    def undo(self) -> Optional[str]:
+        """Undo the server's most recent operation; returns its description or None."""
+        return self._call("undo")["undone"]
+
+    def redo(self) -> Optional[str]:
+        """Redo the server's most recently undone operation; returns its description or None."""
+        return self._call("redo")["redone"]
+
+    def changes(self, since: Optional[int] = None, limit: Optional[int] = None) -> Tuple[List[ChangeEvent], int]:
+        """
+        Fetch the server's changes after a sequence number; see TaskManager.changes().
+
+        The server returns at most CHANGE_FEED_PAGE_SIZE events per call, so
+        poll again from the last event's seq while it is behind last_seq.
+        """
+        response = self.call_many([{"op": "changes", "since": since, "limit": limit}])[0]
+        if response.get("code") == "gap":
+            raise ChangeFeedGap(response["error"], self._call("changes")["last_seq"])
+        result = self._call_result(response)
+        return [ChangeEvent.from_dict(event) for event in result["events"]], result["last_seq"]
+
+    def search(self, query: str, limit: int = 20, prefix: bool = True) -> List[Task]:
+        """Full-text search on the server."""
+        return [Task.from_dict(task) for task in self._call("search", query=query, limit=limit)["tasks"]]
+
+    def flush(self) -> None:
+        """Nothing is buffered on the client side."""
+
+    def close(self) -> None:
+        """Close the connection (safe to call more than once)."""
+        if self._socket is not None:
+            self._reader.close()
+            self._socket.close()
+            self._socket = None
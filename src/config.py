@@ -1,10 +1,37 @@
 """
 Configuration constants for the Console Todo App.
 """
+import os
 
 # Task-related constants
 MAX_TITLE_LENGTH = 200
 MAX_DESCRIPTION_LENGTH = 1000
+MIN_PRIORITY = 1  # Most urgent
+MAX_PRIORITY = 5  # Least urgent
+MAX_TAG_LENGTH = 40
+MAX_TAGS_PER_TASK = 20
+
+# Storage-related constants
+STORAGE_BACKEND = os.environ.get("TODO_STORAGE_BACKEND", "journal")  # "journal", "sqlite" or "memory"
+DATA_DIR = os.environ.get("TODO_DATA_DIR", os.path.join(os.path.expanduser("~"), ".console_todo"))
+JOURNAL_FSYNC_MODE = "interval"  # "always", "interval" or "count"
+JOURNAL_FSYNC_INTERVAL_MS = 200
+JOURNAL_FSYNC_EVERY = 256
+JOURNAL_COMPACT_EVERY = 100_000
+SQLITE_SYNCHRONOUS = "NORMAL"  # "FULL" syncs every commit; "NORMAL" syncs the write-ahead log at checkpoints
+
+# Sharding constants
+SHARD_COUNT = int(os.environ.get("TODO_SHARDS", "0"))  # Worker processes; 0 or 1 keeps one in-process TaskManager
+
+# Server-related constants
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+SERVER_MAX_INFLIGHT = 256   # Pipelined requests per connection before reading pauses
+SERVER_MAX_BATCH = 512      # Requests applied (and journaled) together
+
+# Instrumentation constants
+METRICS_ENABLED = os.environ.get("TODO_METRICS", "").lower() in ("1", "true", "yes")
+METRICS_FILE = os.environ.get("TODO_METRICS_FILE") or None  # Written on exit; .json or Prometheus text
 
 # Menu-related constants
 MENU_OPTIONS = {
@@ -13,8 +40,40 @@ MENU_OPTIONS = {
     3: "Update task",
     4: "Delete task",
     5: "Mark as complete/incomplete",
-    6: "Exit"
+    6: "Search tasks",
+    7: "Bulk add tasks",
+    8: "Bulk delete tasks",
+    9: "Bulk mark complete/incomplete",
+    10: "View pending tasks",
+    11: "View completed tasks",
+    12: "Undo",
+    13: "Redo",
+    14: "Show metrics",
+    15: "View next tasks (by priority)",
+    16: "View tasks by due date",
+    17: "View overdue tasks",
+    18: "Statistics",
+    19: "View tasks by tag",
+    20: "Exit"
 }
+EXIT_OPTION = max(MENU_OPTIONS)
+
+# Listing-related constants
+PAGE_SIZE = 20
+RENDER_CACHE_MEMORY_BUDGET = 4 * 1024 * 1024  # Approximate bytes of formatted task text kept by the menu
+
+# Bulk-operation constants
+MAX_BULK_IDS = 1_000_000  # Largest number of IDs one range expression may select
+
+# Undo/redo constants
+HISTORY_MEMORY_BUDGET = 16 * 1024 * 1024  # Approximate bytes of undo/redo history kept in memory
+
+# Change-feed constants
+CHANGE_FEED_RETENTION = 100_000  # Recent changes kept for subscribers to catch up or resume from
+CHANGE_FEED_PAGE_SIZE = 1000  # Most events one "changes" request returns
+
+# Search-related constants
+SEARCH_RESULT_LIMIT = 20
 
 # Display-related constants
 COMPLETED_INDICATOR = "[x]"
@@ -23,7 +82,7 @@ INCOMPLETE_INDICATOR = "[ ]"
 # Error messages
 ERROR_MESSAGES = {
     "invalid_task_id": "Task ID not found",
-    "invalid_menu_choice": "Invalid menu choice. Please select 1-6.",
+    "invalid_menu_choice": f"Invalid menu choice. Please select 1-{EXIT_OPTION}.",
     "empty_title": "Title cannot be empty",
     "invalid_input": "Invalid input. Please try again."
 }
\ No newline at end of file
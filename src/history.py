@@ -0,0 +1,176 @@
+"""
+Undo/redo history for the Console Todo App.
+Records each operation as a compact list of changes that can be reverted or re-applied.
+"""
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+
+# Change kinds. Every change holds enough to be applied in both directions:
+#   (CHANGE_INSERT, id, title, description, completed, due, priority, tags)
+#   (CHANGE_DELETE, id, title, description, completed, due, priority, tags)
+#   (CHANGE_UPDATE, id, old_title, old_description, old_due, old_priority, old_tags,
+#                   new_title, new_description, new_due, new_priority, new_tags)
+#   (CHANGE_COMPLETED, id, new_value)
+CHANGE_INSERT = "i"
+CHANGE_DELETE = "d"
+CHANGE_UPDATE = "u"
+CHANGE_COMPLETED = "c"
+
+# Approximate bytes a change costs besides its strings (tuple, int and str headers)
+CHANGE_OVERHEAD = 160
+
+_DESCRIPTIONS = {
+    CHANGE_INSERT: ("Add task", "Add {} tasks"),
+    CHANGE_DELETE: ("Delete task", "Delete {} tasks"),
+    CHANGE_UPDATE: ("Update task", "Update {} tasks"),
+    CHANGE_COMPLETED: ("Mark task", "Mark {} tasks"),
+}
+
+
+def change_size(change: tuple) -> int:
+    """
+    Estimate the memory a change occupies.
+
+    Args:
+        change (tuple): One recorded change
+
+    Returns:
+        int: Approximate size in bytes
+    """
+    size = CHANGE_OVERHEAD
+    for field in change[2:]:
+        if isinstance(field, str):
+            size += len(field)
+        elif isinstance(field, tuple):  # Tags
+            size += sum(map(len, field))
+    return size
+
+
+def describe(changes: List[tuple]) -> str:
+    """
+    Summarize an operation for display, e.g. "Delete task 5" or "Mark 30 tasks".
+
+    Args:
+        changes (List[tuple]): The operation's changes
+
+    Returns:
+        str: A short description
+    """
+    kinds = {change[0] for change in changes}
+    if len(kinds) != 1:
+        return f"{len(changes)} changes"
+    single, plural = _DESCRIPTIONS[kinds.pop()]
+    if len(changes) == 1:
+        return f"{single} {changes[0][1]}"
+    return plural.format(len(changes))
+
+
+class OperationHistory:
+    """
+    Bounded undo and redo stacks of operations.
+
+    Each operation is a list of change tuples rather than a copy of the task
+    list, so undoing or redoing costs time proportional to the operation.
+    The estimated size of both stacks together never exceeds memory_budget:
+    the oldest operations are evicted first, and an operation larger than
+    the whole budget clears the history, since older operations could no
+    longer be undone in order.
+
+    Operations are numbered 1, 2, ... as they are recorded (whether or not
+    they fit), and state() reports which ones undo and redo would revert
+    and re-apply next, so a caller keeping its own history on top (such as
+    ShardedTaskManager) can tell when this one no longer matches it.
+    """
+
+    def __init__(self, memory_budget: int):
+        """
+        Initialize empty history.
+
+        Args:
+            memory_budget (int): Maximum estimated bytes held by both stacks
+        """
+        self.memory_budget = memory_budget
+        self._undo: Deque[Tuple[List[tuple], int, int]] = deque()  # (changes, size, serial number)
+        self._redo: List[Tuple[List[tuple], int, int]] = []
+        self._size = 0
+        self._recorded = 0
+
+    @property
+    def size(self) -> int:
+        """Estimated bytes currently held."""
+        return self._size
+
+    def can_undo(self) -> bool:
+        """Return True if there is an operation to undo."""
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        """Return True if there is an operation to redo."""
+        return bool(self._redo)
+
+    def state(self) -> Tuple[int, Optional[int], Optional[int]]:
+        """
+        Describe the history by operation serial numbers.
+
+        Returns:
+            tuple: (operations recorded so far, serial of the operation undo would
+                revert or None, serial of the operation redo would re-apply or None)
+        """
+        return (self._recorded, self._undo[-1][2] if self._undo else None,
+                self._redo[-1][2] if self._redo else None)
+
+    def record(self, changes: List[tuple]) -> None:
+        """
+        Record a new operation; this discards everything that could be redone.
+
+        Args:
+            changes (List[tuple]): The operation's changes, in the order applied
+        """
+        for _, size, _ in self._redo:
+            self._size -= size
+        self._redo.clear()
+        self._recorded += 1
+
+        size = sum(change_size(change) for change in changes)
+        if size > self.memory_budget:
+            self.clear()
+            return
+
+        self._undo.append((changes, size, self._recorded))
+        self._size += size
+        while self._size > self.memory_budget:
+            _, evicted, _ = self._undo.popleft()
+            self._size -= evicted
+
+    def pop_undo(self) -> Optional[List[tuple]]:
+        """
+        Take the most recent operation off the undo stack and make it redoable.
+
+        Returns:
+            Optional[List[tuple]]: Its changes, or None if there is nothing to undo
+        """
+        if not self._undo:
+            return None
+        entry = self._undo.pop()
+        self._redo.append(entry)
+        return entry[0]
+
+    def pop_redo(self) -> Optional[List[tuple]]:
+        """
+        Take the most recently undone operation off the redo stack and make it undoable again.
+
+        Returns:
+            Optional[List[tuple]]: Its changes, or None if there is nothing to redo
+        """
+        if not self._redo:
+            return None
+        entry = self._redo.pop()
+        self._undo.append(entry)
+        return entry[0]
+
+    def clear(self) -> None:
+        """Forget every recorded operation."""
+        self._undo.clear()
+        self._redo.clear()
+        self._size = 0
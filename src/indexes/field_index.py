@@ -0,0 +1,224 @@
+"""
+Secondary index grouping tasks by the value of one field.
+Kept up to date incrementally by TaskManager; answers counts and filtered listings.
+"""
+from bisect import bisect_left, bisect_right, insort
+from itertools import accumulate, chain
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional
+from models.task import Task
+
+
+# Largest block of a SortedIds before it is split in two
+MAX_BLOCK_SIZE = 2048
+
+
+class SortedIds:
+    """
+    Task IDs kept in ascending order, in blocks of at most MAX_BLOCK_SIZE.
+
+    Adding or removing an ID bisects for its block and shifts only that block,
+    so it costs O(log n + block size) however large the set is. Slicing a page
+    finds its first block through cached running block lengths, so a page costs
+    O(page size) (plus O(n / block size) to refresh the lengths after a change).
+    """
+
+    def __init__(self, ids: Iterable[int] = ()):
+        """
+        Create the set from IDs that are already in ascending order.
+
+        Args:
+            ids (Iterable[int]): Ascending task IDs
+        """
+        ids = list(ids)
+        half = MAX_BLOCK_SIZE // 2
+        self._blocks: List[List[int]] = [ids[start:start + half] for start in range(0, len(ids), half)]
+        self._maxes: List[int] = [block[-1] for block in self._blocks]
+        self._ends: Optional[List[int]] = None  # Running block lengths, rebuilt after a change
+        self._len = len(ids)
+
+    def add(self, task_id: int) -> None:
+        """Insert an ID that is not in the set (new IDs, the largest, are appended)."""
+        blocks = self._blocks
+        if not blocks:
+            blocks.append([task_id])
+            self._maxes.append(task_id)
+        else:
+            i = min(bisect_left(self._maxes, task_id), len(blocks) - 1)
+            block = blocks[i]
+            insort(block, task_id)
+            self._maxes[i] = block[-1]
+            if len(block) > MAX_BLOCK_SIZE:
+                half = len(block) // 2
+                blocks.insert(i + 1, block[half:])
+                del block[half:]
+                self._maxes.insert(i, block[-1])
+        self._len += 1
+        self._ends = None
+
+    def remove(self, task_id: int) -> bool:
+        """
+        Remove an ID if it is in the set.
+
+        Returns:
+            bool: True if it was there
+        """
+        i = bisect_left(self._maxes, task_id)
+        if i == len(self._blocks):
+            return False
+        block = self._blocks[i]
+        j = bisect_left(block, task_id)
+        if block[j] != task_id:
+            return False
+        del block[j]
+        if block:
+            self._maxes[i] = block[-1]
+        else:
+            del self._blocks[i]
+            del self._maxes[i]
+        self._len -= 1
+        self._ends = None
+        return True
+
+    def __contains__(self, task_id) -> bool:
+        i = bisect_left(self._maxes, task_id)
+        if i == len(self._blocks):
+            return False
+        block = self._blocks[i]
+        return block[bisect_left(block, task_id)] == task_id
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[int]:
+        return chain.from_iterable(self._blocks)
+
+    def __getitem__(self, item) -> List[int]:
+        if not isinstance(item, slice) or item.step not in (None, 1):
+            raise TypeError("Only contiguous slices of task IDs are supported")
+        start, stop, _ = item.indices(self._len)
+        if start >= stop:
+            return []
+        if self._ends is None:
+            self._ends = list(accumulate(map(len, self._blocks)))
+        ends = self._ends
+        i = bisect_right(ends, start)
+        offset = start - (ends[i - 1] if i else 0)
+        page = self._blocks[i][offset:offset + stop - start]
+        while len(page) < stop - start:
+            i += 1
+            page.extend(self._blocks[i][:stop - start - len(page)])
+        return page
+
+
+class FieldIndex:
+    """
+    Maps each value of a task field to the IDs of the tasks that have it.
+
+    Each bucket is a SortedIds, kept in ascending ID order as tasks are added
+    and removed. That is the order TaskManager lists tasks in, so a filtered
+    page lists tasks in the same relative order as the unfiltered listing.
+    Adding and removing cost O(log n), counting O(1) and a page O(page size),
+    also right after a change.
+    """
+
+    def __init__(self, field: str):
+        """
+        Initialize an empty index.
+
+        Args:
+            field (str): Name of the Task attribute to index (values must be hashable)
+        """
+        self.field = field
+        self.fields = frozenset({field})
+        self._buckets: Dict[Hashable, SortedIds] = {}
+
+    def add(self, task: Task) -> None:
+        """
+        Index a task under its current field value.
+
+        Args:
+            task (Task): The task to index
+        """
+        value = getattr(task, self.field)
+        bucket = self._buckets.get(value)
+        if bucket is None:
+            bucket = self._buckets[value] = SortedIds()
+        bucket.add(task.id)
+
+    def remove(self, task: Task) -> None:
+        """
+        Drop a task from the index (must be called before its field changes).
+
+        Args:
+            task (Task): The task to remove
+        """
+        value = getattr(task, self.field)
+        bucket = self._buckets.get(value)
+        if bucket is not None and bucket.remove(task.id) and not bucket:
+            del self._buckets[value]
+
+    def count(self, value: Hashable) -> int:
+        """
+        Count the tasks whose field equals value.
+
+        Args:
+            value: The field value
+
+        Returns:
+            int: The number of matching tasks
+        """
+        return len(self._buckets.get(value, ()))
+
+    def ids(self, value: Hashable) -> SortedIds:
+        """
+        IDs of the tasks whose field equals value, in ascending order.
+
+        The result is the live bucket: slice it for a page, and consume it
+        before changing any task.
+
+        Args:
+            value: The field value
+
+        Returns:
+            SortedIds: The matching task IDs
+        """
+        bucket = self._buckets.get(value)
+        return bucket if bucket is not None else SortedIds()
+
+    def state(self) -> Dict[Hashable, List[int]]:
+        """
+        Export the index contents for a state image.
+
+        Returns:
+            dict: The sorted task IDs of every field value
+        """
+        return {value: list(bucket) for value, bucket in self._buckets.items()}
+
+    @classmethod
+    def from_state(cls, field: str, state: Dict[Hashable, List[int]]) -> "FieldIndex":
+        """
+        Rebuild an index from the output of state() without touching any task.
+
+        Args:
+            field (str): Name of the indexed Task attribute
+            state (dict): The exported index contents
+
+        Returns:
+            FieldIndex: The restored index
+        """
+        index = cls(field)
+        index._buckets = {value: SortedIds(ids) for value, ids in state.items() if ids}
+        return index
+
+    def rebuild(self, tasks: Iterable[Task]) -> None:
+        """
+        Rebuild the whole index from scratch.
+
+        Args:
+            tasks (Iterable[Task]): Every task to index
+        """
+        groups: Dict[Hashable, List[int]] = {}
+        field = self.field
+        for task in tasks:
+            groups.setdefault(getattr(task, field), []).append(task.id)
+        self._buckets = {value: SortedIds(sorted(ids)) for value, ids in groups.items()}
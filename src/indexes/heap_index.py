@@ -0,0 +1,195 @@
+"""
+Heap index ordering tasks by priority or due date.
+Kept up to date incrementally by TaskManager; answers "what's next" and overdue
+queries, and sorted listings, without sorting every task.
+"""
+from heapq import heapify, heappop, heappush, nsmallest
+from typing import Dict, Iterable, Iterator, List, Optional
+from models.task import Task
+
+
+# Sort keys are single integers with the task ID in the lowest digits, so a key
+# compares like the tuple it encodes but costs one int object instead of a tuple
+ID_SPAN = 1 << 63          # Task IDs are stored as int64
+DUE_SPAN = 10 ** 8         # Due dates as YYYYMMDD numbers
+PRIORITY_SPAN = 1 << 8
+NO_DUE = DUE_SPAN - 1      # Tasks without a due date sort after every date
+NO_PRIORITY = PRIORITY_SPAN - 1  # Tasks without a priority sort after every priority
+
+# Keys of completed tasks start here in every order, so pending tasks come first
+COMPLETED_KEY = PRIORITY_SPAN * DUE_SPAN * ID_SPAN
+
+# Stale heap entries tolerated before the heap is rebuilt from the live keys
+MIN_STALE_ENTRIES = 1024
+
+
+def due_number(due: Optional[str]) -> int:
+    """Turn a "YYYY-MM-DD" due date into a YYYYMMDD number (NO_DUE if there is none)."""
+    return NO_DUE if due is None else int(due[:4] + due[5:7] + due[8:10])
+
+
+def priority_key(task: Task) -> int:
+    """Sort key: pending first, then priority (1 first), due date, and ID."""
+    priority = NO_PRIORITY if task.priority is None else task.priority
+    return ((task.completed * PRIORITY_SPAN + priority) * DUE_SPAN + due_number(task.due)) * ID_SPAN + task.id
+
+
+def due_key(task: Task) -> int:
+    """Sort key: pending first, then due date (earliest first), priority, and ID."""
+    priority = NO_PRIORITY if task.priority is None else task.priority
+    return ((task.completed * DUE_SPAN + due_number(task.due)) * PRIORITY_SPAN + priority) * ID_SPAN + task.id
+
+
+def due_before_key(due: str) -> int:
+    """The smallest due_key() of a pending task due on the given date or later."""
+    return due_number(due) * PRIORITY_SPAN * ID_SPAN
+
+
+# Sort orders TaskManager can list tasks in
+ORDER_KEYS = {"priority": priority_key, "due": due_key}
+
+
+class HeapIndex:
+    """
+    Binary min-heap of sort keys, one per task.
+
+    Adding a task pushes its key in O(log n). Removal is lazy: the task's key
+    is dropped from the ID-to-key map in O(1) and the heap entry is skipped
+    when met, and the heap is rebuilt once stale entries outnumber live ones.
+
+    Reading the k smallest keys walks the heap as a tree with a small
+    frontier heap instead of popping, so it costs O(k log k), leaves the heap
+    untouched, and never looks at the other n - k tasks.
+    """
+
+    fields = frozenset({"completed", "due", "priority"})
+
+    def __init__(self, order: str):
+        """
+        Initialize an empty index.
+
+        Args:
+            order (str): Sort order, a key of ORDER_KEYS
+        """
+        self.order = order
+        self.key = ORDER_KEYS[order]
+        self._heap: List[int] = []
+        self._keys: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed tasks."""
+        return len(self._keys)
+
+    def add(self, task: Task) -> None:
+        """
+        Index a task under its current key.
+
+        Args:
+            task (Task): The task to index
+        """
+        key = self.key(task)
+        self._keys[task.id] = key
+        heappush(self._heap, key)
+
+    def remove(self, task: Task) -> None:
+        """
+        Drop a task from the index.
+
+        Args:
+            task (Task): The task to remove
+        """
+        if self._keys.pop(task.id, None) is None:
+            return
+        stale = len(self._heap) - len(self._keys)
+        if stale > MIN_STALE_ENTRIES and stale > len(self._keys):
+            self._heap = list(self._keys.values())
+            heapify(self._heap)
+
+    def iter_ids(self, stop: Optional[int] = None) -> Iterator[int]:
+        """
+        Yield task IDs in ascending key order, lazily.
+
+        The index must not change while the iterator is in use.
+
+        Args:
+            stop (int, optional): Stop at the first key >= stop, e.g. COMPLETED_KEY for pending tasks only
+
+        Returns:
+            Iterator[int]: The task IDs
+        """
+        heap = self._heap
+        keys = self._keys
+        size = len(heap)
+        if not size:
+            return
+        frontier = [(heap[0], 0)]
+        previous = None
+        while frontier:
+            key, position = heappop(frontier)
+            if stop is not None and key >= stop:
+                return
+            child = 2 * position + 1
+            if child < size:
+                heappush(frontier, (heap[child], child))
+                if child + 1 < size:
+                    heappush(frontier, (heap[child + 1], child + 1))
+
+            task_id = key % ID_SPAN
+            # Skip stale entries, and the duplicate a task leaves when it gets back an old key
+            if key != previous and keys.get(task_id) == key:
+                previous = key
+                yield task_id
+
+    def sorted_ids(self, task_ids: Iterable[int], limit: Optional[int] = None) -> List[int]:
+        """
+        Order a subset of the indexed tasks by key.
+
+        Args:
+            task_ids (Iterable[int]): IDs of indexed tasks
+            limit (int, optional): Only the first limit IDs
+
+        Returns:
+            List[int]: The IDs in ascending key order
+        """
+        keys = map(self._keys.__getitem__, task_ids)
+        ordered = sorted(keys) if limit is None else nsmallest(limit, keys)
+        return [key % ID_SPAN for key in ordered]
+
+    def state(self) -> List[int]:
+        """
+        Export the index contents for a state image.
+
+        Returns:
+            List[int]: Every live key
+        """
+        return list(self._keys.values())
+
+    @classmethod
+    def from_state(cls, order: str, state: List[int]) -> "HeapIndex":
+        """
+        Rebuild an index from the output of state() without touching any task.
+
+        Args:
+            order (str): Sort order the keys were computed for
+            state (List[int]): The exported keys
+
+        Returns:
+            HeapIndex: The restored index
+        """
+        index = cls(order)
+        index._keys = {key % ID_SPAN: key for key in state}
+        heapify(state)
+        index._heap = state
+        return index
+
+    def rebuild(self, tasks: Iterable[Task]) -> None:
+        """
+        Rebuild the whole index from scratch.
+
+        Args:
+            tasks (Iterable[Task]): Every task to index
+        """
+        key = self.key
+        self._keys = {task.id: key(task) for task in tasks}
+        self._heap = list(self._keys.values())
+        heapify(self._heap)
@@ -0,0 +1,193 @@
+"""
+Inverted full-text index over task titles and descriptions.
+Kept up to date incrementally by TaskManager; answers ranked, prefix-aware queries.
+"""
+import heapq
+import math
+import re
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+from models.task import Task
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# A title hit counts this many times more than a description hit when ranking
+TITLE_WEIGHT = 2
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text (str): The text to tokenize
+
+    Returns:
+        List[str]: The tokens in order of appearance
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class InvertedIndex:
+    """
+    Maps each token to the tasks containing it.
+
+    Postings hold a per-task term weight (title hits count TITLE_WEIGHT times),
+    which together with the token's document frequency gives a TF-IDF score.
+    A sorted vocabulary supports prefix matching through binary search.
+    """
+
+    fields = frozenset({"title", "description"})
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._vocabulary: List[str] = []
+        self._document_count = 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed tasks."""
+        return self._document_count
+
+    @staticmethod
+    def _weights(task: Task) -> Counter:
+        """Compute the weighted term frequencies of a task."""
+        weights = Counter(tokenize(task.description))
+        for token in tokenize(task.title):
+            weights[token] += TITLE_WEIGHT
+        return weights
+
+    def add(self, task: Task) -> None:
+        """
+        Index a task's current title and description.
+
+        Args:
+            task (Task): The task to index
+        """
+        postings = self._postings
+        for token, weight in self._weights(task).items():
+            posting = postings.get(token)
+            if posting is None:
+                posting = postings[token] = {}
+                insort(self._vocabulary, token)
+            posting[task.id] = weight
+        self._document_count += 1
+
+    def remove(self, task: Task) -> None:
+        """
+        Drop a task from the index (must be called before its text changes).
+
+        Args:
+            task (Task): The task to remove
+        """
+        postings = self._postings
+        for token in self._weights(task):
+            posting = postings.get(token)
+            if posting is None:
+                continue
+            posting.pop(task.id, None)
+            if not posting:
+                del postings[token]
+                position = bisect_left(self._vocabulary, token)
+                del self._vocabulary[position]
+        self._document_count -= 1
+
+    def _expand(self, term: str, prefix: bool) -> List[str]:
+        """Return the indexed tokens matching a query term."""
+        if not prefix:
+            return [term] if term in self._postings else []
+
+        vocabulary = self._vocabulary
+        start = bisect_left(vocabulary, term)
+        end = start
+        while end < len(vocabulary) and vocabulary[end].startswith(term):
+            end += 1
+        return vocabulary[start:end]
+
+    def search(self, query: str, limit: int = 20, prefix: bool = True) -> List[Tuple[int, float]]:
+        """
+        Find the tasks matching every term of the query, best matches first.
+
+        Args:
+            query (str): Free-text query
+            limit (int): Maximum number of results
+            prefix (bool): If True, each term also matches tokens it is a prefix of
+
+        Returns:
+            List[Tuple[int, float]]: (task ID, score) pairs ordered by descending score
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms or limit <= 0:
+            return []
+
+        total = max(self._document_count, 1)
+        per_term = []
+        for term in terms:
+            scores: Dict[int, float] = {}
+            for token in self._expand(term, prefix):
+                posting = self._postings[token]
+                idf = math.log(1 + total / len(posting))
+                for task_id, weight in posting.items():
+                    scores[task_id] = scores.get(task_id, 0.0) + weight * idf
+            if not scores:
+                return []
+            per_term.append(scores)
+
+        # Intersect starting from the rarest term so the candidate set stays small
+        per_term.sort(key=len)
+        candidates = per_term[0]
+        for scores in per_term[1:]:
+            candidates = {
+                task_id: score + scores[task_id]
+                for task_id, score in candidates.items()
+                if task_id in scores
+            }
+            if not candidates:
+                return []
+
+        return heapq.nsmallest(limit, candidates.items(), key=lambda item: (-item[1], item[0]))
+
+    def state(self) -> Tuple[Dict[str, Dict[int, int]], List[str], int]:
+        """
+        Export the index contents for a state image.
+
+        Returns:
+            tuple: (postings, sorted vocabulary, indexed task count)
+        """
+        return self._postings, self._vocabulary, self._document_count
+
+    @classmethod
+    def from_state(cls, state: Tuple[Dict[str, Dict[int, int]], List[str], int]) -> "InvertedIndex":
+        """
+        Rebuild an index from the output of state() without tokenizing any task.
+
+        Args:
+            state (tuple): The exported index contents
+
+        Returns:
+            InvertedIndex: The restored index
+        """
+        index = cls()
+        index._postings, index._vocabulary, index._document_count = state
+        return index
+
+    def rebuild(self, tasks: Iterable[Task]) -> None:
+        """
+        Replace the index contents with the given tasks.
+
+        Args:
+            tasks (Iterable[Task]): Every task to index
+        """
+        self._postings = {}
+        self._document_count = 0
+        postings = self._postings
+        for task in tasks:
+            for token, weight in self._weights(task).items():
+                posting = postings.get(token)
+                if posting is None:
+                    posting = postings[token] = {}
+                posting[task.id] = weight
+            self._document_count += 1
+        self._vocabulary = sorted(postings)
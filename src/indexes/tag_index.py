@@ -0,0 +1,237 @@
+"""
+Secondary index from each tag to the tasks that carry it.
+Kept up to date incrementally by TaskManager; answers tag counts and AND/OR/NOT tag queries.
+"""
+from typing import Callable, Dict, Iterable, List, Set, Tuple
+from models.task import Task
+from utils.validation import validate_tag
+
+
+def parse_tag_query(text: str) -> tuple:
+    """
+    Parse a tag query such as "work and not someday" or "(home or errands) urgent".
+
+    Tags next to each other must all match, as if joined by "and". "not" binds
+    tightest, then "and", then "or"; parentheses group. Tags are normalized
+    like validate_tag() does, so "#Work" and "work" are the same tag.
+
+    Args:
+        text (str): The query
+
+    Returns:
+        tuple: The query tree, made of ("tag", name), ("not", node),
+            ("and", [nodes]) and ("or", [nodes]) nodes
+
+    Raises:
+        ValueError: If the query is empty or malformed
+    """
+    if not isinstance(text, str):
+        raise ValueError("Tag query must be text")
+    tokens = text.replace("(", " ( ").replace(")", " ) ").split()
+    if not tokens:
+        raise ValueError("Tag query cannot be empty")
+    position = 0
+
+    def peek():
+        return tokens[position].lower() if position < len(tokens) else None
+
+    def parse_or():
+        nonlocal position
+        nodes = [parse_and()]
+        while peek() == "or":
+            position += 1
+            nodes.append(parse_and())
+        return nodes[0] if len(nodes) == 1 else ("or", nodes)
+
+    def parse_and():
+        nonlocal position
+        nodes = [parse_not()]
+        while peek() not in (None, "or", ")"):
+            if peek() == "and":
+                position += 1
+            nodes.append(parse_not())
+        return nodes[0] if len(nodes) == 1 else ("and", nodes)
+
+    def parse_not():
+        nonlocal position
+        token = peek()
+        if token is None:
+            raise ValueError("Tag query ends unexpectedly")
+        position += 1
+        if token == "not":
+            return "not", parse_not()
+        if token == "(":
+            node = parse_or()
+            if peek() != ")":
+                raise ValueError("Missing ')' in tag query")
+            position += 1
+            return node
+        if token in (")", "and", "or"):
+            raise ValueError(f"Unexpected '{token}' in tag query")
+        is_valid, error_msg, tag = validate_tag(tokens[position - 1])
+        if not is_valid:
+            raise ValueError(error_msg)
+        return "tag", tag
+
+    tree = parse_or()
+    if position < len(tokens):
+        raise ValueError(f"Unexpected '{tokens[position]}' in tag query")
+    return tree
+
+
+class TagIndex:
+    """
+    Maps each tag to the set of IDs of the tasks carrying it.
+
+    Adding, removing and counting are O(number of tags of the task). Queries
+    combine the ID sets with set algebra, starting from the smallest: "a and
+    b" costs O(min(|a|, |b|)) and "a and not b" O(|a|), so a query costs about
+    the size of its smallest positive term rather than the number of tasks.
+    Only a query that matches tasks by absence alone (e.g. "not a") has to go
+    through every task ID.
+    """
+
+    fields = frozenset({"tags"})
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._postings: Dict[str, Set[int]] = {}
+
+    def add(self, task: Task) -> None:
+        """
+        Index a task under each of its tags.
+
+        Args:
+            task (Task): The task to index
+        """
+        for tag in task.tags:
+            ids = self._postings.get(tag)
+            if ids is None:
+                ids = self._postings[tag] = set()
+            ids.add(task.id)
+
+    def remove(self, task: Task) -> None:
+        """
+        Drop a task from the index (must be called before its tags change).
+
+        Args:
+            task (Task): The task to remove
+        """
+        for tag in task.tags:
+            ids = self._postings.get(tag)
+            if ids is not None:
+                ids.discard(task.id)
+                if not ids:
+                    del self._postings[tag]
+
+    def count(self, tag: str) -> int:
+        """
+        Count the tasks carrying a tag.
+
+        Args:
+            tag (str): A normalized tag
+
+        Returns:
+            int: The number of tasks
+        """
+        return len(self._postings.get(tag, ()))
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Count the tasks carrying each tag.
+
+        Returns:
+            Dict[str, int]: Task counts by tag, in tag order
+        """
+        return {tag: len(self._postings[tag]) for tag in sorted(self._postings)}
+
+    def query(self, tree: tuple, all_ids: Callable[[], Iterable[int]]) -> Set[int]:
+        """
+        Find the tasks matching a parsed tag query.
+
+        The returned set may be shared with the index and must not be modified.
+
+        Args:
+            tree (tuple): A query tree from parse_tag_query()
+            all_ids (callable): Returns every task ID; only called for queries
+                that match tasks by absence alone
+
+        Returns:
+            Set[int]: The IDs of the matching tasks
+        """
+        negated, ids = self._evaluate(tree)
+        if negated:
+            return {task_id for task_id in all_ids() if task_id not in ids}
+        return ids
+
+    def _evaluate(self, node: tuple) -> Tuple[bool, Set[int]]:
+        """
+        Evaluate a query tree without enumerating every task.
+
+        Returns:
+            tuple: (negated, ids): the matching tasks are ids, or every task except
+                ids if negated
+        """
+        kind = node[0]
+        if kind == "tag":
+            return False, self._postings.get(node[1], set())
+        if kind == "not":
+            negated, ids = self._evaluate(node[1])
+            return not negated, ids
+
+        parts = [self._evaluate(child) for child in node[1]]
+        positives = sorted((ids for negated, ids in parts if not negated), key=len)
+        negatives = sorted((ids for negated, ids in parts if negated), key=len)
+        if kind == "and":
+            if not positives:
+                return True, set().union(*negatives)  # not a and not b = not (a or b)
+            result = positives[0]
+            for ids in positives[1:]:
+                result = result & ids
+            for ids in negatives:
+                result = result - ids
+            return False, result
+
+        if not negatives:
+            return False, set().union(*positives)
+        result = negatives[0]  # a or not b = not (b and not a)
+        for ids in negatives[1:]:
+            result = result & ids
+        for ids in positives:
+            result = result - ids
+        return True, result
+
+    def state(self) -> Dict[str, List[int]]:
+        """
+        Export the index contents for a state image.
+
+        Returns:
+            dict: The sorted task IDs of every tag
+        """
+        return {tag: sorted(ids) for tag, ids in self._postings.items()}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, List[int]]) -> "TagIndex":
+        """
+        Rebuild an index from the output of state() without touching any task.
+
+        Args:
+            state (dict): The exported index contents
+
+        Returns:
+            TagIndex: The restored index
+        """
+        index = cls()
+        index._postings = {tag: set(ids) for tag, ids in state.items()}
+        return index
+
+    def rebuild(self, tasks: Iterable[Task]) -> None:
+        """
+        Rebuild the whole index from scratch.
+
+        Args:
+            tasks (Iterable[Task]): Every task to index
+        """
+        self._postings = {}
+        for task in tasks:
+            self.add(task)
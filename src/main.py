@@ -4,16 +4,140 @@ Implements the menu-driven interface and handles user interactions.
 """
 from typing import Optional
 import sys
-from task_manager import TaskManager
-from utils.validation import validate_task_title, validate_task_description
-from config import MENU_OPTIONS
+from models.task import UNCHANGED, format_schedule, format_tags
+from task_manager import create_task_manager
+from utils.validation import validate_task, parse_id_ranges
+from utils.render_cache import RenderCache
+from config import MENU_OPTIONS, EXIT_OPTION, SEARCH_RESULT_LIMIT, PAGE_SIZE, METRICS_ENABLED, METRICS_FILE
 
 
+# Formatted task text from earlier screens; only tasks changed since they were last shown are formatted again
+render_cache = RenderCache()
+
+
+def write_lines(lines):
+    """
+    Write a block of output lines to the console in one buffered write.
+
+    Args:
+        lines (list): The lines to print
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def task_line(task):
+    """
+    One-line summary of a task: ID, status, title and its priority, due date and tags if set.
+
+    Args:
+        task (Task): The task to describe
+
+    Returns:
+        str: e.g. "3. [ ] Pay rent (P1, due 2026-03-01) #home"
+    """
+    status = "[x]" if task.completed else "[ ]"
+    schedule = format_schedule(task.due, task.priority)
+    line = f"{task.id}. {status} {task.title} ({schedule})" if schedule else f"{task.id}. {status} {task.title}"
+    return f"{line} {format_tags(task.tags)}" if task.tags else line
+
+
+def task_block(task):
+    """
+    Listing entry for a task: its task_line() and, if it has one, its description on a second line.
+
+    Args:
+        task (Task): The task to describe
+
+    Returns:
+        str: The entry, without a trailing newline
+    """
+    if task.description:
+        return f"{task_line(task)}\n    Description: {task.description}"
+    return task_line(task)
+
+
+def picker_line(task):
+    """
+    Short entry for a task in the ID pickers: ID, status and title.
+
+    Args:
+        task (Task): The task to describe
+
+    Returns:
+        str: e.g. "  3. [ ] Pay rent"
+    """
+    status = "[x]" if task.completed else "[ ]"
+    return f"  {task.id}. {status} {task.title}"
+
+
+def get_page_count(total):
+    """
+    Number of PAGE_SIZE pages needed to show total tasks (at least 1).
+    """
+    return max(1, -(-total // PAGE_SIZE))
+
+
+def read_page_command(answer, page, page_count):
+    """
+    Interpret 'n' / 'p' page navigation input.
+
+    Args:
+        answer (str): The user's input
+        page (int): The current zero-based page
+        page_count (int): Total number of pages
+
+    Returns:
+        Optional[int]: The new page number, or None if answer is not a page command
+    """
+    command = answer.strip().lower()
+    if command == "n":
+        return min(page + 1, page_count - 1)
+    if command == "p":
+        return max(page - 1, 0)
+    return None
+
+
+def prompt_task_id(task_manager_instance, prompt):
+    """
+    Show one page of tasks for reference and ask the user for a task ID.
+    Entering 'n' or 'p' moves to the next or previous page instead.
+
+    Args:
+        task_manager_instance: The TaskManager to list tasks from
+        prompt (str): The question to ask for the ID
+
+    Returns:
+        Optional[int]: The entered ID, or None if the input was not a number
+    """
+    page_count = get_page_count(task_manager_instance.count_tasks())
+    page = 0
+
+    while True:
+        lines = ["Current tasks:"]
+        for task in task_manager_instance.iter_tasks(page * PAGE_SIZE, PAGE_SIZE):
+            lines.append(render_cache.render("picker", task, picker_line))
+        if page_count > 1:
+            lines.append(f"  (page {page + 1} of {page_count}; enter 'n' or 'p' to change page)")
+        write_lines(lines)
+
+        answer = input(f"\n{prompt}").strip()
+
+        new_page = read_page_command(answer, page, page_count) if page_count > 1 else None
+        if new_page is not None:
+            page = new_page
+            continue
+
+        try:
+            return int(answer)
+        except ValueError:
+            print("Error: Task ID must be a number.")
+            return None
+
 
 def display_menu():
     """
     Show the main menu options to the user.
-    Displays numbered options for all 5 Basic Level features plus Exit.
+    Displays numbered options for every feature in MENU_OPTIONS, ending with Exit.
     """
     print("\n" + "="*40)
     print("         CONSOLE TODO APP")
@@ -30,25 +154,25 @@ def get_user_choice() -> Optional[int]:
     Prompt user for menu selection and validate input.
     
     Returns:
-        int: A valid menu option number (1-6), or None if user enters invalid input
+        int: A valid menu option number (1-EXIT_OPTION), or None if user enters invalid input
     """
     try:
-        choice = input("\nSelect an option (1-6): ").strip()
+        choice = input(f"\nSelect an option (1-{EXIT_OPTION}): ").strip()
         
         if not choice:
-            print("Please enter a number between 1 and 6.")
+            print(f"Please enter a number between 1 and {EXIT_OPTION}.")
             return None
         
         choice_int = int(choice)
         
-        if 1 <= choice_int <= 6:
+        if 1 <= choice_int <= EXIT_OPTION:
             return choice_int
         else:
-            print("Invalid choice. Please select a number between 1 and 6.")
+            print(f"Invalid choice. Please select a number between 1 and {EXIT_OPTION}.")
             return None
             
     except ValueError:
-        print("Invalid input. Please enter a number between 1 and 6.")
+        print(f"Invalid input. Please enter a number between 1 and {EXIT_OPTION}.")
         return None
 
 
@@ -60,56 +184,178 @@ def handle_add_task(task_manager_instance):
     """
     print("\n--- Add New Task ---")
 
-    # Get title from user
-    title = input("Enter task title (required): ").strip()
+    title = input("Enter task title (required): ")
+    description = input("Enter task description (optional, press Enter to skip): ")
+    due = input("Enter due date (YYYY-MM-DD, optional): ")
+    priority = input("Enter priority (1 = most urgent to 5, optional): ")
+    tags = input("Enter tags (separated by commas, e.g. work, project:website, optional): ")
 
-    # Validate title
-    is_valid, error_msg = validate_task_title(title)
+    # Validate the whole record once, as bulk add does; the row is then stored as it is
+    is_valid, error_msg, row = validate_task(title, description, False, due, priority, tags)
     if not is_valid:
         print(f"Error: {error_msg}")
         return
 
-    # Get description from user (optional)
-    description = input("Enter task description (optional, press Enter to skip): ").strip()
-
-    # Validate description if provided
-    if description:
-        is_valid, error_msg = validate_task_description(description)
-        if not is_valid:
-            print(f"Error: {error_msg}")
-            return
-
-    # Add task to manager
     try:
-        task_id = task_manager_instance.add_task(title, description)
+        task_id = task_manager_instance.add_tasks([row], validated=True)[0]
         print(f"Task added successfully with ID: {task_id}")
     except ValueError as e:
         print(f"Error adding task: {e}")
 
 
-def handle_view_tasks(task_manager_instance):
+def handle_view_tasks(task_manager_instance, completed=None, sort=None, tags=None):
     """
-    Display all tasks to the user with proper formatting.
-    Shows all tasks with ID, title, description, and completion status ([ ] or [x]).
+    Display tasks to the user with proper formatting, one page at a time.
+    Shows each task with ID, title, description, and completion status ([ ] or [x]).
+    Only the tasks on the current page are read, so large lists open instantly.
     Shows appropriate message if no tasks exist.
+
+    Args:
+        task_manager_instance: The TaskManager to list tasks from
+        completed (bool, optional): Show only completed (True) or pending (False) tasks
+        sort (str, optional): "priority" or "due" to list by priority or due date instead of by ID
+        tags (str, optional): Show only tasks matching this tag query
     """
-    print("\n--- View All Tasks ---")
+    if tags is not None:
+        print(f"\n--- View Tasks Tagged '{tags}' ---")
+    elif sort == "due":
+        print("\n--- View Tasks by Due Date ---")
+    elif completed is None:
+        print("\n--- View All Tasks ---")
+    else:
+        print(f"\n--- View {'Completed' if completed else 'Pending'} Tasks ---")
 
-    tasks = task_manager_instance.get_all_tasks()
+    total = task_manager_instance.count_tasks(completed, tags)
 
-    if not tasks:
-        print("No tasks found. Your todo list is empty.")
+    if total == 0:
+        if tags is not None:
+            print("No tasks match these tags.")
+        elif completed is None:
+            print("No tasks found. Your todo list is empty.")
+        else:
+            print(f"No {'completed' if completed else 'pending'} tasks.")
+        return
+
+    if completed is None:
+        pending = task_manager_instance.count_tasks(completed=False, tags=tags)
+        print(f"Found {total} task(s) ({pending} pending, {total - pending} completed):")
+    else:
+        print(f"Found {total} {'completed' if completed else 'pending'} task(s):")
+    page_count = get_page_count(total)
+    page = 0
+
+    while True:
+        lines = ["-" * 60]
+        for task in task_manager_instance.iter_tasks(page * PAGE_SIZE, PAGE_SIZE, completed=completed, sort=sort,
+                                                     tags=tags):
+            lines.append(render_cache.render("list", task, task_block))
+            lines.append("")  # Empty line for better readability
+
+        if page_count == 1:
+            write_lines(lines)
+            return
+
+        lines.append(f"Page {page + 1} of {page_count}")
+        write_lines(lines)
+
+        answer = input("Enter 'n' for next page, 'p' for previous page, or press Enter to go back: ")
+        new_page = read_page_command(answer, page, page_count)
+        if new_page is None:
+            return
+        page = new_page
+
+
+def handle_view_tasks_by_tag(task_manager_instance):
+    """
+    Show how many tasks carry each tag, then list the tasks matching a tag query
+    such as "work and not someday" or "project:website (urgent or p1)".
+    """
+    print("\n--- View Tasks by Tag ---")
+
+    counts = task_manager_instance.tag_counts()
+    if not counts:
+        print("No tagged tasks.")
         return
 
-    print(f"Found {len(tasks)} task(s):")
-    print("-" * 60)
+    write_lines([f"  #{tag} ({count})" for tag, count in counts.items()])
+    query = input("Enter tags to show, combined with and/or/not (e.g. 'work and not someday'): ").strip()
+    if not query:
+        return
+    answer = input("Only pending tasks? (y/N): ").strip().lower()
+
+    try:
+        handle_view_tasks(task_manager_instance, completed=False if answer in ("y", "yes") else None, tags=query)
+    except ValueError as e:
+        print(f"Error: {e}")
+
+
+def handle_view_next_tasks(task_manager_instance):
+    """
+    Show the pending tasks to work on next: most urgent priority first, then
+    earliest due date. Tasks without a priority or due date come last.
+    """
+    print("\n--- Next Tasks ---")
 
+    tasks = task_manager_instance.next_tasks(PAGE_SIZE)
+    if not tasks:
+        print("No pending tasks.")
+        return
+
+    lines = [f"Next {len(tasks)} pending task(s):", "-" * 60]
     for task in tasks:
-        status = "[x]" if task.completed else "[ ]"
-        print(f"{task.id}. {status} {task.title}")
-        if task.description:
-            print(f"    Description: {task.description}")
-        print()  # Empty line for better readability
+        lines.append(render_cache.render("list", task, task_block))
+    write_lines(lines)
+
+
+def handle_view_overdue_tasks(task_manager_instance):
+    """
+    Display pending tasks whose due date has passed, most overdue first,
+    one page at a time.
+    """
+    print("\n--- Overdue Tasks ---")
+
+    total = task_manager_instance.count_overdue()
+    if total == 0:
+        print("No overdue tasks.")
+        return
+
+    print(f"Found {total} overdue task(s):")
+    page_count = get_page_count(total)
+    page = 0
+
+    while True:
+        lines = ["-" * 60]
+        for task in task_manager_instance.overdue_tasks(page * PAGE_SIZE, PAGE_SIZE):
+            lines.append(render_cache.render("list", task, task_block))
+
+        if page_count == 1:
+            write_lines(lines)
+            return
+
+        lines.append(f"Page {page + 1} of {page_count}")
+        write_lines(lines)
+
+        answer = input("Enter 'n' for next page, 'p' for previous page, or press Enter to go back: ")
+        new_page = read_page_command(answer, page, page_count)
+        if new_page is None:
+            return
+        page = new_page
+
+
+def handle_statistics(task_manager_instance):
+    """
+    Show summary statistics: completion rates, tasks by priority, the
+    description length distribution and the busiest due dates.
+    """
+    from utils.analytics import format_statistics
+
+    print("\n--- Statistics ---")
+
+    if task_manager_instance.count_tasks() == 0:
+        print("No tasks found. Your todo list is empty.")
+        return
+
+    write_lines(format_statistics(task_manager_instance.statistics()))
 
 
 def handle_update_task(task_manager_instance):
@@ -121,25 +367,13 @@ def handle_update_task(task_manager_instance):
     print("\n--- Update Task ---")
 
     # Check if there are any tasks
-    tasks = task_manager_instance.get_all_tasks()
-    if not tasks:
+    if task_manager_instance.count_tasks() == 0:
         print("No tasks available to update. Please add some tasks first.")
         return
 
-    # Display all tasks for reference
-    print("Current tasks:")
-    for task in tasks:
-        status = "[x]" if task.completed else "[ ]"
-        print(f"  {task.id}. {status} {task.title}")
-
-    # Get task ID from user
-    task_id_input = input("\nEnter the task ID to update: ").strip()
-
-    # Validate task ID input
-    try:
-        task_id = int(task_id_input)
-    except ValueError:
-        print("Error: Task ID must be a number.")
+    # Display a page of tasks for reference and get task ID from user
+    task_id = prompt_task_id(task_manager_instance, "Enter the task ID to update: ")
+    if task_id is None:
         return
 
     # Validate that the task exists
@@ -151,36 +385,22 @@ def handle_update_task(task_manager_instance):
     print(f"Current task details:")
     print(f"  Title: {task.title}")
     print(f"  Description: {task.description if task.description else '(No description)'}")
-
-    # Get new title from user (or keep current if empty input)
-    new_title = input(f"\nEnter new title (current: '{task.title}', press Enter to keep current): ").strip()
-    if not new_title:
-        new_title = task.title  # Keep current title if user presses Enter
-
-    # Get new description from user (or keep current if empty input)
-    new_description = input(f"Enter new description (current: '{task.description if task.description else '(No description)'}', press Enter to keep current): ").strip()
-    if not new_description and task.description:  # Only keep current if there was one
-        new_description = task.description
-    elif not new_description and not task.description:  # If both are empty, keep as empty
-        new_description = ""
-
-    # Validate the new title if it's different
-    if new_title != task.title:
-        is_valid, error_msg = validate_task_title(new_title)
-        if not is_valid:
-            print(f"Error: {error_msg}")
-            return
-
-    # Validate the new description if it's different
-    if new_description != task.description:
-        is_valid, error_msg = validate_task_description(new_description)
-        if not is_valid:
-            print(f"Error: {error_msg}")
-            return
+    print(f"  Due date: {task.due or '(none)'}")
+    print(f"  Priority: {task.priority or '(none)'}")
+    print(f"  Tags: {format_tags(task.tags) or '(none)'}")
+
+    # Get the new values; Enter keeps the current one (None or UNCHANGED), 'none' clears
+    # a due date, priority or tags. update_task() validates them all in one place.
+    new_title = input(f"\nEnter new title (current: '{task.title}', press Enter to keep current): ").strip() or None
+    new_description = input(f"Enter new description (current: '{task.description if task.description else '(No description)'}', press Enter to keep current): ").strip() or None
+    new_due = input("Enter new due date (YYYY-MM-DD, press Enter to keep current, 'none' to clear): ").strip() or UNCHANGED
+    new_priority = input("Enter new priority (1-5, press Enter to keep current, 'none' to clear): ").strip() or UNCHANGED
+    new_tags = input("Enter new tags (separated by commas, press Enter to keep current, 'none' to clear): ").strip() or UNCHANGED
 
     # Update the task
     try:
-        success = task_manager_instance.update_task(task_id, new_title, new_description)
+        success = task_manager_instance.update_task(task_id, new_title, new_description, new_due, new_priority,
+                                                    new_tags)
 
         if success:
             updated_task = task_manager_instance.get_task_by_id(task_id)
@@ -189,6 +409,9 @@ def handle_update_task(task_manager_instance):
             print(f"  ID: {updated_task.id}")
             print(f"  Title: {updated_task.title}")
             print(f"  Description: {updated_task.description if updated_task.description else '(No description)'}")
+            print(f"  Due date: {updated_task.due or '(none)'}")
+            print(f"  Priority: {updated_task.priority or '(none)'}")
+            print(f"  Tags: {format_tags(updated_task.tags) or '(none)'}")
             print(f"  Status: {'[x] Complete' if updated_task.completed else '[ ] Incomplete'}")
         else:
             print("Error: Could not update task.")
@@ -205,25 +428,13 @@ def handle_mark_task(task_manager_instance):
     print("\n--- Mark Task as Complete/Incomplete ---")
 
     # Check if there are any tasks
-    tasks = task_manager_instance.get_all_tasks()
-    if not tasks:
+    if task_manager_instance.count_tasks() == 0:
         print("No tasks available to mark. Please add some tasks first.")
         return
 
-    # Display all tasks for reference
-    print("Current tasks:")
-    for task in tasks:
-        status = "[x]" if task.completed else "[ ]"
-        print(f"  {task.id}. {status} {task.title}")
-
-    # Get task ID from user
-    task_id_input = input("\nEnter the task ID to toggle completion status: ").strip()
-
-    # Validate task ID input
-    try:
-        task_id = int(task_id_input)
-    except ValueError:
-        print("Error: Task ID must be a number.")
+    # Display a page of tasks for reference and get task ID from user
+    task_id = prompt_task_id(task_manager_instance, "Enter the task ID to toggle completion status: ")
+    if task_id is None:
         return
 
     # Validate that the task exists
@@ -254,25 +465,13 @@ def handle_delete_task(task_manager_instance):
     print("\n--- Delete Task ---")
 
     # Check if there are any tasks
-    tasks = task_manager_instance.get_all_tasks()
-    if not tasks:
+    if task_manager_instance.count_tasks() == 0:
         print("No tasks available to delete. Please add some tasks first.")
         return
 
-    # Display all tasks for reference
-    print("Current tasks:")
-    for task in tasks:
-        status = "[x]" if task.completed else "[ ]"
-        print(f"  {task.id}. {status} {task.title}")
-
-    # Get task ID from user
-    task_id_input = input("\nEnter the task ID to delete: ").strip()
-
-    # Validate task ID input
-    try:
-        task_id = int(task_id_input)
-    except ValueError:
-        print("Error: Task ID must be a number.")
+    # Display a page of tasks for reference and get task ID from user
+    task_id = prompt_task_id(task_manager_instance, "Enter the task ID to delete: ")
+    if task_id is None:
         return
 
     # Validate that the task exists
@@ -296,54 +495,333 @@ def handle_delete_task(task_manager_instance):
         print("Error: Could not delete task.")
 
 
+def handle_search_tasks(task_manager_instance):
+    """
+    Handle the search tasks workflow.
+    Prompts user for a query and displays the best matching tasks from the full-text index.
+    Words in the query also match longer words they start (e.g. "rep" finds "report").
+    """
+    print("\n--- Search Tasks ---")
+
+    query = input("Enter search words: ").strip()
+    if not query:
+        print("Error: Search query cannot be empty.")
+        return
+
+    results = task_manager_instance.search(query, limit=SEARCH_RESULT_LIMIT)
+
+    if not results:
+        print(f"No tasks match '{query}'.")
+        return
+
+    lines = [f"Top {len(results)} match(es) for '{query}':", "-" * 60]
+    for task in results:
+        lines.append(render_cache.render("list", task, task_block))
+    write_lines(lines)
+
+
+def handle_bulk_add_tasks(task_manager_instance):
+    """
+    Handle the bulk add workflow.
+    Reads one task per line ("title", "title | description" or
+    "title | description | due date | priority | tags") until an empty line,
+    validates every line, then adds them all in a single batch.
+    """
+    print("\n--- Bulk Add Tasks ---")
+    print("Enter one task per line as 'title', 'title | description' or 'title | description | due | priority | tags'.")
+    print("Press Enter on an empty line to finish.")
+
+    items = []
+    while True:
+        line = input(f"Task {len(items) + 1}: ").strip()
+        if not line:
+            break
+
+        title, description, due, priority, tags = (line.split("|", 4) + ["", "", "", ""])[:5]
+        is_valid, error_msg, row = validate_task(title, description, False, due, priority, tags)
+        if not is_valid:
+            print(f"Error on line {len(items) + 1}: {error_msg}. No tasks were added.")
+            return
+
+        items.append(row)
+
+    if not items:
+        print("No tasks entered.")
+        return
+
+    try:
+        task_ids = task_manager_instance.add_tasks(items, validated=True)
+        print(f"Added {len(task_ids)} task(s) with IDs {task_ids[0]}-{task_ids[-1]}.")
+    except ValueError as e:
+        print(f"Error adding tasks: {e}")
+
+
+def prompt_existing_task_ids(task_manager_instance, action):
+    """
+    Ask for task IDs and ranges (e.g. "3-500,712") and keep the ones that exist.
+
+    Args:
+        task_manager_instance: The TaskManager to check IDs against
+        action (str): Verb used in the prompt, e.g. "delete"
+
+    Returns:
+        list: Existing task IDs in input order (empty if none or input was invalid)
+    """
+    text = input(f"Enter task IDs to {action} (e.g. 3-500,712): ").strip()
+
+    is_valid, error_msg, task_ids = parse_id_ranges(text)
+    if not is_valid:
+        print(f"Error: {error_msg}")
+        return []
+
+    existing = [task_id for task_id in task_ids if task_manager_instance.get_task_by_id(task_id) is not None]
+    skipped = len(task_ids) - len(existing)
+    if not existing:
+        print("Error: None of those task IDs exist.")
+    elif skipped:
+        print(f"Note: {skipped} ID(s) do not exist and will be skipped.")
+    return existing
+
+
+def handle_bulk_delete_tasks(task_manager_instance):
+    """
+    Handle the bulk delete workflow.
+    Accepts IDs and ranges, confirms, and deletes all selected tasks in a single batch.
+    """
+    print("\n--- Bulk Delete Tasks ---")
+
+    if task_manager_instance.count_tasks() == 0:
+        print("No tasks available to delete. Please add some tasks first.")
+        return
+
+    task_ids = prompt_existing_task_ids(task_manager_instance, "delete")
+    if not task_ids:
+        return
+
+    confirm = input(f"Are you sure you want to delete {len(task_ids)} task(s)? (y/N): ").strip().lower()
+    if confirm not in ['y', 'yes']:
+        print("Task deletion cancelled.")
+        return
+
+    try:
+        deleted = task_manager_instance.delete_tasks(task_ids)
+        print(f"{deleted} task(s) deleted successfully.")
+    except ValueError as e:
+        print(f"Error deleting tasks: {e}")
+
+
+def handle_bulk_mark_tasks(task_manager_instance):
+    """
+    Handle the bulk mark complete/incomplete workflow.
+    Accepts IDs and ranges and sets the chosen status on all of them in a single batch.
+    """
+    print("\n--- Bulk Mark Tasks as Complete/Incomplete ---")
+
+    if task_manager_instance.count_tasks() == 0:
+        print("No tasks available to mark. Please add some tasks first.")
+        return
+
+    task_ids = prompt_existing_task_ids(task_manager_instance, "mark")
+    if not task_ids:
+        return
+
+    status = input("Mark as (c)omplete or (i)ncomplete? ").strip().lower()
+    if status in ['c', 'complete']:
+        value = True
+    elif status in ['i', 'incomplete']:
+        value = False
+    else:
+        print("Error: Please enter 'c' or 'i'.")
+        return
+
+    try:
+        changed = task_manager_instance.set_completed(task_ids, value)
+        label = "complete" if value else "incomplete"
+        print(f"{changed} task(s) marked as {label} ({len(task_ids) - changed} already were).")
+    except ValueError as e:
+        print(f"Error marking tasks: {e}")
+
+
+def handle_undo(task_manager_instance):
+    """
+    Handle the undo workflow.
+    Reverts the most recent operation and reports what was undone.
+    """
+    print("\n--- Undo ---")
+
+    description = task_manager_instance.undo()
+    if description is None:
+        print("Nothing to undo.")
+    else:
+        print(f"Undone: {description}")
+
+
+def handle_redo(task_manager_instance):
+    """
+    Handle the redo workflow.
+    Re-applies the most recently undone operation and reports what was redone.
+    """
+    print("\n--- Redo ---")
+
+    description = task_manager_instance.redo()
+    if description is None:
+        print("Nothing to redo.")
+    else:
+        print(f"Redone: {description}")
+
+
+def handle_show_metrics(task_manager_instance):
+    """
+    Handle the show metrics workflow.
+    Prints call counts, latencies and gauges recorded so far, and offers to save
+    them as JSON or Prometheus text.
+    """
+    print("\n--- Metrics ---")
+
+    registry = _metrics_registry()
+    if registry is None:
+        print("Metrics are disabled. Start the app with --metrics (or TODO_METRICS=1) to record them.")
+        return
+
+    data = registry.to_dict()
+    lines = [f"Uptime: {data['uptime_seconds']:.0f}s",
+             f"{'Function':<44} {'Calls':>8} {'Errors':>6} {'Mean ms':>9} {'p95 ms':>9}"]
+    for name, stats in data["functions"].items():
+        lines.append(f"{name:<44} {stats['calls']:>8} {stats['errors']:>6} "
+                     f"{stats['mean_seconds'] * 1000:>9.3f} {stats['p95_seconds'] * 1000:>9.3f}")
+    for name, value in data["gauges"].items():
+        lines.append(f"{name}: {value}")
+    write_lines(lines)
+
+    path = input("\nSave to a file (.json for JSON, otherwise Prometheus text; press Enter to skip): ").strip()
+    if path:
+        try:
+            registry.write(path)
+            print(f"Metrics written to {path}")
+        except OSError as e:
+            print(f"Error writing metrics: {e}")
+
+
+def _metrics_registry():
+    """Return the metrics registry, or None if metrics were never enabled (without importing them)."""
+    metrics = sys.modules.get("utils.metrics")
+    return metrics.get_registry() if metrics is not None else None
+
+
 def handle_exit():
     """
-    Implement graceful exit functionality for menu option 6.
+    Implement graceful exit functionality for the Exit menu option.
     """
     print("\nThank you for using the Console Todo App. Goodbye!")
     import sys
     sys.exit(0)
 
 
-def main():
+def main(argv=None):
     """
-    Main application loop with menu-driven interface.
+    Application entry point.
+    Without arguments, runs the interactive menu on local storage. With arguments
+    (e.g. `python main.py add "Buy milk"`, `python main.py batch < commands.txt`
+    or `python main.py --connect 127.0.0.1:8765`), hands over to the command mode.
     """
-    task_manager_instance = TaskManager()
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        from cli import run_cli
+        sys.exit(run_cli(argv, interactive=run_interactive))
+
+    task_manager_instance = create_task_manager()
+    if not METRICS_ENABLED:
+        run_interactive(task_manager_instance)
+        return
 
-    print("Welcome to the Console Todo App!")
+    from utils.metrics import instrument_task_manager
+    registry = instrument_task_manager(task_manager_instance)
+    try:
+        run_interactive(task_manager_instance)
+    finally:
+        if METRICS_FILE:
+            registry.write(METRICS_FILE)
 
-    while True:
-        try:
-            display_menu()
-            choice = get_user_choice()
-
-            if choice is None:
-                continue  # Invalid input, show menu again
-
-            if choice == 1:
-                handle_add_task(task_manager_instance)
-            elif choice == 2:
-                handle_view_tasks(task_manager_instance)
-            elif choice == 3:
-                handle_update_task(task_manager_instance)
-            elif choice == 4:
-                handle_delete_task(task_manager_instance)
-            elif choice == 5:
-                handle_mark_task(task_manager_instance)
-            elif choice == 6:
-                handle_exit()
 
-            # Pause to let user see the result before showing menu again
-            input("\nPress Enter to continue...")
+def run_interactive(task_manager_instance):
+    """
+    Main application loop with menu-driven interface.
+
+    Args:
+        task_manager_instance: The TaskManager (local or remote) to work on;
+            it is closed when the loop ends
+    """
+    print("Welcome to the Console Todo App!")
+    # Versions are only comparable within one task manager
+    render_cache.clear()
 
-        except KeyboardInterrupt:
-            print("\n\nOperation cancelled by user. Exiting...")
-            handle_exit()
-        except Exception as e:
-            print(f"\nAn unexpected error occurred: {e}")
-            print("Please try again or restart the application.")
-            input("\nPress Enter to continue...")
+    if _metrics_registry() is not None:
+        from utils.metrics import instrument_namespace
+        instrument_namespace(globals(), "handle_", "main")
+
+    try:
+        while True:
+            try:
+                display_menu()
+                choice = get_user_choice()
+
+                if choice is None:
+                    continue  # Invalid input, show menu again
+
+                if choice == 1:
+                    handle_add_task(task_manager_instance)
+                elif choice == 2:
+                    handle_view_tasks(task_manager_instance)
+                elif choice == 3:
+                    handle_update_task(task_manager_instance)
+                elif choice == 4:
+                    handle_delete_task(task_manager_instance)
+                elif choice == 5:
+                    handle_mark_task(task_manager_instance)
+                elif choice == 6:
+                    handle_search_tasks(task_manager_instance)
+                elif choice == 7:
+                    handle_bulk_add_tasks(task_manager_instance)
+                elif choice == 8:
+                    handle_bulk_delete_tasks(task_manager_instance)
+                elif choice == 9:
+                    handle_bulk_mark_tasks(task_manager_instance)
+                elif choice == 10:
+                    handle_view_tasks(task_manager_instance, completed=False)
+                elif choice == 11:
+                    handle_view_tasks(task_manager_instance, completed=True)
+                elif choice == 12:
+                    handle_undo(task_manager_instance)
+                elif choice == 13:
+                    handle_redo(task_manager_instance)
+                elif choice == 14:
+                    handle_show_metrics(task_manager_instance)
+                elif choice == 15:
+                    handle_view_next_tasks(task_manager_instance)
+                elif choice == 16:
+                    handle_view_tasks(task_manager_instance, sort="due")
+                elif choice == 17:
+                    handle_view_overdue_tasks(task_manager_instance)
+                elif choice == 18:
+                    handle_statistics(task_manager_instance)
+                elif choice == 19:
+                    handle_view_tasks_by_tag(task_manager_instance)
+                elif choice == EXIT_OPTION:
+                    handle_exit()
+
+                # Pause to let user see the result before showing menu again
+                input("\nPress Enter to continue...")
+
+            except KeyboardInterrupt:
+                print("\n\nOperation cancelled by user. Exiting...")
+                handle_exit()
+            except Exception as e:
+                print(f"\nAn unexpected error occurred: {e}")
+                print("Please try again or restart the application.")
+                input("\nPress Enter to continue...")
+    finally:
+        # Make sure every journaled change reaches disk before the process exits
+        task_manager_instance.close()
 
 
 if __name__ == "__main__":
@@ -1,7 +1,54 @@
-from dataclasses import dataclass
+from typing import Optional, Tuple
+from utils.validation import validate_task
+
+
+class _Unchanged:
+    """Type of UNCHANGED; pickles by reference so the marker survives process boundaries."""
+    __slots__ = ()
+
+    def __repr__(self):
+        return "UNCHANGED"
+
+    def __reduce__(self):
+        return "UNCHANGED"
+
+
+# Default for update arguments whose None value is meaningful (due=None clears the due date)
+UNCHANGED = _Unchanged()
+
+
+def format_schedule(due, priority) -> str:
+    """
+    Describe a task's priority and due date for display, e.g. "P1, due 2026-03-01".
+
+    Args:
+        due (str or None): The due date
+        priority (int or None): The priority
+
+    Returns:
+        str: The description ("" if neither is set)
+    """
+    parts = []
+    if priority is not None:
+        parts.append(f"P{priority}")
+    if due is not None:
+        parts.append(f"due {due}")
+    return ", ".join(parts)
+
+
+def format_tags(tags) -> str:
+    """
+    Describe a task's tags for display, e.g. "#home #work".
+
+    Args:
+        tags (tuple): The tags
+
+    Returns:
+        str: The description ("" if there are none)
+    """
+    return " ".join(f"#{tag}" for tag in tags)
 
 
-@dataclass
 class Task:
     """
     Represents a single todo item with the following attributes:
@@ -9,33 +56,165 @@ class Task:
     - title: str (required, non-empty, max 200 chars)
     - description: str (optional, can be empty, max 1000 chars)
     - completed: bool (default: False)
+    - due: str (optional "YYYY-MM-DD" due date, default: None)
+    - priority: int (optional, 1 = most urgent to 5, default: None)
+    - tags: tuple of str (sorted, lowercase and distinct, default: ()); tags also
+      serve as projects, e.g. "project:website"
+
+    The version attribute is a revision stamp, not task data: TaskManager sets
+    it to a new, ever-increasing number whenever it stores or changes the
+    task, so (id, version) identifies one state of a task for caches such as
+    the menu's render cache. It is 0 for tasks unchanged since they were
+    loaded, and it is not persisted or compared.
+
+    Instances use __slots__ instead of a per-instance __dict__, which keeps
+    large task lists compact. Data that has already been validated (e.g. read
+    back from storage) should be wrapped with Task.trusted(), which skips the
+    checks in __init__.
+
+    The class is written out by hand rather than generated with @dataclass:
+    importing dataclasses (and the inspect module it pulls in) was the
+    largest single cost of starting the app.
     """
-    id: int
-    title: str
-    description: str = ""
-    completed: bool = False
+    __slots__ = ("id", "title", "description", "completed", "due", "priority", "tags", "version")
+    __match_args__ = ("id", "title", "description", "completed", "due", "priority", "tags")
+
+    def __init__(self, id: int, title: str, description: str = "", completed: bool = False,
+                 due: Optional[str] = None, priority: Optional[int] = None, tags=()):
+        """
+        Create a task, validating every attribute.
 
-    def __post_init__(self):
+        Args:
+            id (int): The task ID
+            title (str): The task title
+            description (str): The task description
+            completed (bool): The completion status
+            due (str, optional): The due date as "YYYY-MM-DD"
+            priority (int, optional): The priority, 1 (most urgent) to 5
+            tags (iterable of str): The tags; stored normalized (see validate_tags)
+        """
+        self.id = id
+        self.title = title
+        self.description = description
+        self.completed = completed
+        self.due = due
+        self.priority = priority
+        self.tags = tags
+        self.version = 0
+        self._validate()
+
+    def _validate(self):
         """Validate the task attributes after initialization."""
         if not isinstance(self.id, int) or self.id <= 0:
             raise ValueError("ID must be a positive integer")
-        
-        if not isinstance(self.title, str) or not self.title.strip():
-            raise ValueError("Title must be a non-empty string")
-        
-        if len(self.title) > 200:
-            raise ValueError("Title must not exceed 200 characters")
-        
-        if not isinstance(self.description, str):
-            raise ValueError("Description must be a string")
-        
-        if len(self.description) > 1000:
-            raise ValueError("Description must not exceed 1000 characters")
-        
-        if not isinstance(self.completed, bool):
-            raise ValueError("Completed must be a boolean value")
-    
+
+        is_valid, error_msg, row = validate_task(self.title, self.description, self.completed,
+                                                 self.due, self.priority, self.tags)
+        if not is_valid:
+            raise ValueError(error_msg)
+        if row[3] != self.due:
+            raise ValueError("Due date must be a string in YYYY-MM-DD format")
+        if row[4] != self.priority:
+            raise ValueError("Priority must be an integer")
+        self.tags = row[5]
+
+    @classmethod
+    def trusted(cls, id: int, title: str, description: str = "", completed: bool = False,
+                due: Optional[str] = None, priority: Optional[int] = None, tags: Tuple[str, ...] = (),
+                version: int = 0) -> "Task":
+        """
+        Build a Task from already-validated data without re-running the checks.
+
+        Args:
+            id (int): The task ID
+            title (str): The task title
+            description (str): The task description
+            completed (bool): The completion status
+            due (str, optional): The due date as "YYYY-MM-DD"
+            priority (int, optional): The priority
+            tags (tuple): The tags, already sorted, lowercase and distinct
+            version (int): The revision stamp
+
+        Returns:
+            Task: The new task
+        """
+        task = object.__new__(cls)
+        task.id = id
+        task.title = title
+        task.description = description
+        task.completed = completed
+        task.due = due
+        task.priority = priority
+        task.tags = tags
+        task.version = version
+        return task
+
+    def copy(self) -> "Task":
+        """
+        Return a separate Task with the same attributes, version included.
+
+        Returns:
+            Task: The copy
+        """
+        return Task.trusted(self.id, self.title, self.description, self.completed, self.due, self.priority,
+                            self.tags, self.version)
+
+    def __repr__(self):
+        """Return a constructor-style representation of the task."""
+        return (f"Task(id={self.id!r}, title={self.title!r}, description={self.description!r}, "
+                f"completed={self.completed!r}, due={self.due!r}, priority={self.priority!r}, "
+                f"tags={self.tags!r})")
+
+    def __eq__(self, other):
+        """Compare two tasks attribute by attribute."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return ((self.id, self.title, self.description, self.completed, self.due, self.priority, self.tags)
+                == (other.id, other.title, other.description, other.completed, other.due, other.priority,
+                    other.tags))
+
+    __hash__ = None  # Tasks are mutable
+
+    def to_dict(self) -> dict:
+        """Return the task as a plain dict suitable for JSON output."""
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "completed": self.completed,
+            "due": self.due,
+            "priority": self.priority,
+            "tags": list(self.tags),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Task":
+        """
+        Build a validated Task from a dict produced by to_dict().
+
+        Args:
+            data (dict): Task fields, plus an optional "version" revision stamp
+
+        Returns:
+            Task: The new task
+        """
+        task = cls(
+            id=data["id"],
+            title=data["title"],
+            description=data.get("description", ""),
+            completed=data.get("completed", False),
+            due=data.get("due"),
+            priority=data.get("priority"),
+            tags=data.get("tags") or (),
+        )
+        task.version = data.get("version", 0)
+        return task
+
     def __str__(self):
         """Return a string representation of the task for display."""
         status = "[x]" if self.completed else "[ ]"
-        return f"{self.id}. {status} {self.title} - {self.description if self.description else '(No description)'}"
\ No newline at end of file
+        schedule = format_schedule(self.due, self.priority)
+        text = f"{self.id}. {status} {self.title} - {self.description if self.description else '(No description)'}"
+        if schedule:
+            text = f"{text} ({schedule})"
+        return f"{text} {format_tags(self.tags)}" if self.tags else text
\ No newline at end of file
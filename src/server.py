@@ -0,0 +1,244 @@
+"""
+Asyncio socket server for the Console Todo App.
+
+Exposes one TaskManager to many clients over TCP or a Unix socket using a
+line-delimited JSON protocol. Each request is one JSON object per line, with
+an optional "req" value that the response echoes:
+
+    {"req": 7, "op": "add", "title": "Buy milk", "description": ""}
+    {"req": 8, "op": "get", "id": 9}
+
+    {"req": 7, "ok": true, "result": {"id": 42}}
+    {"req": 8, "ok": false, "code": "not_found", "error": "Task with ID 9 does not exist"}
+
+The operations are the ones cli.execute_command() accepts. Clients may
+pipeline: they can send many requests without waiting, and responses come
+back in request order on each connection.
+"""
+import asyncio
+import json
+import logging
+import os
+from typing import Optional
+from cli import CommandError, execute_command
+from config import SERVER_HOST, SERVER_PORT, SERVER_MAX_INFLIGHT, SERVER_MAX_BATCH
+
+
+logger = logging.getLogger(__name__)
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+# Longest accepted request line in bytes
+MAX_LINE_BYTES = 1 << 20
+
+# Operations that only read, still served after storing a batch has failed
+READ_OPS = frozenset({"get", "count", "tags", "stats", "list", "next", "overdue", "search", "changes", "metrics"})
+
+
+class TaskServer:
+    """
+    Serves a TaskManager to many concurrent clients.
+
+    - Pipelining: every connection has a reader that keeps accepting requests
+      and a responder that writes results in order as they complete.
+    - Write batching: requests from all connections go through one queue. A
+      single applier drains up to max_batch requests at a time and runs them
+      inside TaskManager.batch(), so a burst of small writes becomes one
+      journal record and at most one fsync.
+    - Storage failures: TaskManager.batch() does not roll back, so if storing a
+      batch fails, its requests are still answered with what they did in
+      memory. From then on the server answers writes with a "read_only" error,
+      so memory and storage drift no further apart, and keeps serving reads
+      until it is restarted from what was stored.
+    - Backpressure: a connection may have at most max_inflight unanswered
+      requests. When that window is full, its reader stops reading, and TCP
+      flow control then slows the client down. Responses wait for the socket
+      to drain, so slow readers cannot make the server buffer without limit.
+    """
+
+    def __init__(self, task_manager, max_inflight: int = SERVER_MAX_INFLIGHT,
+                 max_batch: int = SERVER_MAX_BATCH):
+        """
+        Args:
+            task_manager: The TaskManager to serve (used only from the event loop)
+            max_inflight (int): Unanswered requests allowed per connection
+            max_batch (int): Requests applied together in one storage batch
+        """
+        self.task_manager = task_manager
+        self.max_inflight = max_inflight
+        self.max_batch = max_batch
+        self.requests_served = 0
+        self.connections = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._applier: Optional[asyncio.Task] = None
+        self._storage_error: Optional[Exception] = None  # Why writes are refused, once a batch failed
+
+    async def start(self, host: Optional[str] = None, port: Optional[int] = None,
+                    unix_path: Optional[str] = None):
+        """
+        Start listening and start the request applier.
+
+        Args:
+            host (str, optional): TCP host (defaults to SERVER_HOST)
+            port (int, optional): TCP port (defaults to SERVER_PORT; 0 picks a free port)
+            unix_path (str, optional): Listen on this Unix socket path instead of TCP
+
+        Returns:
+            asyncio.AbstractServer: The listening server
+        """
+        self._queue = asyncio.Queue(maxsize=self.max_batch * 4)
+        self._applier = asyncio.create_task(self._apply_requests())
+
+        if unix_path:
+            if os.path.exists(unix_path):
+                os.unlink(unix_path)
+            return await asyncio.start_unix_server(self._handle_connection, path=unix_path,
+                                                   limit=MAX_LINE_BYTES)
+        return await asyncio.start_server(
+            self._handle_connection,
+            host or SERVER_HOST,
+            SERVER_PORT if port is None else port,
+            limit=MAX_LINE_BYTES,
+        )
+
+    async def stop(self) -> None:
+        """Stop the applier once every queued request has been handled."""
+        if self._applier is not None:
+            await self._queue.join()
+            self._applier.cancel()
+            try:
+                await self._applier
+            except asyncio.CancelledError:
+                pass
+            self._applier = None
+
+    def _execute(self, command) -> dict:
+        """Run one decoded request and build its response body."""
+        if not isinstance(command, dict):
+            return {"ok": False, "code": "invalid", "error": "Requests must be JSON objects"}
+        if self._storage_error is not None and command.get("op") not in READ_OPS:
+            return {"ok": False, "code": "read_only",
+                    "error": f"Writes are disabled after a storage failure: {self._storage_error}"}
+        try:
+            return {"ok": True, "result": execute_command(self.task_manager, command)}
+        except CommandError as e:
+            return {"ok": False, "code": e.code, "error": str(e)}
+        except Exception as e:  # Keep serving other clients whatever one request does
+            return {"ok": False, "code": "internal", "error": f"Internal error: {e}"}
+
+    async def _apply_requests(self) -> None:
+        """Apply queued requests in arrival order, a batch at a time."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            responses = None
+            try:
+                with self.task_manager.batch():
+                    responses = [self._execute(command) for command, _ in batch]
+            except Exception as e:  # The batch could not be stored; its changes stay applied in memory
+                logger.exception("Failed to store a batch of %d request(s); refusing writes from now on",
+                                 len(batch))
+                if self._storage_error is None:
+                    self._storage_error = e
+                if responses is None:  # Failed before any request ran
+                    responses = [{"ok": False, "code": "internal", "error": f"Internal error: {e}"}
+                                 for _ in batch]
+            for (_, future), response in zip(batch, responses):
+                if not future.done():
+                    future.set_result(response)
+            self.requests_served += len(batch)
+            for _ in batch:
+                queue.task_done()
+
+            # Let connection readers and responders run between batches
+            await asyncio.sleep(0)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Read pipelined requests from one client and queue them for the applier."""
+        loop = asyncio.get_running_loop()
+        in_flight: asyncio.Queue = asyncio.Queue(maxsize=self.max_inflight)
+        responder = asyncio.create_task(self._write_responses(in_flight, writer))
+        self.connections += 1
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):
+                    break  # Over-long line or dropped connection
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+
+                future = loop.create_future()
+                try:
+                    command = json.loads(line)
+                except ValueError as e:
+                    future.set_result({"ok": False, "code": "invalid", "error": f"Invalid JSON: {e}"})
+                    await in_flight.put((None, future))
+                    continue
+
+                request_id = command.get("req") if isinstance(command, dict) else None
+                await in_flight.put((request_id, future))  # Blocks while the window is full
+                await self._queue.put((command, future))
+        finally:
+            self.connections -= 1
+            await in_flight.put(None)
+            await responder
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    async def _write_responses(in_flight: asyncio.Queue, writer: asyncio.StreamWriter) -> None:
+        """Write responses in request order, draining the socket between bursts."""
+        broken = False
+        while True:
+            item = await in_flight.get()
+            if item is None:
+                return
+            request_id, future = item
+            response = await future
+            if broken:
+                continue
+            response["req"] = request_id
+            writer.write(_encode(response).encode("utf-8") + b"\n")
+            if in_flight.empty():
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    broken = True
+
+
+def serve_forever(task_manager, host: Optional[str] = None, port: Optional[int] = None,
+                  unix_path: Optional[str] = None) -> None:
+    """
+    Run a TaskServer until the process is interrupted.
+
+    Args:
+        task_manager: The TaskManager to serve
+        host (str, optional): TCP host (defaults to SERVER_HOST)
+        port (int, optional): TCP port (defaults to SERVER_PORT)
+        unix_path (str, optional): Unix socket path to listen on instead of TCP
+    """
+    async def run():
+        server = TaskServer(task_manager)
+        listener = await server.start(host, port, unix_path)
+        addresses = ", ".join(str(sock.getsockname()) for sock in listener.sockets)
+        print(f"Serving {task_manager.count_tasks()} task(s) on {addresses}. Press Ctrl+C to stop.")
+        try:
+            async with listener:
+                await listener.serve_forever()
+        finally:
+            await server.stop()
+
+    asyncio.run(run())
@@ -0,0 +1,878 @@
+"""
+Multi-process sharded TaskManager for the Console Todo App.
+Spreads tasks over several worker processes, each owning a TaskManager and its
+own storage, behind the same interface as TaskManager.
+"""
+import heapq
+import multiprocessing
+import os
+import signal
+from collections import deque
+from contextlib import contextmanager
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from change_feed import ChangeEvent, ChangeFeed, ChangeFeedGap, Subscription
+from config import DATA_DIR, PAGE_SIZE
+from indexes.heap_index import ORDER_KEYS, due_key
+from models.task import UNCHANGED, Task
+from storage.backends import create_storage_backend
+from storage.columnar import write_snapshot
+from task_manager import TaskManager
+from utils.validation import validate_task, validate_task_batch, validate_task_changes_batch
+
+
+# Tasks fetched from each shard at a time while merging a listing
+SHARD_PAGE_SIZE = 1000
+
+# Operations remembered for undo/redo (each shard also bounds its own history)
+HISTORY_LIMIT = 100_000
+
+
+def _rows(tasks: Iterable[Task]) -> List[tuple]:
+    """Flatten tasks to (id, title, description, completed, due, priority, tags, version) rows, which pickle faster."""
+    return [(task.id, task.title, task.description, task.completed, task.due, task.priority, task.tags,
+             task.version) for task in tasks]
+
+
+def _insert(manager: TaskManager, rows: List[tuple]) -> None:
+    """Shard op: add validated tasks under IDs allocated by the coordinator."""
+    with manager._bulk():
+        for task_id, title, description, completed, due, priority, tags in rows:
+            manager._insert(Task.trusted(task_id, title, description, completed, due, priority, tags))
+            manager._next_id = max(manager._next_id, task_id + 1)
+
+
+def _update(manager: TaskManager, rows: List[tuple]) -> None:
+    """Shard op: apply validated (task ID, title, description, due, priority, tags) updates to existing tasks."""
+    with manager._bulk():
+        for task_id, *changes in rows:
+            manager._apply_update(manager._tasks[task_id], *changes)
+
+
+def _page(manager: TaskManager, offset: int, limit: Optional[int], completed: Optional[bool],
+          sort: Optional[str] = None, tags: Optional[str] = None) -> List[tuple]:
+    """Shard op: one page of task rows in insertion order (or in a sort order)."""
+    return _rows(manager.iter_tasks(offset, limit, completed=completed, sort=sort, tags=tags))
+
+
+def _overdue_page(manager: TaskManager, offset: int, limit: Optional[int], today: str) -> List[tuple]:
+    """Shard op: one page of overdue task rows, earliest due date first."""
+    return _rows(manager.overdue_tasks(offset, limit, today))
+
+
+def _missing(manager: TaskManager, task_ids: List[int]) -> List[int]:
+    """Shard op: the given IDs that do not exist on this shard."""
+    return [task_id for task_id in task_ids if manager.get_task_by_id(task_id) is None]
+
+
+def _search_scored(manager: TaskManager, query: str, limit: int, prefix: bool) -> List[Tuple[float, tuple]]:
+    """Shard op: ranked search results as (score, task row) pairs."""
+    ranked = manager._search_ranked(query, limit, prefix)
+    rows = _rows(manager.get_task_by_id(task_id) for task_id, _ in ranked)
+    return [(score, row) for (_, score), row in zip(ranked, rows)]
+
+
+def _statistics_counts(manager: TaskManager, today: str):
+    """Shard op: the shard's mergeable statistics counts."""
+    return manager._statistics_counts(today)
+
+
+def _changes_since(manager: TaskManager, since: Optional[int]) -> Tuple[Optional[List[tuple]], int]:
+    """
+    Shard op: the raw changes after a sequence number of the shard's change feed, and its last sequence number.
+
+    The changes are None if they are no longer retained, and empty if since is None
+    (which starts the feed).
+    """
+    feed = manager._change_feed()
+    if since is None:
+        return [], feed.last_seq
+    try:
+        return feed.read_changes(since), feed.last_seq
+    except ChangeFeedGap as e:
+        return None, e.last_seq
+
+
+def _begin_batch(manager: TaskManager) -> None:
+    """Shard op: open a storage batch."""
+    manager._storage.begin_batch()
+
+
+def _end_batch(manager: TaskManager) -> None:
+    """Shard op: close a storage batch."""
+    manager._storage.end_batch()
+    manager._maybe_compact()
+
+
+def _row_id(row: tuple) -> int:
+    """Merge key of a task row."""
+    return row[0]
+
+
+def _from_row(row: tuple) -> Task:
+    """Rebuild a task from a row produced by a shard."""
+    return Task.trusted(*row)
+
+
+# Operations a shard understands besides TaskManager's public methods
+_SHARD_OPS: Dict[str, Callable] = {
+    "insert": _insert,
+    "update": _update,
+    "page": _page,
+    "overdue_page": _overdue_page,
+    "missing": _missing,
+    "search_scored": _search_scored,
+    "statistics_counts": _statistics_counts,
+    "changes_since": _changes_since,
+    "begin_batch": _begin_batch,
+    "end_batch": _end_batch,
+}
+
+
+def _serve_shard(conn, storage_name: Optional[str], directory: str) -> None:
+    """
+    Worker process main loop: run (op, args) requests against one TaskManager.
+
+    Every request gets exactly one (ok, value, history state) reply, the last
+    part being the shard's OperationHistory.state(); exceptions are sent back
+    to the coordinator instead of ending the loop.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # Ctrl+C is handled by the coordinator, which closes us
+    manager = TaskManager(create_storage_backend(storage_name, directory))
+    try:
+        while True:
+            try:
+                op, args = conn.recv()
+            except EOFError:
+                return  # Coordinator went away
+            if op == "close":
+                manager.close()
+                conn.send((True, None, manager._history.state()))
+                return
+            try:
+                handler = _SHARD_OPS.get(op)
+                result = handler(manager, *args) if handler else getattr(manager, op)(*args)
+                conn.send((True, result, manager._history.state()))
+            except Exception as e:
+                conn.send((False, e, manager._history.state()))
+    finally:
+        manager.close()
+        conn.close()
+
+
+class ShardedTaskManager:
+    """
+    TaskManager interface over N worker processes.
+
+    - Task IDs come from one allocator in this (coordinating) process and
+      task ID k lives on shard k % N, so single-task calls go to one shard.
+    - Listings, counts and searches are sent to every shard at once, run in
+      parallel, and their results merged: listings by ID (IDs grow in
+      insertion order) or by sort key, searches by score. Search scores use per-shard term
+      statistics, so rankings can differ slightly from a single TaskManager.
+    - Bulk operations are validated here first, then split by shard and
+      applied in parallel, so they stay all-or-nothing.
+    - Each shard persists to its own directory (shard-K-of-N under the data
+      directory); reopening with the same shard count restores the tasks.
+    - Undo and redo follow an operation list kept here, each operation naming
+      the position it got in the history of every shard it changed. Shards
+      report their history with every reply, so an operation a shard no
+      longer holds (evicted to stay within its HISTORY_MEMORY_BUDGET) is
+      detected, and it and everything older are forgotten rather than undone
+      on only some shards.
+    - Once anyone subscribes to the change feed, every operation also fetches
+      the changes it made from the shards it touched and publishes them here,
+      in operation order, one operation's changes grouped by shard (one extra
+      round trip per operation).
+
+    Tasks returned are copies; change them through the manager's methods.
+    Like TaskManager, an instance must be used from one thread at a time.
+    """
+
+    def __init__(self, shards: int, storage_name: Optional[str] = None,
+                 data_dir: Optional[str] = None):
+        """
+        Start the shard processes and restore their state.
+
+        Args:
+            shards (int): Number of worker processes (at least 1)
+            storage_name (str, optional): Storage backend for every shard (see create_storage_backend)
+            data_dir (str, optional): Parent directory of the shard directories (defaults to DATA_DIR)
+        """
+        if shards < 1:
+            raise ValueError("Shard count must be at least 1")
+
+        context = multiprocessing.get_context()
+        self._connections = []
+        self._processes = []
+        self._shard_history = [(0, None, None)] * shards  # Last reported OperationHistory.state() per shard
+        self._recorded = [0] * shards  # Operations of each shard's history accounted for in self._undo
+        for shard in range(shards):
+            parent_end, child_end = context.Pipe()
+            directory = os.path.join(data_dir or DATA_DIR, f"shard-{shard}-of-{shards}")
+            process = context.Process(target=_serve_shard, args=(child_end, storage_name, directory),
+                                      name=f"task-shard-{shard}", daemon=True)
+            process.start()
+            child_end.close()
+            self._connections.append(parent_end)
+            self._processes.append(process)
+
+        self._next_id = max(self._fan_out("get_next_id"))
+        # (description, {shard number: serial number in that shard's history}) per operation
+        self._undo: deque = deque(maxlen=HISTORY_LIMIT)
+        self._redo: List[Tuple[str, Dict[int, int]]] = []
+        self._feed: Optional[ChangeFeed] = None  # Created by the first subscriber
+        self._shard_seqs: List[int] = []  # Last change of each shard's feed published here
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # Shard communication
+    # ------------------------------------------------------------------
+
+    @property
+    def shard_count(self) -> int:
+        """Number of shard processes."""
+        return len(self._connections)
+
+    def _shard_of(self, task_id: int) -> int:
+        """Return the shard that owns a task ID."""
+        return task_id % len(self._connections)
+
+    def _call(self, shard: int, op: str, *args):
+        """Run one op on one shard and return its result."""
+        return self._fan_out(op, {shard: args})[0]
+
+    def _fan_out(self, op: str, args_by_shard: Optional[Dict[int, tuple]] = None) -> list:
+        """
+        Send an op to several shards at once and collect the results.
+
+        Args:
+            op (str): Shard op or TaskManager method name
+            args_by_shard (dict, optional): Arguments per shard number; every shard with
+                no arguments if omitted
+
+        Returns:
+            list: The results, in the order of args_by_shard
+        """
+        if args_by_shard is None:
+            args_by_shard = {shard: () for shard in range(len(self._connections))}
+
+        for shard, args in args_by_shard.items():
+            self._connections[shard].send((op, args))
+
+        results = []
+        error = None
+        for shard in args_by_shard:
+            ok, value, history = self._connections[shard].recv()  # Read every reply to keep the pipes in step
+            self._shard_history[shard] = history
+            if ok:
+                results.append(value)
+            elif error is None:
+                error = value
+        if error is not None:
+            raise error
+        return results
+
+    def _group(self, task_ids: Iterable[int]) -> Dict[int, List[int]]:
+        """Split task IDs by owning shard, keeping their order."""
+        groups: Dict[int, List[int]] = {}
+        for task_id in task_ids:
+            groups.setdefault(self._shard_of(task_id), []).append(task_id)
+        return groups
+
+    def _require_all(self, task_ids: List[int]) -> None:
+        """Raise ValueError naming the first ID (in input order) that does not exist."""
+        invalid = {task_id for task_id in task_ids if not isinstance(task_id, int) or task_id <= 0}
+        groups = self._group(task_id for task_id in task_ids if task_id not in invalid)
+        missing = invalid.union(*self._fan_out("missing", {
+            shard: (ids,) for shard, ids in groups.items()
+        })) if groups else invalid
+        for task_id in task_ids:
+            if task_id in missing:
+                raise ValueError(f"Task with ID {task_id} does not exist")
+
+    def _remember(self, description: str, shards: Iterable[int]) -> None:
+        """
+        Record an operation for undo; this discards everything that could be redone.
+
+        Only the shards whose history recorded the operation take part in it.
+        If one of them could not keep it (it was larger than the shard's whole
+        history budget), the operation and everything before it can no longer
+        be undone in order, so they are forgotten.
+        """
+        serials = {}
+        kept = True
+        for shard in sorted(set(shards)):
+            recorded, undo_serial, _ = self._shard_history[shard]
+            if recorded == self._recorded[shard]:
+                continue  # Nothing changed on this shard
+            kept = kept and recorded == self._recorded[shard] + 1 and undo_serial == recorded
+            serials[shard] = self._recorded[shard] = recorded
+        if not serials:
+            return
+        self._redo.clear()
+        if kept:
+            self._undo.append((description, serials))
+        else:
+            self._undo.clear()
+        self._pull_changes(list(serials))
+
+    def _replay(self, op: str, operation: Tuple[str, Dict[int, int]]) -> bool:
+        """
+        Undo or redo a remembered operation on every shard it changed, all or nothing.
+
+        Args:
+            op (str): "undo" or "redo"
+            operation (tuple): The operation, from self._undo or self._redo
+
+        Returns:
+            bool: True if it was replayed; False, forgetting the whole history,
+                if some shard's history no longer has it next in line
+        """
+        position = 1 if op == "undo" else 2
+        serials = operation[1]
+        if any(self._shard_history[shard][position] != serial for shard, serial in serials.items()):
+            self._undo.clear()
+            self._redo.clear()
+            return False
+        self._fan_out(op, {shard: () for shard in serials})
+        self._pull_changes(list(serials))
+        return True
+
+    def _change_feed(self) -> ChangeFeed:
+        """Return the change feed, starting every shard's feed on first use."""
+        if self._feed is None:
+            self._shard_seqs = [last_seq for _, last_seq in self._fan_out("changes_since", {
+                shard: (None,) for shard in range(len(self._connections))
+            })]
+            self._feed = ChangeFeed()
+        return self._feed
+
+    def _pull_changes(self, shards: List[int]) -> None:
+        """Publish the changes an operation just made on the given shards."""
+        if self._feed is None:
+            return
+        results = self._fan_out("changes_since", {shard: (self._shard_seqs[shard],) for shard in shards})
+        for shard, (changes, last_seq) in zip(shards, results):
+            if changes is None:
+                self._feed.skip(last_seq - self._shard_seqs[shard])
+            else:
+                for change in changes:
+                    self._feed.publish(change)
+            self._shard_seqs[shard] = last_seq
+
+    # ------------------------------------------------------------------
+    # TaskManager interface
+    # ------------------------------------------------------------------
+
+    @property
+    def tasks(self) -> List[Task]:
+        """All stored tasks in insertion order."""
+        return self.get_all_tasks()
+
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+        return self.count_tasks()
+
+    def add_task(self, title: str, description: str = "", due: Optional[str] = None,
+                 priority: Optional[int] = None, tags=()) -> int:
+        """
+        Add a new task.
+
+        Args:
+            title (str): The task title (required, non-empty)
+            description (str): The task description (optional)
+            due (str, optional): Due date as "YYYY-MM-DD"
+            priority (int, optional): Priority from 1 (most urgent) to 5
+            tags (str or list, optional): Tags such as ["work", "project:website"]
+
+        Returns:
+            int: The ID of the newly created task
+        """
+        is_valid, error_msg, row = validate_task(title, description, False, due, priority, tags)
+        if not is_valid:
+            raise ValueError(error_msg)
+
+        task_id = self._next_id
+        self._next_id += 1
+        shard = self._shard_of(task_id)
+        self._call(shard, "insert", [(task_id, *row)])
+        self._remember(f"Add task {task_id}", [shard])
+        return task_id
+
+    def get_all_tasks(self) -> List[Task]:
+        """
+        Retrieve all tasks, merged from every shard in insertion order.
+
+        Returns:
+            List[Task]: A list of all tasks
+        """
+        pages = self._fan_out("page", {shard: (0, None, None) for shard in range(len(self._connections))})
+        return list(map(_from_row, heapq.merge(*pages, key=_row_id)))
+
+    def iter_tasks(self, offset: int = 0, limit: Optional[int] = None,
+                   predicate: Optional[Callable[[Task], bool]] = None,
+                   completed: Optional[bool] = None, sort: Optional[str] = None,
+                   tags: Optional[str] = None) -> Iterator[Task]:
+        """
+        Iterate tasks in insertion order, merging pages fetched from every shard.
+
+        Args:
+            offset (int): Number of (matching) tasks to skip
+            limit (int, optional): Maximum number of tasks to yield (all if None)
+            predicate (callable, optional): Only tasks for which predicate(task) is true
+            completed (bool, optional): Only completed (True) or pending (False) tasks
+            sort (str, optional): "priority" or "due" (insertion order if None);
+                see TaskManager.iter_tasks()
+            tags (str, optional): Only tasks matching this tag query, e.g. "work and not someday"
+
+        Returns:
+            Iterator[Task]: The selected tasks
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("Offset and limit must not be negative")
+        if sort is not None and sort not in ORDER_KEYS:
+            raise ValueError(f"Sort order must be one of: {', '.join(ORDER_KEYS)}")
+        if limit == 0:
+            return iter(())
+
+        # Without a predicate no shard can contribute more than offset + limit tasks
+        page_size = SHARD_PAGE_SIZE
+        if predicate is None and limit is not None:
+            page_size = min(page_size, offset + limit)
+        tasks = self._merged("page", page_size, ORDER_KEYS.get(sort), completed, sort, tags)
+        if predicate is not None:
+            tasks = (task for task in tasks if predicate(task))
+        stop = None if limit is None else offset + limit
+        return islice(tasks, offset, stop)
+
+    def _merged(self, op: str, page_size: int, key: Optional[Callable[[Task], int]], *args) -> Iterator[Task]:
+        """
+        Merge the pages a paging op returns on every shard into one task stream.
+
+        Args:
+            op (str): Shard op taking (offset, limit, *args) and returning rows
+            page_size (int): Rows fetched from a shard at a time
+            key (callable, optional): Sort key the shards order tasks by (task ID if None)
+            *args: Further op arguments
+
+        Returns:
+            Iterator[Task]: The tasks of every shard, in key order
+        """
+        first_pages = self._fan_out(op, {
+            shard: (0, page_size, *args) for shard in range(len(self._connections))
+        })
+        streams = [self._shard_stream(shard, page, page_size, op, args)
+                   for shard, page in enumerate(first_pages)]
+        if key is None:
+            return map(_from_row, heapq.merge(*streams, key=_row_id))
+        return heapq.merge(*(map(_from_row, stream) for stream in streams), key=key)
+
+    def _shard_stream(self, shard: int, page: List[tuple], page_size: int,
+                      op: str, args: tuple) -> Iterator[tuple]:
+        """Yield one shard's task rows, fetching further pages on demand."""
+        position = 0
+        while page:
+            yield from page
+            position += len(page)
+            if len(page) < page_size:
+                return
+            page = self._call(shard, op, position, page_size, *args)
+
+    def count_tasks(self, completed: Optional[bool] = None, tags: Optional[str] = None) -> int:
+        """
+        Count stored tasks across all shards.
+
+        Args:
+            completed (bool, optional): Count only completed (True) or pending (False) tasks
+            tags (str, optional): Count only tasks matching this tag query
+
+        Returns:
+            int: The number of tasks
+        """
+        return sum(self._fan_out("count_tasks", {
+            shard: (completed, tags) for shard in range(len(self._connections))
+        }))
+
+    def tag_counts(self) -> Dict[str, int]:
+        """
+        Count the tasks carrying each tag, summed over every shard.
+
+        Returns:
+            Dict[str, int]: Task counts by tag, in tag order
+        """
+        totals: Dict[str, int] = {}
+        for counts in self._fan_out("tag_counts"):
+            for tag, count in counts.items():
+                totals[tag] = totals.get(tag, 0) + count
+        return dict(sorted(totals.items()))
+
+    def next_tasks(self, limit: int = PAGE_SIZE) -> List[Task]:
+        """
+        Return the pending tasks to work on next; see TaskManager.next_tasks().
+
+        Args:
+            limit (int): Maximum number of tasks to return
+
+        Returns:
+            List[Task]: Up to limit pending tasks, most urgent first
+        """
+        return list(self.iter_tasks(limit=limit, completed=False, sort="priority"))
+
+    def overdue_tasks(self, offset: int = 0, limit: Optional[int] = None,
+                      today: Optional[str] = None) -> List[Task]:
+        """
+        Return overdue pending tasks from every shard, merged by due date.
+
+        Args:
+            offset (int): Number of overdue tasks to skip
+            limit (int, optional): Maximum number of tasks to return (all if None)
+            today (str, optional): Reference date as "YYYY-MM-DD" (the current date if None)
+
+        Returns:
+            List[Task]: The overdue tasks, earliest due date first
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("Offset and limit must not be negative")
+        if limit == 0:
+            return []
+        page_size = SHARD_PAGE_SIZE if limit is None else min(SHARD_PAGE_SIZE, offset + limit)
+        tasks = self._merged("overdue_page", page_size, due_key, TaskManager._check_today(today))
+        return list(islice(tasks, offset, None if limit is None else offset + limit))
+
+    def count_overdue(self, today: Optional[str] = None) -> int:
+        """
+        Count overdue pending tasks across all shards.
+
+        Args:
+            today (str, optional): Reference date as "YYYY-MM-DD" (the current date if None)
+
+        Returns:
+            int: The number of overdue tasks
+        """
+        today = TaskManager._check_today(today)  # Fixed once, so every shard uses the same date
+        return sum(self._fan_out("count_overdue", {
+            shard: (today,) for shard in range(len(self._connections))
+        }))
+
+    def statistics(self, today: Optional[str] = None) -> dict:
+        """
+        Summary statistics over every shard; see TaskManager.statistics().
+
+        Each shard aggregates its own tasks in parallel and the additive
+        counts are merged here.
+
+        Args:
+            today (str, optional): Reference date for overdue tasks (the current date if None)
+
+        Returns:
+            dict: The statistics
+        """
+        today = TaskManager._check_today(today)
+        shard_counts = self._fan_out("statistics_counts", {
+            shard: (today,) for shard in range(len(self._connections))
+        })
+        counts = shard_counts[0]
+        for other in shard_counts[1:]:
+            counts.merge(other)
+        return counts.summary()
+
+    def get_task_by_id(self, task_id: int) -> Optional[Task]:
+        """
+        Retrieve a copy of a task by its ID.
+
+        Args:
+            task_id (int): The ID of the task to retrieve
+
+        Returns:
+            Optional[Task]: The task if found, None otherwise
+        """
+        if not isinstance(task_id, int) or task_id <= 0:
+            return None
+        return self._call(self._shard_of(task_id), "get_task_by_id", task_id)
+
+    def update_task(self, task_id: int, title: str = None, description: str = None,
+                    due=UNCHANGED, priority=UNCHANGED, tags=UNCHANGED) -> bool:
+        """
+        Update the title, description, due date, priority and/or tags of an existing task.
+
+        Args:
+            task_id (int): The ID of the task to update
+            title (str, optional): New title for the task
+            description (str, optional): New description for the task
+            due (str, optional): New due date; None removes it, UNCHANGED keeps it
+            priority (int, optional): New priority; None removes it, UNCHANGED keeps it
+            tags (str or list, optional): New tags, replacing the current ones; None
+                removes them all, UNCHANGED keeps them
+
+        Returns:
+            bool: True if the task was updated, False if the task ID doesn't exist
+        """
+        if not isinstance(task_id, int) or task_id <= 0:
+            return False
+        shard = self._shard_of(task_id)
+        updated = self._call(shard, "update_task", task_id, title, description, due, priority, tags)
+        if updated:
+            self._remember(f"Update task {task_id}", [shard])
+        return updated
+
+    def delete_task(self, task_id: int) -> bool:
+        """
+        Remove a task.
+
+        Args:
+            task_id (int): The ID of the task to remove
+
+        Returns:
+            bool: True if the task was deleted, False if the task ID doesn't exist
+        """
+        if not isinstance(task_id, int) or task_id <= 0:
+            return False
+        shard = self._shard_of(task_id)
+        deleted = self._call(shard, "delete_task", task_id)
+        if deleted:
+            self._remember(f"Delete task {task_id}", [shard])
+        return deleted
+
+    def toggle_task_completion(self, task_id: int) -> bool:
+        """
+        Toggle the completion status of a task.
+
+        Args:
+            task_id (int): The ID of the task to toggle
+
+        Returns:
+            bool: True if the task was toggled, False if the task ID doesn't exist
+        """
+        if not isinstance(task_id, int) or task_id <= 0:
+            return False
+        shard = self._shard_of(task_id)
+        toggled = self._call(shard, "toggle_task_completion", task_id)
+        if toggled:
+            self._remember(f"Mark task {task_id}", [shard])
+        return toggled
+
+    def add_tasks(self, items: Iterable[tuple], validated: bool = False) -> List[int]:
+        """
+        Add many tasks at once, all or nothing; see TaskManager.add_tasks().
+
+        Args:
+            items (Iterable[tuple]): (title, description) pairs, optionally followed by
+                completed, due, priority and tags
+            validated (bool): The items are rows already normalized by validate_task()
+
+        Returns:
+            List[int]: The IDs of the new tasks, in input order
+        """
+        if validated:
+            rows = items
+        else:
+            rows, errors = validate_task_batch(items)
+            TaskManager._raise_row_error(errors)
+
+        rows_by_shard: Dict[int, list] = {}
+        task_id = self._next_id
+        for row in rows:
+            rows_by_shard.setdefault(self._shard_of(task_id), []).append((task_id, *row))
+            task_id += 1
+
+        ids = list(range(self._next_id, task_id))
+        if ids:
+            self._fan_out("insert", {shard: (rows,) for shard, rows in rows_by_shard.items()})
+            self._next_id = task_id
+            self._remember(f"Add {len(ids)} tasks" if len(ids) > 1 else f"Add task {ids[0]}", rows_by_shard)
+        return ids
+
+    def update_tasks(self, updates: Iterable[tuple]) -> int:
+        """
+        Update many tasks at once, all or nothing; see TaskManager.update_tasks().
+
+        Returns:
+            int: The number of tasks updated
+        """
+        updates, errors = validate_task_changes_batch(updates, UNCHANGED)
+        TaskManager._raise_row_error(errors)
+        self._require_all([update[0] for update in updates])
+
+        by_shard: Dict[int, list] = {}
+        for update in updates:
+            by_shard.setdefault(self._shard_of(update[0]), []).append(update)
+        if by_shard:
+            self._fan_out("update", {shard: (rows,) for shard, rows in by_shard.items()})
+            self._remember(f"Update {len(updates)} tasks" if len(updates) > 1
+                           else f"Update task {updates[0][0]}", by_shard)
+        return len(updates)
+
+    def delete_tasks(self, task_ids: Iterable[int]) -> int:
+        """
+        Delete many tasks at once, all or nothing; see TaskManager.delete_tasks().
+
+        Returns:
+            int: The number of tasks deleted
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        self._require_all(task_ids)
+
+        groups = self._group(task_ids)
+        if groups:
+            self._fan_out("delete_tasks", {shard: (ids,) for shard, ids in groups.items()})
+            self._remember(f"Delete {len(task_ids)} tasks" if len(task_ids) > 1
+                           else f"Delete task {task_ids[0]}", groups)
+        return len(task_ids)
+
+    def set_completed(self, task_ids: Iterable[int], value: bool) -> int:
+        """
+        Set the completion status of many tasks at once; see TaskManager.set_completed().
+
+        Returns:
+            int: The number of tasks whose status changed
+        """
+        if not isinstance(value, bool):
+            raise ValueError("Completed must be a boolean value")
+        task_ids = list(dict.fromkeys(task_ids))
+        self._require_all(task_ids)
+
+        groups = self._group(task_ids)
+        counts = self._fan_out("set_completed", {
+            shard: (ids, value) for shard, ids in groups.items()
+        }) if groups else []
+        changed = sum(counts)
+        if changed:
+            self._remember(f"Mark {changed} tasks" if changed > 1 else "Mark 1 task",
+                           [shard for shard, count in zip(groups, counts) if count])
+        return changed
+
+    def toggle_tasks(self, task_ids: Iterable[int]) -> int:
+        """
+        Toggle the completion status of many tasks at once, all or nothing; see TaskManager.toggle_tasks().
+
+        Returns:
+            int: The number of tasks toggled
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        self._require_all(task_ids)
+
+        groups = self._group(task_ids)
+        if groups:
+            self._fan_out("toggle_tasks", {shard: (ids,) for shard, ids in groups.items()})
+            self._remember(f"Mark {len(task_ids)} tasks" if len(task_ids) > 1
+                           else f"Mark task {task_ids[0]}", groups)
+        return len(task_ids)
+
+    def undo(self) -> Optional[str]:
+        """
+        Revert the most recent operation on every shard it touched.
+
+        Returns:
+            Optional[str]: A description of the undone operation, or None if there was nothing
+                to undo (or a shard's history no longer held it)
+        """
+        if not self._undo:
+            return None
+        operation = self._undo.pop()
+        if not self._replay("undo", operation):
+            return None
+        self._redo.append(operation)
+        return operation[0]
+
+    def redo(self) -> Optional[str]:
+        """
+        Re-apply the most recently undone operation.
+
+        Returns:
+            Optional[str]: A description of the redone operation, or None if there was nothing
+                to redo (or a shard's history no longer held it)
+        """
+        if not self._redo:
+            return None
+        operation = self._redo.pop()
+        if not self._replay("redo", operation):
+            return None
+        self._undo.append(operation)
+        return operation[0]
+
+    def subscribe(self, since: Optional[int] = None, callback: Optional[Callable[[ChangeEvent], None]] = None,
+                  max_lag: Optional[int] = None) -> Subscription:
+        """Follow task changes as ordered, sequence-numbered events; see TaskManager.subscribe()."""
+        return self._change_feed().subscribe(since, callback, max_lag)
+
+    def changes(self, since: Optional[int] = None, limit: Optional[int] = None) -> Tuple[List[ChangeEvent], int]:
+        """Return the changes made after a sequence number; see TaskManager.changes()."""
+        feed = self._change_feed()
+        last_seq = feed.last_seq
+        if since is None:
+            return [], last_seq
+        return feed.read(since, limit), last_seq
+
+    def get_next_id(self) -> int:
+        """
+        Get the next available ID without incrementing the counter.
+
+        Returns:
+            int: The next available ID
+        """
+        return self._next_id
+
+    def search(self, query: str, limit: int = 20, prefix: bool = True) -> List[Task]:
+        """
+        Full-text search on every shard in parallel, merged by score.
+
+        Args:
+            query (str): Free-text query
+            limit (int): Maximum number of results to return
+            prefix (bool): Whether terms also match longer words they start
+
+        Returns:
+            List[Task]: Matching tasks, best match first
+        """
+        results = self._fan_out("search_scored", {
+            shard: (query, limit, prefix) for shard in range(len(self._connections))
+        })
+        ranked = heapq.nlargest(limit, (hit for hits in results for hit in hits),
+                                key=lambda hit: (hit[0], -hit[1][0]))
+        return [_from_row(row) for _, row in ranked]
+
+    def save_snapshot(self, path: str) -> int:
+        """
+        Write all tasks to one columnar snapshot file.
+
+        Args:
+            path (str): Destination file path (replaced atomically)
+
+        Returns:
+            int: The number of tasks written
+        """
+        return write_snapshot(path, self.iter_tasks(), self._next_id)
+
+    @contextmanager
+    def batch(self):
+        """Group the mutations made inside the block into one storage unit per shard."""
+        self._fan_out("begin_batch")
+        try:
+            yield
+        finally:
+            self._fan_out("end_batch")
+
+    def flush(self) -> None:
+        """Force every shard's buffered storage records to disk."""
+        self._fan_out("flush")
+
+    def close(self) -> None:
+        """Flush and stop every shard process (safe to call more than once)."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._feed is not None:
+            self._feed.close()
+        for connection in self._connections:
+            try:
+                connection.send(("close", ()))
+            except OSError:
+                pass  # The shard has already exited
+        for connection, process in zip(self._connections, self._processes):
+            try:
+                connection.recv()
+            except (EOFError, OSError):
+                pass
+            connection.close()
+            process.join()
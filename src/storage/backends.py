@@ -0,0 +1,48 @@
+"""
+Storage backend selection for the Console Todo App.
+"""
+from typing import Optional
+from config import (
+    STORAGE_BACKEND,
+    DATA_DIR,
+    JOURNAL_FSYNC_MODE,
+    JOURNAL_FSYNC_INTERVAL_MS,
+    JOURNAL_FSYNC_EVERY,
+    JOURNAL_COMPACT_EVERY,
+    SQLITE_SYNCHRONOUS,
+)
+from storage.base import StorageBackend
+
+
+def create_storage_backend(name: Optional[str] = None,
+                           directory: Optional[str] = None) -> StorageBackend:
+    """
+    Build the storage backend named in config.py (or by the caller).
+
+    Args:
+        name (str, optional): Backend name, "journal", "sqlite" or "memory"
+        directory (str, optional): Data directory overriding DATA_DIR
+
+    Returns:
+        StorageBackend: A backend ready to pass to TaskManager
+    """
+    name = name or STORAGE_BACKEND
+
+    if name == "memory":
+        return StorageBackend()
+
+    if name == "journal":
+        from storage.journal import JournalStorage
+        return JournalStorage(
+            directory or DATA_DIR,
+            fsync_mode=JOURNAL_FSYNC_MODE,
+            fsync_interval_ms=JOURNAL_FSYNC_INTERVAL_MS,
+            fsync_every=JOURNAL_FSYNC_EVERY,
+            compact_every=JOURNAL_COMPACT_EVERY,
+        )
+
+    if name == "sqlite":
+        from storage.sqlite import SqliteStorage
+        return SqliteStorage(directory or DATA_DIR, synchronous=SQLITE_SYNCHRONOUS)
+
+    raise ValueError(f"Unknown storage backend: {name}")
@@ -0,0 +1,148 @@
+"""
+Storage backend interface for the Console Todo App.
+A backend receives one record per TaskManager mutation and restores state on startup.
+"""
+from typing import Iterable, MutableMapping, Optional, Tuple
+from models.task import Task
+
+
+class StorageBackend:
+    """
+    Base storage backend that keeps nothing on disk.
+
+    TaskManager calls the record_* hooks after each successful mutation and
+    load() once on construction. Subclasses persist those records; this base
+    class implements the purely in-memory behaviour, so every hook is a no-op.
+    """
+
+    # Whether save_image() keeps anything, so TaskManager knows if encoding images is worth it
+    caches_images = False
+
+    def load(self) -> Tuple[MutableMapping[int, Task], int]:
+        """
+        Restore previously persisted state.
+
+        The returned mapping becomes the TaskManager's ID index, so a backend
+        may hand back a lazily materialized mapping instead of a plain dict.
+        TaskManager lists tasks in the mapping's order, which is ID order.
+
+        Returns:
+            tuple: (ID-keyed tasks in ID order, next available ID)
+        """
+        return {}, 1
+
+    def record_add(self, task: Task) -> None:
+        """Persist a newly added task."""
+
+    def record_update(self, task: Task) -> None:
+        """Persist the new title, description, due date, priority and tags of an updated task."""
+
+    def record_delete(self, task_id: int) -> None:
+        """Persist the removal of a task."""
+
+    def record_toggle(self, task: Task) -> None:
+        """Persist the new completion status of a task."""
+
+    def begin_batch(self) -> None:
+        """Start grouping the following records into one atomic unit."""
+
+    def end_batch(self) -> None:
+        """Persist the records grouped since begin_batch() as one atomic unit."""
+
+    def field_index(self, field: str):
+        """
+        Return an index over a task field that the backend maintains itself.
+
+        Backends that can answer a filter from their own storage (e.g. a
+        database index) return an object with the count(value) and ids(value)
+        queries of FieldIndex; TaskManager then uses it instead of building a
+        FieldIndex in memory, and does not add tasks to it.
+
+        Args:
+            field (str): Name of the Task attribute
+
+        Returns:
+            An index for the field, or None to let TaskManager build one
+        """
+        return None
+
+    def needs_compaction(self) -> bool:
+        """
+        Report whether the backend wants a fresh snapshot of the full state.
+
+        Returns:
+            bool: True if compact() should be called
+        """
+        return False
+
+    def compact(self, tasks: Iterable[Task], next_id: int) -> None:
+        """
+        Replace the persisted history with a snapshot of the given state.
+
+        Args:
+            tasks (Iterable[Task]): All current tasks in ID order
+            next_id (int): The next ID the TaskManager will hand out
+        """
+
+    def load_image(self, name: str) -> Optional[bytes]:
+        """
+        Return a cached state image saved by save_image(), if it still matches the stored data.
+
+        Images let TaskManager restore derived state (such as its indexes)
+        instead of rebuilding it from every task on startup. A backend must
+        only return an image that was saved against exactly the state load()
+        returned, and return None otherwise. TaskManager stops asking once
+        it has changed any task.
+
+        Args:
+            name (str): Image name, e.g. "search"
+
+        Returns:
+            bytes: The image, or None if there is no valid one
+        """
+        return None
+
+    def save_image(self, name: str, data: bytes) -> None:
+        """
+        Cache a state image describing the currently persisted data.
+
+        Args:
+            name (str): Image name, e.g. "search"
+            data (bytes): The encoded image
+        """
+
+    def flush(self) -> None:
+        """Force any buffered records to durable storage."""
+
+    def close(self) -> None:
+        """Flush pending records and release any open resources."""
+
+
+def restore_id_order(tasks: MutableMapping[int, Task], inserted: Iterable[int]) -> None:
+    """
+    Move tasks stored again under earlier IDs (by undo, redo or journal replay) back into ID order.
+
+    A dict lists a re-inserted key last, so only the keys from the smallest
+    re-inserted ID to the end are moved. Other mappings keep their own order
+    through an optional restore_order(inserted) method.
+
+    Args:
+        tasks (MutableMapping[int, Task]): ID-keyed tasks, in ID order apart from the inserted ones
+        inserted (Iterable[int]): IDs stored since the mapping was last in ID order
+    """
+    if not isinstance(tasks, dict):
+        restore = getattr(tasks, "restore_order", None)
+        if restore is not None:
+            restore(inserted)
+        return
+    first = min(inserted, default=None)
+    if first is None:
+        return
+    moved = []
+    for task_id in reversed(tasks):
+        if task_id < first:
+            break
+        moved.append(task_id)
+    moved.sort()
+    for task_id in moved:
+        tasks[task_id] = tasks.pop(task_id)
@@ -0,0 +1,443 @@
+"""
+Memory-mapped columnar snapshot format for the Console Todo App.
+
+File layout (native byte order, every section 8-byte aligned):
+- header: magic, version, flags, task count, next ID, string blob length
+- ids: one int64 per task, in insertion order
+- completed: one uint8 per task
+- priority: one uint8 per task, 0 for none (version 2)
+- due: one int32 YYYYMMDD number per task, 0 for none (version 2)
+- offsets: 2 * count + 1 uint64 values; task i's title is blob[off[2i]:off[2i+1]]
+  and its description is blob[off[2i+1]:off[2i+2]]
+- blob: all titles and descriptions as UTF-8, back to back
+- tag offsets: count + 1 uint64 values; task i's tags are tag_blob[off[i]:off[i+1]],
+  separated by spaces (version 3)
+- tag blob: all tags as UTF-8, back to back (version 3)
+
+Version 1 files, written before tasks had a due date and priority, have no
+priority and due columns, and version 2 files, written before tasks had tags,
+have no tag sections; both are still read.
+"""
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import MutableMapping, ValuesView
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from models.task import Task
+from storage.base import restore_id_order
+
+
+MAGIC = b"TODOCOL1"
+VERSION = 3
+READABLE_VERSIONS = (1, 2, 3)
+HEADER = struct.Struct("<8sIIQQQ")
+
+FLAG_IDS_SORTED = 0x1
+FLAG_BIG_ENDIAN = 0x2
+
+
+def _align(size: int) -> int:
+    """Round a section size up to a multiple of 8 bytes."""
+    return (size + 7) & ~7
+
+
+def _native_flags() -> int:
+    """Return the byte order flag for this machine."""
+    return FLAG_BIG_ENDIAN if sys.byteorder == "big" else 0
+
+
+def _due_to_int(due: Optional[str]) -> int:
+    """Pack a "YYYY-MM-DD" due date as a YYYYMMDD number (0 for none)."""
+    return 0 if due is None else int(due[:4] + due[5:7] + due[8:10])
+
+
+def _int_to_due(number: int) -> Optional[str]:
+    """Unpack a due date packed by _due_to_int()."""
+    if not number:
+        return None
+    return f"{number // 10000:04d}-{number // 100 % 100:02d}-{number % 100:02d}"
+
+
+def write_snapshot(path: str, tasks: Iterable[Task], next_id: int) -> int:
+    """
+    Write tasks to a columnar snapshot file, atomically replacing any existing one.
+
+    Args:
+        path (str): Destination file path
+        tasks (Iterable[Task]): Tasks in insertion order
+        next_id (int): The next ID the TaskManager will hand out
+
+    Returns:
+        int: The number of tasks written
+    """
+    ids = array("q")
+    completed = bytearray()
+    priorities = bytearray()
+    dues = array("i")
+    offsets = array("Q", [0])
+    chunks = []
+    position = 0
+    tag_offsets = array("Q", [0])
+    tag_chunks = []
+    tag_position = 0
+    ids_sorted = True
+    previous_id = 0
+
+    for task in tasks:
+        if task.id <= previous_id:
+            ids_sorted = False
+        previous_id = task.id
+        ids.append(task.id)
+        completed.append(1 if task.completed else 0)
+        priorities.append(task.priority or 0)
+        dues.append(_due_to_int(task.due))
+        for text in (task.title, task.description):
+            encoded = text.encode("utf-8")
+            chunks.append(encoded)
+            position += len(encoded)
+            offsets.append(position)
+        if task.tags:
+            encoded = " ".join(task.tags).encode("utf-8")
+            tag_chunks.append(encoded)
+            tag_position += len(encoded)
+        tag_offsets.append(tag_position)
+
+    count = len(ids)
+    flags = _native_flags() | (FLAG_IDS_SORTED if ids_sorted else 0)
+    byte_column_padding = b"\0" * (_align(count) - count)
+    due_padding = b"\0" * (_align(4 * count) - 4 * count)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as snapshot:
+        snapshot.write(HEADER.pack(MAGIC, VERSION, flags, count, next_id, position))
+        snapshot.write(ids.tobytes())
+        snapshot.write(completed)
+        snapshot.write(byte_column_padding)
+        snapshot.write(priorities)
+        snapshot.write(byte_column_padding)
+        snapshot.write(dues.tobytes())
+        snapshot.write(due_padding)
+        snapshot.write(offsets.tobytes())
+        snapshot.writelines(chunks)
+        snapshot.write(b"\0" * (_align(position) - position))
+        snapshot.write(tag_offsets.tobytes())
+        snapshot.writelines(tag_chunks)
+        snapshot.flush()
+        os.fsync(snapshot.fileno())
+    os.replace(tmp_path, path)
+    return count
+
+
+class ColumnarSnapshot:
+    """
+    Read-only, memory-mapped view of a columnar snapshot file.
+
+    Opening only maps the file and slices the column views; no per-task work is
+    done until a row is read, so the OS pages in just the parts that are touched.
+    """
+
+    def __init__(self, path: str):
+        """
+        Map a snapshot file into memory.
+
+        Args:
+            path (str): Path of a file written by write_snapshot()
+        """
+        self.path = path
+        with open(path, "rb") as snapshot:
+            size = os.fstat(snapshot.fileno()).st_size
+            if size < HEADER.size:
+                raise ValueError(f"Snapshot file is truncated: {path}")
+            self._mmap = mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, flags, count, next_id, blob_len = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a columnar task snapshot: {path}")
+        if version not in READABLE_VERSIONS:
+            raise ValueError(f"Unsupported snapshot version: {version}")
+        if (flags & FLAG_BIG_ENDIAN) != _native_flags():
+            raise ValueError("Snapshot was written on a machine with a different byte order")
+
+        self.count = count
+        self.next_id = next_id
+        self.ids_sorted = bool(flags & FLAG_IDS_SORTED)
+
+        self._view = view = memoryview(self._mmap)
+        start = HEADER.size
+        self.ids = view[start:start + 8 * count].cast("q")
+        start += 8 * count
+        self.completed = view[start:start + count]
+        start += _align(count)
+        if version >= 2:
+            self.priority = view[start:start + count]
+            start += _align(count)
+            self.due = view[start:start + 4 * count].cast("i")
+            start += _align(4 * count)
+        else:
+            self.priority = self.due = None
+        self.offsets = view[start:start + 8 * (2 * count + 1)].cast("Q")
+        start += 8 * (2 * count + 1)
+        self.blob = view[start:start + blob_len]
+        end = start + blob_len
+        self.tag_offsets = self.tag_blob = None
+        if version >= 3 and end <= size:
+            start += _align(blob_len)
+            end = start + 8 * (count + 1)
+            if end <= size:
+                self.tag_offsets = view[start:end].cast("Q")
+                self.tag_blob = view[end:end + self.tag_offsets[count]]
+                end += self.tag_offsets[count]
+        if end > size:
+            raise ValueError(f"Snapshot file is truncated: {path}")
+
+        self._row_by_id: Optional[Dict[int, int]] = None
+
+    def find(self, task_id: int) -> int:
+        """
+        Locate the row holding a task ID.
+
+        Args:
+            task_id (int): The task ID to look up
+
+        Returns:
+            int: The row number, or -1 if the ID is not in the snapshot
+        """
+        if self.ids_sorted:
+            row = bisect_left(self.ids, task_id)
+            if row < self.count and self.ids[row] == task_id:
+                return row
+            return -1
+
+        # Unsorted snapshots (rare) build a lookup table on first use
+        if self._row_by_id is None:
+            self._row_by_id = {task_id: row for row, task_id in enumerate(self.ids)}
+        return self._row_by_id.get(task_id, -1)
+
+    def _text(self, index: int) -> str:
+        """Decode string number index from the blob."""
+        return str(self.blob[self.offsets[index]:self.offsets[index + 1]], "utf-8")
+
+    def _tags(self, row: int) -> tuple:
+        """Decode the tags of one row."""
+        if self.tag_offsets is None:
+            return ()
+        start, end = self.tag_offsets[row], self.tag_offsets[row + 1]
+        return tuple(str(self.tag_blob[start:end], "utf-8").split()) if end > start else ()
+
+    def task_at(self, row: int) -> Task:
+        """
+        Build a Task object for one row.
+
+        Args:
+            row (int): Row number in [0, count)
+
+        Returns:
+            Task: A new Task holding the row's values
+        """
+        return Task.trusted(
+            id=self.ids[row],
+            title=self._text(2 * row),
+            description=self._text(2 * row + 1),
+            completed=bool(self.completed[row]),
+            due=_int_to_due(self.due[row]) if self.due is not None else None,
+            priority=(self.priority[row] or None) if self.priority is not None else None,
+            tags=self._tags(row),
+        )
+
+    def close(self) -> None:
+        """Release the column views and unmap the file."""
+        for column in (self.ids, self.completed, self.priority, self.due, self.offsets, self.blob,
+                       self.tag_offsets, self.tag_blob, self._view):
+            if column is not None:
+                column.release()
+        self._mmap.close()
+
+
+class _SnapshotValues(ValuesView):
+    """Values view that streams snapshot rows without caching them."""
+
+    def __iter__(self) -> Iterator[Task]:
+        return self._mapping.itervalues()
+
+
+class SnapshotTaskMap(MutableMapping):
+    """
+    ID-keyed task mapping layered over a ColumnarSnapshot.
+
+    Reads fall through to the snapshot and create Task objects on demand. A
+    task fetched by ID is cached so that in-place changes (e.g. toggling its
+    completion) stick; changes made after opening live in small overlay
+    structures, so the snapshot file itself is never written. Iteration follows
+    snapshot order followed by tasks added later, like the plain dict it replaces;
+    a deleted snapshot row stored again (e.g. by undo) is listed in its row again.
+    """
+
+    def __init__(self, snapshot: ColumnarSnapshot):
+        """
+        Wrap a mapped snapshot.
+
+        Args:
+            snapshot (ColumnarSnapshot): The snapshot providing the base rows
+        """
+        self.snapshot = snapshot
+        self._cache: Dict[int, Task] = {}
+        self._deleted = set()
+        self._added: Dict[int, Task] = {}
+
+    def _in_snapshot(self, task_id: int) -> bool:
+        """Return True if the ID is a live (not deleted) snapshot row."""
+        return task_id not in self._deleted and self.snapshot.find(task_id) >= 0
+
+    def __getitem__(self, task_id: int) -> Task:
+        task = self._added.get(task_id)
+        if task is None:
+            task = self._cache.get(task_id)
+        if task is not None:
+            return task
+        if task_id in self._deleted or not isinstance(task_id, int):
+            raise KeyError(task_id)
+
+        row = self.snapshot.find(task_id)
+        if row < 0:
+            raise KeyError(task_id)
+        # Readers may race here under a shared lock: the first task cached is the live one for all of them
+        return self._cache.setdefault(task_id, self.snapshot.task_at(row))
+
+    def __setitem__(self, task_id: int, task: Task) -> None:
+        if task_id in self._deleted:
+            self._deleted.discard(task_id)  # Stored again (e.g. by undo): back in its snapshot row
+            self._cache[task_id] = task
+        elif task_id in self._added or not self._in_snapshot(task_id):
+            self._added[task_id] = task
+        else:
+            self._cache[task_id] = task
+
+    def __delitem__(self, task_id: int) -> None:
+        if task_id in self._added:
+            del self._added[task_id]
+        elif self._in_snapshot(task_id):
+            self._deleted.add(task_id)
+            self._cache.pop(task_id, None)
+        else:
+            raise KeyError(task_id)
+
+    def __contains__(self, task_id) -> bool:
+        return task_id in self._added or task_id in self._cache or (
+            isinstance(task_id, int) and self._in_snapshot(task_id)
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        deleted = self._deleted
+        for task_id in self.snapshot.ids:
+            if task_id not in deleted:
+                yield task_id
+        yield from self._added
+
+    def __len__(self) -> int:
+        return self.snapshot.count - len(self._deleted) + len(self._added)
+
+    def restore_order(self, inserted: Iterable[int]) -> None:
+        """
+        Move tasks added again under earlier IDs back into ID order (see restore_id_order()).
+
+        Deleted snapshot rows stored again are back in place already.
+
+        Args:
+            inserted (Iterable[int]): IDs stored since the mapping was last in ID order
+        """
+        added = self._added
+        restore_id_order(added, [task_id for task_id in inserted if task_id in added])
+
+    def values(self) -> ValuesView:
+        return _SnapshotValues(self)
+
+    def itervalues(self) -> Iterator[Task]:
+        """
+        Iterate tasks in order without caching the ones read from the snapshot.
+
+        Returns:
+            Iterator[Task]: Every live task
+        """
+        snapshot = self.snapshot
+        deleted = self._deleted
+        cache = self._cache
+        for row, task_id in enumerate(snapshot.ids):
+            if task_id in deleted:
+                continue
+            task = cache.get(task_id)
+            yield task if task is not None else snapshot.task_at(row)
+        yield from self._added.values()
+
+    def tasks_in_range(self, start: int, stop: int) -> List[Task]:
+        """
+        Read the tasks with IDs in [start, stop) in ID order, without caching the ones read from the snapshot.
+
+        Args:
+            start (int): Lowest ID to read
+            stop (int): ID to stop before
+
+        Returns:
+            List[Task]: The live tasks in the range
+        """
+        snapshot = self.snapshot
+        deleted = self._deleted
+        cache = self._cache
+        tasks = []
+        if snapshot.ids_sorted:
+            ids = snapshot.ids
+            first = bisect_left(ids, start)
+            for row in range(first, bisect_left(ids, stop, first)):
+                task_id = ids[row]
+                if task_id not in deleted:
+                    task = cache.get(task_id)
+                    tasks.append(task if task is not None else snapshot.task_at(row))
+        else:
+            for task_id in range(start, stop):
+                row = snapshot.find(task_id)
+                if row >= 0 and task_id not in deleted:
+                    task = cache.get(task_id)
+                    tasks.append(task if task is not None else snapshot.task_at(row))
+
+        added = self._added
+        if added:
+            # Tasks added after opening, including deleted snapshot rows stored again
+            if len(added) < stop - start:
+                extra = [task for task_id, task in added.items() if start <= task_id < stop]
+            else:
+                extra = [task for task in map(added.get, range(start, stop)) if task is not None]
+            if extra:
+                tasks.extend(extra)
+                tasks.sort(key=attrgetter("id"))
+        return tasks
+
+    def overlay(self) -> Tuple[set, Dict[int, Task], Dict[int, Task]]:
+        """
+        Expose how the mapping differs from its snapshot, for column-wise readers.
+
+        Returns:
+            tuple: (IDs of deleted snapshot rows, snapshot tasks read as objects and
+                possibly changed in place, tasks added after opening), by reference
+        """
+        return self._deleted, self._cache, self._added
+
+    def close(self) -> None:
+        """Unmap the underlying snapshot; the mapping must not be used afterwards."""
+        self.snapshot.close()
+
+
+def open_snapshot(path: str) -> Tuple[SnapshotTaskMap, int]:
+    """
+    Open a columnar snapshot as a lazily materialized task mapping.
+
+    Args:
+        path (str): Path of a file written by write_snapshot()
+
+    Returns:
+        tuple: (ID-keyed task mapping, next available ID)
+    """
+    snapshot = ColumnarSnapshot(path)
+    return SnapshotTaskMap(snapshot), snapshot.next_id
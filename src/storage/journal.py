@@ -0,0 +1,401 @@
+"""
+Append-only journal storage backend for the Console Todo App.
+Every mutation is written ahead as one compact JSON line; a periodic columnar snapshot bounds replay time.
+"""
+import json
+import logging
+import marshal
+import os
+import threading
+import time
+from typing import Iterable, MutableMapping, Optional, Tuple
+from models.task import Task
+from storage.base import StorageBackend, restore_id_order
+from storage.columnar import open_snapshot, write_snapshot
+
+
+JOURNAL_FILENAME = "tasks.journal"
+SNAPSHOT_FILENAME = "tasks.snapshot"
+IMAGE_FILENAME = "tasks.{name}.image"
+
+logger = logging.getLogger(__name__)
+
+FSYNC_ALWAYS = "always"
+FSYNC_INTERVAL = "interval"
+FSYNC_COUNT = "count"
+FSYNC_MODES = (FSYNC_ALWAYS, FSYNC_INTERVAL, FSYNC_COUNT)
+
+# Journal record opcodes
+OP_ADD = "a"
+OP_UPDATE = "u"
+OP_DELETE = "d"
+OP_TOGGLE = "t"
+OP_BATCH = "b"
+
+
+def _encode(record) -> bytes:
+    """Encode a record as one compact JSON line."""
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _file_token(path: str):
+    """Identify a file's current contents by its size and modification time (None if missing)."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _fsync_directory(path: str) -> None:
+    """Make a rename inside the directory durable (no-op where unsupported)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class JournalStorage(StorageBackend):
+    """
+    Write-ahead, append-only journal with snapshot compaction.
+
+    Records are absolute (a toggle stores the resulting status, an update the
+    resulting text), so replaying a journal on top of a snapshot that already
+    contains its effects is harmless. That makes compaction crash-safe: the
+    snapshot is written and atomically renamed before the journal is truncated.
+
+    Bulk operations are written as a single batch record holding all of their
+    records, so a crash can never leave half of a batch in the journal.
+
+    Durability is controlled by fsync_mode:
+    - "always": flush and fsync after every record
+    - "interval": flush every record to the OS, and fsync at most fsync_interval_ms
+      after it was written (from a timer thread if no further record arrives)
+    - "count": flush every record to the OS, and fsync after every fsync_every records
+
+    Records therefore survive the process crashing in every mode; the mode only
+    decides how many may be lost if the machine itself goes down.
+
+    State images (see save_image()) are stored next to the journal, each
+    tagged with the size and modification time of the journal and snapshot
+    it was saved against. Any later write changes that tag, so a stale image
+    is never restored.
+    """
+
+    caches_images = True
+
+    def __init__(self, directory: str, fsync_mode: str = FSYNC_INTERVAL,
+                 fsync_interval_ms: int = 200, fsync_every: int = 256,
+                 compact_every: int = 100_000):
+        """
+        Open (or create) a journal in the given directory.
+
+        Args:
+            directory (str): Directory holding the journal and snapshot files
+            fsync_mode (str): One of "always", "interval" or "count"
+            fsync_interval_ms (int): Maximum time between syncs in "interval" mode
+            fsync_every (int): Records per sync in "count" mode
+            compact_every (int): Journal records written before compaction is requested
+        """
+        if fsync_mode not in FSYNC_MODES:
+            raise ValueError(f"fsync_mode must be one of {', '.join(FSYNC_MODES)}")
+        if fsync_interval_ms < 0 or fsync_every <= 0 or compact_every <= 0:
+            raise ValueError("Journal batching limits must be positive")
+
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.journal_path = os.path.join(directory, JOURNAL_FILENAME)
+        self.snapshot_path = os.path.join(directory, SNAPSHOT_FILENAME)
+        self.fsync_mode = fsync_mode
+        self.fsync_interval = fsync_interval_ms / 1000.0
+        self.fsync_every = fsync_every
+        self.compact_every = compact_every
+
+        self._file = None
+        self._batch = None
+        self._batch_depth = 0
+        self._records_since_compaction = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._loaded_token = None
+        # Guards the file and the sync state against the interval timer thread
+        self._lock = threading.Lock()
+        self._sync_timer: Optional[threading.Timer] = None
+
+    # ------------------------------------------------------------------
+    # Startup
+    # ------------------------------------------------------------------
+
+    def load(self) -> Tuple[MutableMapping[int, Task], int]:
+        """
+        Restore state from the latest snapshot plus the journal written after it.
+
+        The snapshot is memory-mapped rather than parsed, so only the journal
+        tail costs time proportional to its size. A partially written final
+        journal line (e.g. after a crash) is cut off the file, so new records
+        are not appended onto it. Tasks restored by undo or redo are put back
+        in ID order, as they were listed before the restart.
+
+        Returns:
+            tuple: (ID-keyed tasks in ID order, next available ID)
+        """
+        if os.path.exists(self.snapshot_path):
+            tasks, next_id = open_snapshot(self.snapshot_path)
+        else:
+            tasks, next_id = {}, 1
+        replayed = 0
+        reinserted = []  # IDs added again by undo or redo, out of ID order
+
+        if os.path.exists(self.journal_path):
+            complete = 0  # Offset just past the last complete record
+            with open(self.journal_path, "rb") as journal:
+                for line in journal:
+                    if not line.endswith(b"\n"):
+                        break  # Torn write at the tail of the journal
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        break
+                    for entry in (record[1] if record[0] == OP_BATCH else (record,)):
+                        self._apply(tasks, entry)
+                        if entry[0] == OP_ADD:
+                            if entry[1] < next_id:
+                                reinserted.append(entry[1])
+                            next_id = max(next_id, entry[1] + 1)
+                        replayed += 1
+                    complete += len(line)
+            self._truncate_journal(complete)
+            restore_id_order(tasks, reinserted)
+
+        self._records_since_compaction = replayed
+        self._open_journal()
+        self._loaded_token = self._state_token()
+        return tasks, next_id
+
+    def _truncate_journal(self, size: int) -> None:
+        """Cut whatever follows the first size bytes (a torn record) off the journal."""
+        discarded = os.path.getsize(self.journal_path) - size
+        if discarded <= 0:
+            return
+        logger.warning("Discarding %d bytes of torn journal tail in %s", discarded, self.journal_path)
+        with open(self.journal_path, "r+b") as journal:
+            journal.truncate(size)
+            os.fsync(journal.fileno())
+
+    def _state_token(self) -> tuple:
+        """Identify the persisted state by the journal and snapshot file stats."""
+        return _file_token(self.journal_path), _file_token(self.snapshot_path)
+
+    def _image_path(self, name: str) -> str:
+        """Path of the named state image."""
+        return os.path.join(self.directory, IMAGE_FILENAME.format(name=name))
+
+    def load_image(self, name: str) -> Optional[bytes]:
+        """
+        Return the named state image if it was saved against the state load() restored.
+
+        Only the small tag in front of the image is read when it is stale.
+
+        Args:
+            name (str): Image name
+
+        Returns:
+            bytes: The image, or None if it is missing, unreadable or stale
+        """
+        if self._loaded_token is None:
+            return None
+        try:
+            with open(self._image_path(name), "rb") as f:
+                if marshal.load(f) != self._loaded_token:
+                    return None
+                return f.read()
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+    def save_image(self, name: str, data: bytes) -> None:
+        """
+        Save a state image tagged with the current journal and snapshot stats.
+
+        Pending records are flushed first so the tag matches what the next
+        load() will see. The image is a cache, so it is renamed into place
+        atomically but not fsynced.
+
+        Args:
+            name (str): Image name
+            data (bytes): The encoded image
+        """
+        self.flush()
+        path = self._image_path(name)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            marshal.dump(self._state_token(), f)
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _apply(tasks: MutableMapping[int, Task], record) -> None:
+        """
+        Apply one journal record to an ID-keyed task mapping.
+
+        Add and update records written before tasks had a due date and
+        priority lack those two trailing fields, and records written before
+        tasks had tags lack the trailing tag list.
+        """
+        op = record[0]
+        if op == OP_ADD:
+            _, task_id, title, description, completed, *extra = record
+            due, priority = extra[:2] if extra else (None, None)
+            tags = tuple(extra[2]) if len(extra) > 2 else ()
+            tasks[task_id] = Task.trusted(task_id, title, description, completed, due, priority, tags)
+        elif op == OP_UPDATE:
+            _, task_id, title, description, *extra = record
+            task = tasks.get(task_id)
+            if task is not None:
+                task.title = title
+                task.description = description
+                if extra:
+                    task.due, task.priority = extra[:2]
+                if len(extra) > 2:
+                    task.tags = tuple(extra[2])
+        elif op == OP_DELETE:
+            tasks.pop(record[1], None)
+        elif op == OP_TOGGLE:
+            task = tasks.get(record[1])
+            if task is not None:
+                task.completed = record[2]
+        else:
+            raise ValueError(f"Unknown journal record: {op!r}")
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _open_journal(self) -> None:
+        """Open the journal for appending."""
+        if self._file is None:
+            self._file = open(self.journal_path, "ab")
+
+    def _append(self, record, size: int = 1) -> None:
+        """Append one record (standing for size operations) and sync according to the fsync policy."""
+        if self._batch is not None:
+            self._batch.append(record)
+            return
+
+        with self._lock:
+            self._open_journal()
+            self._file.write(_encode(record))
+            self._file.flush()
+            self._records_since_compaction += size
+            self._unsynced += 1
+
+            if self.fsync_mode == FSYNC_ALWAYS:
+                self._sync()
+            elif self.fsync_mode == FSYNC_COUNT:
+                if self._unsynced >= self.fsync_every:
+                    self._sync()
+            else:
+                due = self._last_sync + self.fsync_interval - time.monotonic()
+                if due <= 0:
+                    self._sync()
+                elif self._sync_timer is None:
+                    self._sync_timer = threading.Timer(due, self._sync_when_due)
+                    self._sync_timer.daemon = True
+                    self._sync_timer.start()
+
+    def _sync_when_due(self) -> None:
+        """Timer callback: fsync records still unsynced when the interval ends."""
+        with self._lock:
+            self._sync_timer = None
+            self._sync()
+
+    def record_add(self, task: Task) -> None:
+        """Append an add record."""
+        self._append([OP_ADD, task.id, task.title, task.description, task.completed,
+                      task.due, task.priority, task.tags])
+
+    def record_update(self, task: Task) -> None:
+        """Append an update record with the task's new text, due date, priority and tags."""
+        self._append([OP_UPDATE, task.id, task.title, task.description, task.due, task.priority, task.tags])
+
+    def record_delete(self, task_id: int) -> None:
+        """Append a delete record."""
+        self._append([OP_DELETE, task_id])
+
+    def record_toggle(self, task: Task) -> None:
+        """Append a toggle record with the task's new status."""
+        self._append([OP_TOGGLE, task.id, task.completed])
+
+    def begin_batch(self) -> None:
+        """Collect the following records in memory until the matching end_batch()."""
+        if self._batch_depth == 0:
+            self._batch = []
+        self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        """Write the collected records as one batch line once the outermost batch ends."""
+        self._batch_depth -= 1
+        if self._batch_depth:
+            return
+        records, self._batch = self._batch, None
+        if records:
+            self._append([OP_BATCH, records], size=len(records))
+
+    def flush(self) -> None:
+        """Flush buffered records to the OS and fsync the journal."""
+        with self._lock:
+            self._sync()
+
+    def _sync(self) -> None:
+        """Flush and fsync the journal; the caller holds the lock."""
+        if self._file is None:
+            return
+        if self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+
+    def needs_compaction(self) -> bool:
+        """Return True once compact_every records have been journaled."""
+        return self._records_since_compaction >= self.compact_every
+
+    def compact(self, tasks: Iterable[Task], next_id: int) -> None:
+        """
+        Write a snapshot of the given state and truncate the journal.
+
+        Args:
+            tasks (Iterable[Task]): All current tasks in insertion order
+            next_id (int): The next ID the TaskManager will hand out
+        """
+        self.flush()
+        write_snapshot(self.snapshot_path, tasks, next_id)
+        _fsync_directory(self.directory)
+
+        # Only now is it safe to drop the history the snapshot covers
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+            self._file = open(self.journal_path, "wb")
+            os.fsync(self._file.fileno())
+            self._records_since_compaction = 0
+
+    def close(self) -> None:
+        """Flush outstanding records and close the journal file."""
+        with self._lock:
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            if self._file is not None:
+                self._sync()
+                self._file.close()
+                self._file = None
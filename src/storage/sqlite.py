@@ -0,0 +1,410 @@
+"""
+SQLite storage backend for the Console Todo App.
+Tasks live in one table of a local database file; only the tasks in use are read into memory.
+"""
+import os
+import sqlite3
+from collections.abc import MutableMapping, ValuesView
+from typing import Dict, Iterator, List, Optional, Tuple
+from models.task import Task
+from storage.base import StorageBackend
+
+
+DATABASE_FILENAME = "tasks.db"
+
+# Schema version kept in PRAGMA user_version
+SCHEMA_VERSION = 2
+
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# AUTOINCREMENT makes SQLite remember the largest ID ever stored (in sqlite_sequence),
+# so IDs of deleted tasks are never handed out again, like the journal's next ID
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    completed INTEGER NOT NULL,
+    due TEXT,
+    priority INTEGER,
+    tags TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS tasks_by_completed ON tasks (completed);
+"""
+
+# Upgrades from each older schema version; tags are stored space-separated
+MIGRATIONS = {
+    1: "ALTER TABLE tasks ADD COLUMN tags TEXT NOT NULL DEFAULT ''",
+}
+
+# Statements are constant strings so the connection's statement cache keeps them prepared
+SQL_NEXT_ID = "SELECT seq FROM sqlite_sequence WHERE name = 'tasks'"
+SQL_COUNT = "SELECT COUNT(*) FROM tasks"
+SQL_COUNT_BY_STATUS = "SELECT completed, COUNT(*) FROM tasks GROUP BY completed"
+SQL_GET = "SELECT id, title, description, completed, due, priority, tags FROM tasks WHERE id = ?"
+SQL_EXISTS = "SELECT 1 FROM tasks WHERE id = ?"
+SQL_STATUS = "SELECT completed FROM tasks WHERE id = ?"
+SQL_ALL = "SELECT id, title, description, completed, due, priority, tags FROM tasks ORDER BY id"
+SQL_ALL_IDS = "SELECT id FROM tasks ORDER BY id"
+SQL_RANGE = ("SELECT id, title, description, completed, due, priority, tags FROM tasks "
+             "WHERE id >= ? AND id < ? ORDER BY id")
+SQL_IDS_BY_STATUS = "SELECT id FROM tasks WHERE completed = ? ORDER BY id LIMIT ? OFFSET ?"
+SQL_INSERT = ("INSERT INTO tasks (id, title, description, completed, due, priority, tags) "
+              "VALUES (?, ?, ?, ?, ?, ?, ?)")
+SQL_UPDATE = ("UPDATE tasks SET title = ?, description = ?, due = ?, priority = ?, tags = ? "
+              "WHERE id = ?")
+SQL_SET_COMPLETED = "UPDATE tasks SET completed = ? WHERE id = ?"
+SQL_DELETE = "DELETE FROM tasks WHERE id = ?"
+
+
+class SqliteStorage(StorageBackend):
+    """
+    Keeps every task as one row of a SQLite table, written in place.
+
+    One connection stays open for the lifetime of the backend, in WAL mode,
+    and every statement is a constant string served from the connection's
+    prepared statement cache. Outside a batch each record commits on its own;
+    the records of a batch (every bulk operation, undo step or server group
+    commit) share one transaction.
+
+    load() does not read the tasks: it returns a SqliteTaskMap that looks
+    rows up by primary key on demand and streams them through a cursor when
+    iterated. The completion status filter is answered by an index in the
+    database (see field_index()) instead of one built in memory, and task
+    counts are read once and then kept up to date by the record hooks.
+
+    Rows are listed in ID order, so a task restored by undo goes back to its
+    original place rather than to the end of the list.
+    """
+
+    def __init__(self, directory: str, synchronous: str = "NORMAL"):
+        """
+        Open (or create) the database in the given directory.
+
+        Args:
+            directory (str): Directory holding the database file
+            synchronous (str): SQLite synchronous setting; "NORMAL" only syncs the
+                write-ahead log at checkpoints, "FULL" on every commit
+        """
+        synchronous = synchronous.upper()
+        if synchronous not in SYNCHRONOUS_MODES:
+            raise ValueError(f"synchronous must be one of {', '.join(SYNCHRONOUS_MODES)}")
+
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.path = os.path.join(directory, DATABASE_FILENAME)
+
+        # Autocommit mode: transactions are opened explicitly by begin_batch()
+        self._db = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute(f"PRAGMA synchronous = {synchronous}")
+        schema_version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if schema_version == 0:
+            self._db.executescript(SCHEMA)
+        elif schema_version > SCHEMA_VERSION:
+            raise ValueError(f"Unsupported database schema version: {schema_version}")
+        else:
+            for version in range(schema_version, SCHEMA_VERSION):
+                self._db.execute(MIGRATIONS[version])
+        if schema_version != SCHEMA_VERSION:
+            self._db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        self._batch_depth = 0
+        self._count = 0
+        self._status_counts: Optional[Dict[bool, int]] = None
+        self._status_index: Optional[SqliteStatusIndex] = None
+        # Versions of the tasks written since load(); rows read back get them again
+        self._versions: Dict[int, int] = {}
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def load(self) -> Tuple["SqliteTaskMap", int]:
+        """
+        Open the stored tasks without reading them.
+
+        Returns:
+            tuple: (ID-keyed mapping over the tasks table, next available ID)
+        """
+        row = self._db.execute(SQL_NEXT_ID).fetchone()
+        self._count = self._db.execute(SQL_COUNT).fetchone()[0]
+        return SqliteTaskMap(self), (row[0] if row else 0) + 1
+
+    def _task(self, row: tuple) -> Task:
+        """Build a Task from a (id, title, description, completed, due, priority, tags) row."""
+        task_id, title, description, completed, due, priority, tags = row
+        return Task.trusted(task_id, title, description, bool(completed), due, priority,
+                            tuple(tags.split()), self._versions.get(task_id, 0))
+
+    def get(self, task_id: int) -> Optional[Task]:
+        """
+        Read one task by ID through the primary key.
+
+        Args:
+            task_id (int): The task ID
+
+        Returns:
+            Optional[Task]: A new Task holding the row, or None if there is none
+        """
+        row = self._db.execute(SQL_GET, (task_id,)).fetchone()
+        return None if row is None else self._task(row)
+
+    def exists(self, task_id: int) -> bool:
+        """Return True if a row with the given ID exists."""
+        return self._db.execute(SQL_EXISTS, (task_id,)).fetchone() is not None
+
+    def iter_tasks(self) -> Iterator[Task]:
+        """
+        Stream every task in ID order through a cursor.
+
+        Returns:
+            Iterator[Task]: A new Task per row
+        """
+        for row in self._db.execute(SQL_ALL):
+            yield self._task(row)
+
+    def tasks_in_range(self, start: int, stop: int) -> List[Task]:
+        """
+        Read the tasks with IDs in [start, stop) through the primary key.
+
+        Args:
+            start (int): Lowest ID to read
+            stop (int): ID to stop before
+
+        Returns:
+            List[Task]: A new Task per row, in ID order
+        """
+        return [self._task(row) for row in self._db.execute(SQL_RANGE, (start, stop))]
+
+    def iter_ids(self) -> Iterator[int]:
+        """Stream every task ID in ascending order through a cursor."""
+        for (task_id,) in self._db.execute(SQL_ALL_IDS):
+            yield task_id
+
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+        return self._count
+
+    def field_index(self, field: str) -> Optional["SqliteStatusIndex"]:
+        """
+        Serve the completion status filter from the tasks_by_completed index.
+
+        Args:
+            field (str): Task attribute to filter on
+
+        Returns:
+            SqliteStatusIndex: For "completed"; None for any other field
+        """
+        if field != "completed":
+            return None
+        if self._status_index is None:
+            self._status_index = SqliteStatusIndex(self)
+        return self._status_index
+
+    def status_counts(self) -> Dict[bool, int]:
+        """Return the number of pending and completed tasks, counting them on first use."""
+        if self._status_counts is None:
+            counts = {False: 0, True: 0}
+            for completed, count in self._db.execute(SQL_COUNT_BY_STATUS):
+                counts[bool(completed)] = count
+            self._status_counts = counts
+        return self._status_counts
+
+    def ids_by_status(self, completed: bool, offset: int, limit: Optional[int]) -> List[int]:
+        """
+        Read one page of the IDs of pending or completed tasks, in ascending order.
+
+        Args:
+            completed (bool): The completion status
+            offset (int): Number of matching IDs to skip
+            limit (int, optional): Maximum number of IDs (all if None)
+
+        Returns:
+            List[int]: The IDs
+        """
+        rows = self._db.execute(SQL_IDS_BY_STATUS, (int(completed), -1 if limit is None else limit, offset))
+        return [task_id for (task_id,) in rows]
+
+    def iter_ids_by_status(self, completed: bool) -> Iterator[int]:
+        """Stream the IDs of pending or completed tasks in ascending order."""
+        for (task_id,) in self._db.execute(SQL_IDS_BY_STATUS, (int(completed), -1, 0)):
+            yield task_id
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _count_status(self, completed: bool, delta: int) -> None:
+        """Adjust the cached status counts, if they have been read."""
+        if self._status_counts is not None:
+            self._status_counts[completed] += delta
+
+    def record_add(self, task: Task) -> None:
+        """Insert the task's row."""
+        self._db.execute(SQL_INSERT, (task.id, task.title, task.description, int(task.completed),
+                                      task.due, task.priority, " ".join(task.tags)))
+        self._versions[task.id] = task.version
+        self._count += 1
+        self._count_status(task.completed, 1)
+
+    def record_update(self, task: Task) -> None:
+        """Write the task's new text, due date and priority."""
+        self._db.execute(SQL_UPDATE, (task.title, task.description, task.due, task.priority,
+                                      " ".join(task.tags), task.id))
+        self._versions[task.id] = task.version
+
+    def record_delete(self, task_id: int) -> None:
+        """Delete the task's row."""
+        row = self._db.execute(SQL_STATUS, (task_id,)).fetchone()
+        if row is None:
+            return
+        self._db.execute(SQL_DELETE, (task_id,))
+        self._versions.pop(task_id, None)
+        self._count -= 1
+        self._count_status(bool(row[0]), -1)
+
+    def record_toggle(self, task: Task) -> None:
+        """Write the task's new completion status."""
+        self._db.execute(SQL_SET_COMPLETED, (int(task.completed), task.id))
+        self._versions[task.id] = task.version
+        self._count_status(task.completed, 1)
+        self._count_status(not task.completed, -1)
+
+    def begin_batch(self) -> None:
+        """Open a transaction for the following records (nested batches join it)."""
+        if self._batch_depth == 0:
+            self._db.execute("BEGIN")
+        self._batch_depth += 1
+
+    def end_batch(self) -> None:
+        """Commit the transaction once the outermost batch ends."""
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._db.execute("COMMIT")
+
+    def flush(self) -> None:
+        """Sync the write-ahead log and copy it into the database file."""
+        if self._batch_depth == 0:
+            self._db.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def close(self) -> None:
+        """Commit any open batch and close the connection, which checkpoints the log."""
+        if self._batch_depth:
+            self._db.execute("COMMIT")
+            self._batch_depth = 0
+        self._db.close()
+
+
+class SqliteStatusIndex:
+    """
+    Completion status index answered by the database.
+
+    Offers the count()/ids() queries of FieldIndex for the "completed" field.
+    The database keeps its index up to date as rows are written, so TaskManager
+    does not add tasks to this one.
+    """
+
+    fields = frozenset({"completed"})
+
+    def __init__(self, storage: SqliteStorage):
+        """
+        Wrap a SQLite backend.
+
+        Args:
+            storage (SqliteStorage): The backend holding the tasks
+        """
+        self._storage = storage
+
+    def count(self, value: bool) -> int:
+        """Count the pending (False) or completed (True) tasks."""
+        return self._storage.status_counts()[bool(value)]
+
+    def ids(self, value: bool) -> "_StatusIds":
+        """
+        IDs of the pending or completed tasks, in ascending order.
+
+        Args:
+            value (bool): The completion status
+
+        Returns:
+            _StatusIds: A lazy sequence; slicing it reads only the requested page
+        """
+        return _StatusIds(self._storage, bool(value))
+
+
+class _StatusIds:
+    """Lazy, sliceable sequence of the IDs with one completion status."""
+
+    def __init__(self, storage: SqliteStorage, completed: bool):
+        self._storage = storage
+        self._completed = completed
+
+    def __len__(self) -> int:
+        return self._storage.status_counts()[self._completed]
+
+    def __iter__(self) -> Iterator[int]:
+        return self._storage.iter_ids_by_status(self._completed)
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice) or item.step not in (None, 1):
+            raise TypeError("Only contiguous slices of task IDs are supported")
+        start, stop, _ = item.indices(len(self))
+        return self._storage.ids_by_status(self._completed, start, max(0, stop - start))
+
+
+class _SqliteValues(ValuesView):
+    """Values view that streams rows through a cursor."""
+
+    def __iter__(self) -> Iterator[Task]:
+        return self._mapping._storage.iter_tasks()
+
+
+class SqliteTaskMap(MutableMapping):
+    """
+    ID-keyed task mapping over the tasks table of a SqliteStorage.
+
+    Every read goes to the database and returns a new Task, so only the tasks
+    in use are held in memory. Rows are written by the storage's record hooks,
+    which TaskManager calls right after each change to this mapping; setting
+    and deleting items here therefore only validates the key.
+    """
+
+    def __init__(self, storage: SqliteStorage):
+        """
+        Wrap a SQLite backend.
+
+        Args:
+            storage (SqliteStorage): The backend holding the tasks
+        """
+        self._storage = storage
+
+    def __getitem__(self, task_id: int) -> Task:
+        task = self._storage.get(task_id) if isinstance(task_id, int) else None
+        if task is None:
+            raise KeyError(task_id)
+        return task
+
+    def __setitem__(self, task_id: int, task: Task) -> None:
+        if task_id != task.id:
+            raise KeyError(task_id)
+
+    def __delitem__(self, task_id: int) -> None:
+        if task_id not in self:
+            raise KeyError(task_id)
+
+    def __contains__(self, task_id) -> bool:
+        return isinstance(task_id, int) and self._storage.exists(task_id)
+
+    def __iter__(self) -> Iterator[int]:
+        return self._storage.iter_ids()
+
+    def __len__(self) -> int:
+        return len(self._storage)
+
+    def values(self) -> ValuesView:
+        return _SqliteValues(self)
+
+    def tasks_in_range(self, start: int, stop: int) -> List[Task]:
+        """Read the tasks with IDs in [start, stop) in ID order; see SqliteStorage.tasks_in_range()."""
+        return self._storage.tasks_in_range(start, stop)
@@ -2,8 +2,41 @@
 TaskManager class for the Console Todo App.
 Handles in-memory storage and operations for Task objects.
 """
-from typing import List, Optional
-from models.task import Task
+import marshal
+import weakref
+from contextlib import contextmanager
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, MutableMapping, Optional, Set, Tuple
+from change_feed import ChangeEvent, ChangeFeed, Subscription
+from config import HISTORY_MEMORY_BUDGET, PAGE_SIZE, SHARD_COUNT
+from history import (CHANGE_COMPLETED, CHANGE_DELETE, CHANGE_INSERT, CHANGE_UPDATE,
+                     OperationHistory, describe)
+from indexes.field_index import FieldIndex
+from indexes.heap_index import COMPLETED_KEY, ORDER_KEYS, HeapIndex, due_before_key
+from indexes.tag_index import TagIndex, parse_tag_query
+from models.task import UNCHANGED, Task
+from storage.backends import create_storage_backend
+from storage.base import StorageBackend, restore_id_order
+from storage.columnar import open_snapshot, write_snapshot
+from task_view import TaskView
+from utils.validation import (validate_due_date, validate_task, validate_task_batch, validate_task_changes,
+                              validate_task_changes_batch)
+
+if TYPE_CHECKING:
+    from indexes.inverted_index import InvertedIndex
+
+
+# Format version of the index images saved through the storage backend; bump it
+# whenever the state() of FieldIndex, InvertedIndex or HeapIndex changes shape
+IMAGE_VERSION = 1
+
+# Image names of the full-text search index and the tag index (field indexes
+# use "field-<name>", heap indexes "heap-<order>")
+SEARCH_IMAGE = "search"
+TAG_IMAGE = "tags"
+
+# Sort orders accepted by iter_tasks(): "priority" and "due"
+SORT_ORDERS = tuple(ORDER_KEYS)
 
 
 class TaskManager:
@@ -15,47 +48,144 @@ class TaskManager:
     - Provide CRUD operations for tasks
     - Generate unique IDs for new tasks
     - Validate task data before operations
+
+    Tasks are kept in a dict keyed by ID. Dicts preserve insertion order, so
+    the same structure serves as the O(1) ID index and as the ordered task
+    list: lookups, updates, toggles and deletes never scan or shift storage.
+    New tasks get ever larger IDs, and tasks restored by undo or redo are moved
+    back into place, so the list is always in ID order.
+
+    An optional storage backend receives one record per mutation and restores
+    the previous state when the manager is created.
+
+    Secondary indexes (such as the full-text search index) are registered in
+    self._indexes and kept in sync on every mutation. Each index exposes a
+    `fields` set plus add(task)/remove(task); remove is called before the
+    indexed fields change and add afterwards, and only for indexes whose
+    fields are affected. Field indexes (FieldIndex) group task IDs by the value
+    of one field, such as completion status, and are built on first use by
+    _field_index(field). Heap indexes (HeapIndex) order tasks by priority or
+    due date for sorted listings, next_tasks() and overdue_tasks(), and are
+    built on first use by _heap_index(order). The tag index (TagIndex) maps
+    each tag to its task IDs for tag queries and counts, and is built on first
+    use by _tags_index().
+
+    Every mutation is also recorded as a compact change in an in-memory undo
+    history (see history.py); a bulk operation is recorded as one step.
+    Once anyone subscribes, the same changes (including those made by undo
+    and redo) are also published to a change feed (see change_feed.py), so
+    consumers can follow the task list in O(changes) instead of re-reading it.
+
+    view() takes a point-in-time TaskView in O(1). While any view is open,
+    the mutation hooks preserve a task's original state for the views before
+    changing it. A task a view may still show is copied, and the copy is
+    changed in its place (copy-on-write; see _writable()), so tasks are only
+    changed in place when no open view can see them.
+
+    Building an index scans every task, which would otherwise happen again on
+    every launch. Backends that cache state images (see
+    StorageBackend.save_image) get each built index saved on close(), tagged
+    with IMAGE_VERSION and _next_id, and the next manager restores an index
+    from its image instead of rebuilding it, as long as nothing has changed
+    in between.
     """
     
-    def __init__(self):
-        """Initialize the TaskManager with an empty task list and ID counter."""
-        self.tasks: List[Task] = []
-        self._next_id = 1
+    def __init__(self, storage: Optional[StorageBackend] = None):
+        """
+        Initialize the TaskManager, restoring state from the storage backend if given.
+
+        Args:
+            storage (StorageBackend, optional): Persistence backend (in-memory if omitted)
+        """
+        self._storage = storage if storage is not None else StorageBackend()
+        self._tasks: MutableMapping[int, Task]
+        self._tasks, self._next_id = self._storage.load()
+        self._indexes: list = []
+        self._search_index: Optional["InvertedIndex"] = None
+        self._field_indexes: Dict[str, FieldIndex] = {}
+        self._heap_indexes: Dict[str, HeapIndex] = {}
+        self._tag_index: Optional[TagIndex] = None
+        self._history = OperationHistory(HISTORY_MEMORY_BUDGET)
+        self._changes: Optional[list] = None  # Changes of the bulk operation in progress
+        self._replaying = False
+        self._feed: Optional[ChangeFeed] = None  # Created by the first subscriber
+        self._modified = False  # Whether any task changed since load()
+        self._revision = 0  # Last version stamped on a task (see Task.version)
+        self._restored_images: set = set()  # Images restored unchanged from storage
+        self._views: "weakref.WeakSet[TaskView]" = weakref.WeakSet()  # Open views (see view())
+        self._view_revision = -1  # Revision of the newest open view; tasks stamped later are not shared
+
+    @classmethod
+    def open_snapshot(cls, path: str) -> "TaskManager":
+        """
+        Open a columnar snapshot file through mmap without loading every task.
+
+        Tasks are materialized only when accessed; changes made afterwards stay
+        in memory and are not written back to the file.
+
+        Args:
+            path (str): Path of a snapshot written by save_snapshot()
+
+        Returns:
+            TaskManager: A manager backed by the mapped snapshot
+        """
+        manager = cls()
+        manager._tasks, manager._next_id = open_snapshot(path)
+        return manager
+
+    def save_snapshot(self, path: str) -> int:
+        """
+        Write all tasks to a columnar snapshot file.
+
+        The tasks are read through a view(), so the file holds the task list
+        as it was when writing started even if tasks change meanwhile.
+
+        Args:
+            path (str): Destination file path (replaced atomically)
+
+        Returns:
+            int: The number of tasks written
+        """
+        with self.view() as view:
+            return write_snapshot(path, view, view.next_id)
+
+    @property
+    def tasks(self) -> List[Task]:
+        """
+        All stored tasks in ID order.
+
+        Returns:
+            List[Task]: A new list of the stored tasks
+        """
+        return list(self._tasks.values())
+
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+        return len(self._tasks)
     
-    def add_task(self, title: str, description: str = "") -> int:
+    def add_task(self, title: str, description: str = "", due: Optional[str] = None,
+                 priority: Optional[int] = None, tags=()) -> int:
         """
         Add a new task to the in-memory storage.
         
         Args:
             title (str): The task title (required, non-empty)
             description (str): The task description (optional)
+            due (str, optional): Due date as "YYYY-MM-DD" (or a datetime.date)
+            priority (int, optional): Priority from 1 (most urgent) to 5
+            tags (str or list, optional): Tags such as ["work", "project:website"]
+                or "work, project:website"
             
         Returns:
             int: The ID of the newly created task
         """
         # Validate inputs
-        if not title or not title.strip():
-            raise ValueError("Title cannot be empty")
-        
-        if len(title) > 200:
-            raise ValueError("Title must not exceed 200 characters")
-        
-        if len(description) > 1000:
-            raise ValueError("Description must not exceed 1000 characters")
-        
-        # Create new task with auto-incrementing ID
-        new_task = Task(
-            id=self._next_id,
-            title=title.strip(),
-            description=description.strip(),
-            completed=False
-        )
-        
-        # Add task to storage
-        self.tasks.append(new_task)
-        
-        # Increment ID for next task
-        self._next_id += 1
+        is_valid, error_msg, row = validate_task(title, description, False, due, priority, tags)
+        if not is_valid:
+            raise ValueError(error_msg)
+
+        new_task = self._insert_new(*row)
+        self._maybe_compact()
         
         return new_task.id
     
@@ -63,10 +193,94 @@ class TaskManager:
         """
         Retrieve all tasks from storage.
         
+        This copies every task reference; prefer iter_tasks() for displaying
+        or streaming large lists. The tasks are the stored objects, which later
+        changes update in place; use view() for a list that stays as it was.
+
         Returns:
             List[Task]: A list of all tasks (may be empty if no tasks exist)
         """
-        return self.tasks.copy()  # Return a copy to prevent external modification
+        return list(self._tasks.values())  # Return a copy to prevent external modification
+
+    def iter_tasks(self, offset: int = 0, limit: Optional[int] = None,
+                   predicate: Optional[Callable[[Task], bool]] = None,
+                   completed: Optional[bool] = None, sort: Optional[str] = None,
+                   tags: Optional[str] = None) -> Iterator[Task]:
+        """
+        Lazily iterate tasks, in ID order by default, without copying the task list.
+
+        Filtering by completion status goes through the status index, so a page
+        of pending or completed tasks costs O(page size), not O(number of tasks),
+        and lists them in ID order too.
+
+        With sort="priority" (most urgent first, then earliest due date) or
+        sort="due" (earliest due date first, then most urgent), tasks come from
+        a heap index instead: pending tasks first, then completed ones, and tasks
+        without a priority or due date after those with one. A page of k tasks
+        at offset m costs O((m + k) log(m + k)); completed tasks alone are
+        sorted as a group. Consume the iterator before changing any task.
+
+        With a tag query (see parse_tag_query(), e.g. "work and not someday"),
+        only matching tasks are listed, in ID order unless sorted. They are
+        found through the tag index, so the listing costs about the size of
+        the smallest tag set in the query, not the number of tasks.
+
+        Args:
+            offset (int): Number of (matching) tasks to skip
+            limit (int, optional): Maximum number of tasks to yield (all if None)
+            predicate (callable, optional): Only tasks for which predicate(task) is true
+            completed (bool, optional): Only completed (True) or pending (False) tasks
+            sort (str, optional): "priority" or "due" (ID order if None)
+            tags (str, optional): Only tasks matching this tag query
+
+        Returns:
+            Iterator[Task]: The selected tasks
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("Offset and limit must not be negative")
+        stop = None if limit is None else offset + limit
+
+        if tags is not None:
+            tasks = iter(self._tagged(tags, completed, sort))
+        elif sort is not None:
+            index = self._heap_index(sort)
+            if completed:
+                completed_ids = self._field_index("completed").ids(True)
+                ids = index.sorted_ids(completed_ids, None if predicate is not None else stop)
+            else:
+                ids = index.iter_ids(COMPLETED_KEY if completed is False else None)
+            tasks = map(self._tasks.__getitem__, ids)
+        elif completed is not None:
+            ids = self._field_index("completed").ids(bool(completed))
+            if predicate is None:
+                return map(self._tasks.__getitem__, ids[offset:stop])
+            tasks = map(self._tasks.__getitem__, ids)
+        else:
+            tasks = iter(self._tasks.values())
+
+        if predicate is not None:
+            tasks = (task for task in tasks if predicate(task))
+        return islice(tasks, offset, stop)
+
+    def count_tasks(self, completed: Optional[bool] = None, tags: Optional[str] = None) -> int:
+        """
+        Count stored tasks without materializing them.
+
+        Args:
+            completed (bool, optional): Count only completed (True) or pending (False) tasks
+            tags (str, optional): Count only tasks matching this tag query
+
+        Returns:
+            int: The number of tasks
+        """
+        if tags is not None:
+            ids = self._tag_ids(tags)
+            if completed is None:
+                return len(ids)
+            return sum(1 for task_id in ids if self._tasks[task_id].completed == completed)
+        if completed is None:
+            return len(self._tasks)
+        return self._field_index("completed").count(bool(completed))
     
     def get_task_by_id(self, task_id: int) -> Optional[Task]:
         """
@@ -81,20 +295,22 @@ class TaskManager:
         if not isinstance(task_id, int) or task_id <= 0:
             return None
         
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        
-        return None
+        return self._tasks.get(task_id)
     
-    def update_task(self, task_id: int, title: str = None, description: str = None) -> bool:
+    def update_task(self, task_id: int, title: str = None, description: str = None,
+                    due=UNCHANGED, priority=UNCHANGED, tags=UNCHANGED) -> bool:
         """
-        Update the title and/or description of an existing task.
+        Update the title, description, due date, priority and/or tags of an existing task.
         
         Args:
             task_id (int): The ID of the task to update (must be a positive integer)
             title (str, optional): New title for the task (if provided, must be non-empty)
             description (str, optional): New description for the task
+            due (str, optional): New due date as "YYYY-MM-DD"; None removes it,
+                UNCHANGED (the default) keeps it
+            priority (int, optional): New priority; None removes it, UNCHANGED keeps it
+            tags (str or list, optional): New tags, replacing the current ones; None
+                removes them all, UNCHANGED keeps them
             
         Returns:
             bool: True if the task was successfully updated, False if the task ID doesn't exist
@@ -104,22 +320,14 @@ class TaskManager:
         if task is None:
             return False
         
-        # Validate and update title if provided
-        if title is not None:
-            if not title.strip():
-                raise ValueError("Title cannot be empty")
-            
-            if len(title) > 200:
-                raise ValueError("Title must not exceed 200 characters")
-            
-            task.title = title.strip()
-        
-        # Update description if provided
-        if description is not None:
-            if len(description) > 1000:
-                raise ValueError("Description must not exceed 1000 characters")
-            
-            task.description = description.strip()
+        # Validate everything before touching the task so a failed update
+        # never leaves it (or the journal) half-applied
+        is_valid, error_msg, changes = validate_task_changes(title, description, due, priority, tags, UNCHANGED)
+        if not is_valid:
+            raise ValueError(error_msg)
+
+        self._apply_update(task, *changes)
+        self._maybe_compact()
         
         return True
     
@@ -137,7 +345,8 @@ class TaskManager:
         if task is None:
             return False
         
-        self.tasks.remove(task)
+        self._remove(task)
+        self._maybe_compact()
         return True
     
     def toggle_task_completion(self, task_id: int) -> bool:
@@ -154,9 +363,307 @@ class TaskManager:
         if task is None:
             return False
         
-        task.completed = not task.completed
+        self._apply_completed(task, not task.completed)
+        self._maybe_compact()
         return True
+
+    def add_tasks(self, items: Iterable[tuple], validated: bool = False) -> List[int]:
+        """
+        Add many tasks at once.
+
+        The whole batch is validated before anything is added, so either every
+        task is added or (on a ValueError) none is. The batch is persisted as a
+        single storage unit.
+
+        Args:
+            items (Iterable[tuple]): (title, description) pairs, optionally followed
+                by completed, due, priority and tags, e.g.
+                (title, description, False, "2026-03-01", 2, ["work"])
+            validated (bool): The items are full rows already normalized by
+                validate_task() (e.g. through validate_record()); they are stored
+                as they are instead of being validated again
+
+        Returns:
+            List[int]: The IDs of the new tasks, in input order
+        """
+        if validated:
+            rows = items
+        else:
+            rows, errors = validate_task_batch(items)
+            self._raise_row_error(errors)
+
+        with self._bulk():
+            ids = [self._insert_new(*row).id for row in rows]
+        return ids
+
+    def update_tasks(self, updates: Iterable[tuple]) -> int:
+        """
+        Update the title, description, due date, priority and/or tags of many tasks at once.
+
+        Every ID must exist and every new value must be valid, otherwise a
+        ValueError is raised and no task is changed.
+
+        Args:
+            updates (Iterable[tuple]): (task ID, new title or None, new description or None)
+                triples, optionally followed by a new due date, priority and tags
+                (None removes them, UNCHANGED keeps them)
+
+        Returns:
+            int: The number of tasks updated
+        """
+        rows, errors = validate_task_changes_batch(updates, UNCHANGED)
+        self._raise_row_error(errors)
+        resolved = [(self._require_task(task_id), *changes) for task_id, *changes in rows]
+
+        with self._bulk():
+            for update in resolved:
+                self._apply_update(*update)
+        return len(resolved)
+
+    def delete_tasks(self, task_ids: Iterable[int]) -> int:
+        """
+        Delete many tasks at once.
+
+        Every ID must exist, otherwise a ValueError is raised and nothing is deleted.
+        Repeated IDs are deleted once.
+
+        Args:
+            task_ids (Iterable[int]): IDs of the tasks to delete
+
+        Returns:
+            int: The number of tasks deleted
+        """
+        tasks = [self._require_task(task_id) for task_id in dict.fromkeys(task_ids)]
+
+        with self._bulk():
+            for task in tasks:
+                self._remove(task)
+        return len(tasks)
+
+    def set_completed(self, task_ids: Iterable[int], value: bool) -> int:
+        """
+        Set the completion status of many tasks at once.
+
+        Every ID must exist, otherwise a ValueError is raised and nothing changes.
+        Tasks that already have the requested status are left untouched.
+
+        Args:
+            task_ids (Iterable[int]): IDs of the tasks to change
+            value (bool): True to mark complete, False to mark incomplete
+
+        Returns:
+            int: The number of tasks whose status changed
+        """
+        if not isinstance(value, bool):
+            raise ValueError("Completed must be a boolean value")
+        tasks = [self._require_task(task_id) for task_id in dict.fromkeys(task_ids)]
+        changed = [task for task in tasks if task.completed != value]
+
+        with self._bulk():
+            for task in changed:
+                self._apply_completed(task, value)
+        return len(changed)
+
+    def toggle_tasks(self, task_ids: Iterable[int]) -> int:
+        """
+        Toggle the completion status of many tasks at once.
+
+        Every ID must exist, otherwise a ValueError is raised and nothing changes.
+        Repeated IDs are toggled once.
+
+        Args:
+            task_ids (Iterable[int]): IDs of the tasks to toggle
+
+        Returns:
+            int: The number of tasks toggled
+        """
+        tasks = [self._require_task(task_id) for task_id in dict.fromkeys(task_ids)]
+
+        with self._bulk():
+            for task in tasks:
+                self._apply_completed(task, not task.completed)
+        return len(tasks)
     
+    def undo(self) -> Optional[str]:
+        """
+        Revert the most recent operation (single or bulk).
+
+        The reverted changes are persisted like any other mutation. A deleted
+        task comes back with its original ID at the end of the list.
+
+        Returns:
+            Optional[str]: A description of the undone operation, or None if there was nothing to undo
+        """
+        changes = self._history.pop_undo()
+        if changes is None:
+            return None
+        self._replay(reversed(changes), undo=True)
+        return describe(changes)
+
+    def redo(self) -> Optional[str]:
+        """
+        Re-apply the most recently undone operation.
+
+        Returns:
+            Optional[str]: A description of the redone operation, or None if there was nothing to redo
+        """
+        changes = self._history.pop_redo()
+        if changes is None:
+            return None
+        self._replay(changes, undo=False)
+        return describe(changes)
+
+    def subscribe(self, since: Optional[int] = None, callback: Optional[Callable[[ChangeEvent], None]] = None,
+                  max_lag: Optional[int] = None) -> Subscription:
+        """
+        Follow task changes as ordered, sequence-numbered events.
+
+        The subscription works as a bounded queue (get(), get_nowait(), poll()),
+        as a blocking iterator or as an async iterator; with a callback, events
+        are delivered from a background thread instead. Writers never wait for
+        subscribers: one more than max_lag events behind (or behind the feed's
+        retention) gets ChangeFeedGap and has to reload the tasks.
+
+        To mirror the task list, subscribe first, then read the tasks and apply
+        the events (see ChangeEvent.apply()); events already reflected in the
+        listing apply harmlessly.
+
+        Args:
+            since (int, optional): Resume after this sequence number (from now if None)
+            callback (callable, optional): Called with each ChangeEvent
+            max_lag (int, optional): Pending events allowed before the subscription gaps
+
+        Returns:
+            Subscription: The new subscription
+        """
+        return self._change_feed().subscribe(since, callback, max_lag)
+
+    def changes(self, since: Optional[int] = None, limit: Optional[int] = None) -> Tuple[List[ChangeEvent], int]:
+        """
+        Return the changes made after a sequence number, for consumers that poll.
+
+        Args:
+            since (int, optional): Sequence number of the last change seen (none are
+                returned if None, which just reports where the feed is)
+            limit (int, optional): Maximum number of events
+
+        Returns:
+            Tuple[List[ChangeEvent], int]: The events, oldest first, and the feed's
+            latest sequence number
+
+        Raises:
+            ChangeFeedGap: If the changes after since are no longer retained
+        """
+        feed = self._change_feed()
+        last_seq = feed.last_seq
+        if since is None:
+            return [], last_seq
+        return feed.read(since, limit), last_seq
+
+    def view(self) -> TaskView:
+        """
+        Take a read-only, point-in-time view of the task list in O(1).
+
+        Exports, reports and renders reading through the view see the tasks as
+        they are now, even while tasks are added, changed and deleted. Writers
+        copy a task before its first change for as long as a view may show it;
+        nothing else is copied. Close the view (or use it as a context manager)
+        when done.
+
+        Returns:
+            TaskView: The view
+        """
+        view = TaskView(self, self._revision, self._next_id, len(self._tasks))
+        self._views.add(view)
+        self._view_revision = self._revision
+        return view
+
+    def next_tasks(self, limit: int = PAGE_SIZE) -> List[Task]:
+        """
+        Return the pending tasks to work on next.
+
+        Tasks are ordered by priority (1 first), then due date (earliest first),
+        then ID; tasks without a priority or due date come after those with
+        one. Reads the k first entries of the priority heap in O(k log k).
+
+        Args:
+            limit (int): Maximum number of tasks to return
+
+        Returns:
+            List[Task]: Up to limit pending tasks, most urgent first
+        """
+        return list(self.iter_tasks(limit=limit, completed=False, sort="priority"))
+
+    def overdue_tasks(self, offset: int = 0, limit: Optional[int] = None,
+                      today: Optional[str] = None) -> List[Task]:
+        """
+        Return pending tasks whose due date has passed, most overdue first.
+
+        Walks the due-date heap only as far as the first task due today or
+        later, so a page of k tasks costs O((offset + k) log(offset + k)).
+
+        Args:
+            offset (int): Number of overdue tasks to skip
+            limit (int, optional): Maximum number of tasks to return (all if None)
+            today (str, optional): Reference date as "YYYY-MM-DD" (the current date if None)
+
+        Returns:
+            List[Task]: The overdue tasks, earliest due date first
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("Offset and limit must not be negative")
+        ids = self._heap_index("due").iter_ids(self._overdue_stop(today))
+        stop = None if limit is None else offset + limit
+        return [self._tasks[task_id] for task_id in islice(ids, offset, stop)]
+
+    def count_overdue(self, today: Optional[str] = None) -> int:
+        """
+        Count pending tasks whose due date has passed.
+
+        Args:
+            today (str, optional): Reference date as "YYYY-MM-DD" (the current date if None)
+
+        Returns:
+            int: The number of overdue tasks
+        """
+        return sum(1 for _ in self._heap_index("due").iter_ids(self._overdue_stop(today)))
+
+    def statistics(self, today: Optional[str] = None) -> dict:
+        """
+        Summary statistics over every task, computed column-wise.
+
+        The tasks are exported to typed columns (NumPy arrays when NumPy is
+        installed) and aggregated in whole-column passes; tasks loaded from a
+        columnar snapshot are read straight from the mapped file.
+
+        Args:
+            today (str, optional): Reference date for overdue tasks (the current date if None)
+
+        Returns:
+            dict: Totals and completion rate, overdue count, counts by priority,
+                the description length distribution and tasks per due date;
+                see utils.analytics.TaskCounts.summary()
+        """
+        return self._statistics_counts(today).summary()
+
+    def _statistics_counts(self, today: Optional[str]):
+        """Aggregate every task into mergeable utils.analytics.TaskCounts."""
+        from utils.analytics import TaskColumns, count_columns
+        return count_columns(TaskColumns.from_task_map(self._tasks), self._check_today(today))
+
+    def _overdue_stop(self, today: Optional[str]) -> int:
+        """Return the due-heap key overdue listings stop at."""
+        return due_before_key(self._check_today(today))
+
+    def tag_counts(self) -> Dict[str, int]:
+        """
+        Count the tasks carrying each tag.
+
+        Returns:
+            Dict[str, int]: Task counts by tag, in tag order
+        """
+        return self._tags_index().counts()
+
     def get_next_id(self) -> int:
         """
         Get the next available ID without incrementing the counter.
@@ -164,4 +671,437 @@ class TaskManager:
         Returns:
             int: The next available ID
         """
-        return self._next_id
\ No newline at end of file
+        return self._next_id
+
+    def search(self, query: str, limit: int = 20, prefix: bool = True) -> List[Task]:
+        """
+        Full-text search over task titles and descriptions.
+
+        Every query term must match (as a word, or as a word prefix when
+        prefix=True). Results are ranked by TF-IDF with title matches weighted
+        above description matches. The index is built on the first search and
+        maintained incrementally afterwards.
+
+        Args:
+            query (str): Free-text query
+            limit (int): Maximum number of results to return
+            prefix (bool): Whether terms also match longer words they start
+
+        Returns:
+            List[Task]: Matching tasks, best match first
+        """
+        return [self._tasks[task_id] for task_id, _ in self._search_ranked(query, limit, prefix)]
+
+    def _search_ranked(self, query: str, limit: int, prefix: bool) -> List[Tuple[int, float]]:
+        """Run a search, building the index on first use; returns (task ID, score) pairs."""
+        if self._search_index is None:
+            from indexes.inverted_index import InvertedIndex
+            state = self._load_image(SEARCH_IMAGE)
+            if state is not None:
+                index = InvertedIndex.from_state(state)
+            else:
+                index = InvertedIndex()
+                index.rebuild(self._tasks.values())
+            self._search_index = index
+            self._indexes.append(index)
+
+        return self._search_index.search(query, limit, prefix)
+
+    def _tags_index(self) -> TagIndex:
+        """Return the tag index, building (or restoring) it on first use."""
+        if self._tag_index is None:
+            state = self._load_image(TAG_IMAGE)
+            if state is not None:
+                index = TagIndex.from_state(state)
+            else:
+                index = TagIndex()
+                index.rebuild(self._tasks.values())
+            self._tag_index = index
+            self._indexes.append(index)
+        return self._tag_index
+
+    def _tag_ids(self, query: str) -> Set[int]:
+        """Return the IDs of the tasks matching a tag query (the set must not be modified)."""
+        return self._tags_index().query(parse_tag_query(query), self._tasks.keys)
+
+    def _tagged(self, query: str, completed: Optional[bool], sort: Optional[str]) -> List[Task]:
+        """Return the tasks matching a tag query and status, in ID order or a sort order."""
+        if sort is not None and sort not in ORDER_KEYS:
+            raise ValueError(f"Sort order must be one of: {', '.join(SORT_ORDERS)}")
+        tasks = [self._tasks[task_id] for task_id in sorted(self._tag_ids(query))]
+        if completed is not None:
+            tasks = [task for task in tasks if task.completed == completed]
+        if sort is not None:
+            tasks.sort(key=ORDER_KEYS[sort])
+        return tasks
+
+    def _field_index(self, field: str) -> FieldIndex:
+        """
+        Return the index of tasks by the value of a field, building it on first use.
+
+        A storage backend that maintains such an index itself (see
+        StorageBackend.field_index) provides it instead.
+
+        Args:
+            field (str): Name of the Task attribute to index
+
+        Returns:
+            FieldIndex: The maintained index for that field
+        """
+        index = self._field_indexes.get(field)
+        if index is None:
+            index = self._storage.field_index(field)
+            if index is None:
+                state = self._load_image(f"field-{field}")
+                if state is not None:
+                    index = FieldIndex.from_state(field, state)
+                else:
+                    index = FieldIndex(field)
+                    index.rebuild(self._tasks.values())
+                self._indexes.append(index)
+            self._field_indexes[field] = index
+        return index
+
+    def _heap_index(self, order: str) -> HeapIndex:
+        """
+        Return the heap index for a sort order, building it on first use.
+
+        Args:
+            order (str): One of SORT_ORDERS
+
+        Returns:
+            HeapIndex: The maintained index for that order
+        """
+        index = self._heap_indexes.get(order)
+        if index is None:
+            if order not in ORDER_KEYS:
+                raise ValueError(f"Sort order must be one of: {', '.join(SORT_ORDERS)}")
+            state = self._load_image(f"heap-{order}")
+            if state is not None:
+                index = HeapIndex.from_state(order, state)
+            else:
+                index = HeapIndex(order)
+                index.rebuild(self._tasks.values())
+            self._heap_indexes[order] = index
+            self._indexes.append(index)
+        return index
+
+    def _load_image(self, name: str):
+        """
+        Decode an index image from storage if it describes the current tasks.
+
+        Args:
+            name (str): Image name
+
+        Returns:
+            The index state saved with the image, or None if it must be rebuilt
+        """
+        if self._modified:
+            return None
+        data = self._storage.load_image(name)
+        if data is None:
+            return None
+        try:
+            version, next_id, count, state = marshal.loads(data)
+        except (EOFError, ValueError, TypeError):
+            return None
+        if version != IMAGE_VERSION or next_id != self._next_id or count != len(self._tasks):
+            return None
+        self._restored_images.add(name)
+        return state
+
+    def _save_images(self) -> None:
+        """Save an image of every built index the storage does not already hold unchanged."""
+        if not self._storage.caches_images:
+            return
+        images = {f"field-{field}": index for field, index in self._field_indexes.items()
+                  if isinstance(index, FieldIndex)}
+        images.update((f"heap-{order}", index) for order, index in self._heap_indexes.items())
+        if self._search_index is not None:
+            images[SEARCH_IMAGE] = self._search_index
+        if self._tag_index is not None:
+            images[TAG_IMAGE] = self._tag_index
+        for name, index in images.items():
+            if self._modified or name not in self._restored_images:
+                data = marshal.dumps((IMAGE_VERSION, self._next_id, len(self._tasks), index.state()))
+                self._storage.save_image(name, data)
+
+    @staticmethod
+    def _check_today(today) -> str:
+        """Return the reference date of an overdue query as "YYYY-MM-DD", defaulting to the current date."""
+        if today is None:
+            from datetime import date
+            return date.today().isoformat()
+        is_valid, error_msg, today = validate_due_date(today)
+        if not is_valid:
+            raise ValueError(error_msg)
+        if today is None:
+            raise ValueError("Reference date cannot be empty")
+        return today
+
+    @staticmethod
+    def _raise_row_error(errors: List[Tuple[int, str]]) -> None:
+        """Raise ValueError naming the first invalid row of a batch, if any."""
+        if errors:
+            position, error_msg = errors[0]
+            raise ValueError(f"Row {position}: {error_msg}")
+
+    def _require_task(self, task_id: int) -> Task:
+        """Return the task with the given ID or raise ValueError."""
+        task = self.get_task_by_id(task_id)
+        if task is None:
+            raise ValueError(f"Task with ID {task_id} does not exist")
+        return task
+
+    def _insert_new(self, title: str, description: str, completed: bool = False,
+                    due: Optional[str] = None, priority: Optional[int] = None,
+                    tags: Tuple[str, ...] = ()) -> Task:
+        """Create, index and persist a task from validated, normalized input."""
+        # Create new task with auto-incrementing ID
+        new_task = Task.trusted(self._next_id, title, description, completed, due, priority, tags)
+
+        # Increment ID for next task
+        self._next_id += 1
+
+        self._insert(new_task)
+        return new_task
+
+    def _insert(self, task: Task) -> None:
+        """Store, index, persist and record a task whose ID is not in use."""
+        if self._views:
+            self._preserve(task.id, None)
+        self._stamp(task)
+        self._tasks[task.id] = task
+        self._index_add(task)
+
+        self._storage.record_add(task)
+        self._record((CHANGE_INSERT, task.id, task.title, task.description, task.completed,
+                      task.due, task.priority, task.tags))
+
+    def _apply_update(self, task: Task, title: Optional[str], description: Optional[str],
+                      due=UNCHANGED, priority=UNCHANGED, tags=UNCHANGED) -> None:
+        """Change a task's text, schedule and tags from validated input, keeping indexes and storage in sync."""
+        task = self._writable(task)
+        old = (task.title, task.description, task.due, task.priority, task.tags)
+        changed = set()
+        if title is not None:
+            changed.add("title")
+        if description is not None:
+            changed.add("description")
+        if due is not UNCHANGED:
+            changed.add("due")
+        if priority is not UNCHANGED:
+            changed.add("priority")
+        if tags is not UNCHANGED:
+            changed.add("tags")
+
+        self._index_remove(task, changed)
+        if title is not None:
+            task.title = title
+        if description is not None:
+            task.description = description
+        if due is not UNCHANGED:
+            task.due = due
+        if priority is not UNCHANGED:
+            task.priority = priority
+        if tags is not UNCHANGED:
+            task.tags = tags
+        self._stamp(task)
+        self._index_add(task, changed)
+
+        self._storage.record_update(task)
+        self._record((CHANGE_UPDATE, task.id, *old, task.title, task.description, task.due, task.priority,
+                      task.tags))
+
+    def _apply_completed(self, task: Task, value: bool) -> None:
+        """Set a task's completion status, keeping indexes and storage in sync."""
+        task = self._writable(task)
+        self._index_remove(task, {"completed"})
+        task.completed = value
+        self._stamp(task)
+        self._index_add(task, {"completed"})
+
+        self._storage.record_toggle(task)
+        self._record((CHANGE_COMPLETED, task.id, value))
+
+    def _remove(self, task: Task) -> None:
+        """Delete a task, keeping indexes and storage in sync."""
+        if self._views:
+            self._preserve(task.id, task)
+        self._index_remove(task)
+        del self._tasks[task.id]
+
+        self._storage.record_delete(task.id)
+        self._record((CHANGE_DELETE, task.id, task.title, task.description, task.completed,
+                      task.due, task.priority, task.tags))
+
+    def _writable(self, task: Task) -> Task:
+        """
+        Return the object to change a task through, copying it first if an open view may show it.
+
+        A task stamped after the newest open view was taken is changed in
+        place. Otherwise the task is preserved for the open views and a copy
+        takes its place in the store (copy-on-write), so objects handed out by
+        a view never change while it is open.
+        """
+        if task.version > self._view_revision or not self._views:
+            return task
+        current = self._tasks[task.id]
+        if current.version > self._view_revision:
+            return current  # Already copied by an earlier change in the same operation
+        self._preserve(current.id, current)
+        copy = current.copy()
+        self._tasks[copy.id] = copy
+        return copy
+
+    def _preserve(self, task_id: int, task: Optional[Task]) -> None:
+        """Hand a task's state before a change (None if it does not exist yet) to every open view."""
+        for view in self._views:
+            view.preserve(task_id, task)
+
+    def _view_lookup(self, task_id: int) -> Optional[Task]:
+        """Read a live task for a view (see TaskView.get_task_by_id)."""
+        return self._tasks.get(task_id)
+
+    def _view_chunk(self, start: int, stop: int) -> List[Task]:
+        """
+        Read the live tasks with IDs in [start, stop), in ID order, for a view to walk.
+
+        Storage mappings that can read a range of IDs without caching the
+        tasks (snapshot and SQLite backed ones) do so; a plain dict is probed
+        ID by ID.
+        """
+        tasks_in_range = getattr(self._tasks, "tasks_in_range", None)
+        if tasks_in_range is not None:
+            return tasks_in_range(start, stop)
+        return [task for task in map(self._tasks.get, range(start, stop)) if task is not None]
+
+    def _release_view(self, view: TaskView) -> None:
+        """Forget a closed view, so writers stop copying tasks for it."""
+        self._views.discard(view)
+        self._view_revision = max((other.revision for other in self._views), default=-1)
+
+    def _stamp(self, task: Task) -> None:
+        """Give a task being stored or changed a new version, so caches see the change."""
+        self._revision += 1
+        task.version = self._revision
+
+    def _change_feed(self) -> ChangeFeed:
+        """Return the change feed, creating it on first use."""
+        if self._feed is None:
+            self._feed = ChangeFeed()
+        return self._feed
+
+    def _record(self, change: tuple) -> None:
+        """Publish a change and add it to the undo history (as its own step unless a bulk operation is open)."""
+        self._modified = True
+        if self._changes is not None and not self._replaying:
+            self._changes.append(change)  # Published with the rest of the bulk operation
+            return
+        if self._feed is not None:
+            self._feed.publish(change)
+        if not self._replaying:
+            self._history.record([change])
+
+    @contextmanager
+    def _bulk(self):
+        """Apply the mutations made inside the block as one storage unit and one undo step."""
+        outermost = self._changes is None
+        if outermost:
+            self._changes = []
+        try:
+            with self.batch():
+                yield
+        finally:
+            if outermost:
+                changes, self._changes = self._changes, None
+                if changes:
+                    self._history.record(changes)
+                    if self._feed is not None:
+                        self._feed.publish_many(changes)
+
+    def _replay(self, changes: Iterable[tuple], undo: bool) -> None:
+        """Apply recorded changes backwards (undo) or forwards (redo) without recording them."""
+        self._replaying = True
+        inserted = []
+        try:
+            with self.batch():
+                for change in changes:
+                    kind, task_id = change[0], change[1]
+                    if kind == CHANGE_UPDATE:
+                        self._apply_update(self._tasks[task_id], *(change[2:7] if undo else change[7:12]))
+                    elif kind == CHANGE_COMPLETED:
+                        self._apply_completed(self._tasks[task_id], change[2] != undo)
+                    elif (kind == CHANGE_INSERT) == undo:  # Undoing an add or redoing a delete
+                        self._remove(self._tasks[task_id])
+                    else:
+                        self._insert(Task.trusted(*change[1:]))
+                        inserted.append(task_id)
+        finally:
+            self._replaying = False
+            restore_id_order(self._tasks, inserted)
+
+    @contextmanager
+    def batch(self):
+        """
+        Group the mutations made inside the block into one storage unit.
+
+        Bulk operations use this internally; callers applying many single-task
+        operations in a row (e.g. the socket server) can use it for group commit.
+        It does not roll back changes made before an exception.
+        """
+        self._storage.begin_batch()
+        try:
+            yield
+        finally:
+            self._storage.end_batch()
+        self._maybe_compact()
+
+    def _index_add(self, task: Task, fields: Optional[Iterable[str]] = None) -> None:
+        """Add a task to every index (or only to those covering the changed fields)."""
+        for index in self._indexes:
+            if fields is None or not index.fields.isdisjoint(fields):
+                index.add(task)
+
+    def _index_remove(self, task: Task, fields: Optional[Iterable[str]] = None) -> None:
+        """Remove a task from every index (or only from those covering the changed fields)."""
+        for index in self._indexes:
+            if fields is None or not index.fields.isdisjoint(fields):
+                index.remove(task)
+
+    def _maybe_compact(self) -> None:
+        """Snapshot the full state into storage when the backend asks for it."""
+        if self._storage.needs_compaction():
+            self._storage.compact(self._tasks.values(), self._next_id)
+
+    def flush(self) -> None:
+        """Force buffered storage records to disk."""
+        self._storage.flush()
+
+    def close(self) -> None:
+        """Save the index images, then flush and release the storage backend."""
+        if self._feed is not None:
+            self._feed.close()
+        self._save_images()
+        self._storage.close()
+
+
+def create_task_manager(storage_name: Optional[str] = None, data_dir: Optional[str] = None,
+                        shards: Optional[int] = None):
+    """
+    Build the task manager the app runs on, as configured in config.py.
+
+    Args:
+        storage_name (str, optional): Storage backend name (defaults to STORAGE_BACKEND)
+        data_dir (str, optional): Data directory (defaults to DATA_DIR)
+        shards (int, optional): Worker processes (defaults to SHARD_COUNT); more than 1
+            gives a ShardedTaskManager with the same interface
+
+    Returns:
+        TaskManager: The manager (or a ShardedTaskManager)
+    """
+    shards = SHARD_COUNT if shards is None else shards
+    if shards > 1:
+        from sharded_task_manager import ShardedTaskManager
+        return ShardedTaskManager(shards, storage_name, data_dir)
+    return TaskManager(create_storage_backend(storage_name, data_dir))
@@ -0,0 +1,180 @@
+"""
+Point-in-time views of a TaskManager's task list.
+Taking a view is O(1); writers copy a task before changing it while an open view may still show it.
+"""
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional
+from models.task import Task
+
+if TYPE_CHECKING:
+    from task_manager import TaskManager
+
+
+# Task IDs read from the live store per step of an iteration
+CHUNK_SIZE = 4096
+
+
+class TaskView:
+    """
+    Read-only view of the tasks as they were when it was taken.
+
+    Taking a view copies nothing. Instead, while the view is open, TaskManager
+    copies a task before changing it if the view may still show it
+    (copy-on-write). The changed copy takes the task's place in the store and
+    the untouched original is preserved for the view. A deleted task is
+    preserved as it was. The view answers from its preserved tasks first and
+    from the live tasks otherwise. Writers therefore never wait for a view or
+    copy the whole store, and a view's readers see a frozen list however many
+    changes are made meanwhile.
+
+    A live task changed after the view was taken has a version above the
+    view's revision, so the view can tell stale live tasks apart without
+    locking them. Iterating walks the live store lazily, CHUNK_SIZE task IDs
+    at a time in ID order, so reading a view holds no more tasks in memory
+    than the store itself does and a walk resumes correctly whatever writers
+    change between two chunks.
+
+    Task objects read from a view keep their values for as long as it is open;
+    after close() the manager changes tasks in place again. Close views when
+    done, or use them as context managers. An open view keeps every task
+    changed since it was taken alive, and the first change of each such task
+    makes a copy.
+    """
+
+    def __init__(self, manager: "TaskManager", revision: int, next_id: int, count: int):
+        """
+        Create a view; use TaskManager.view() rather than calling this directly.
+
+        Args:
+            manager (TaskManager): The manager whose tasks are viewed
+            revision (int): The manager's last revision stamp when the view was taken
+            next_id (int): The manager's next task ID when the view was taken
+            count (int): The number of tasks when the view was taken
+        """
+        self._manager = manager
+        self.revision = revision
+        self.next_id = next_id
+        self._count = count
+        # Original state of every task changed since the view was taken (None: it did not exist)
+        self._preserved: Dict[int, Optional[Task]] = {}
+        self.closed = False
+
+    def preserve(self, task_id: int, task: Optional[Task]) -> None:
+        """
+        Keep a task's state from before its first change since the view was taken.
+
+        Called by TaskManager before it changes, deletes or inserts a task.
+        Tasks with IDs handed out after the view was taken are never visible
+        in it, so they are not recorded.
+
+        Args:
+            task_id (int): The task ID
+            task (Task, optional): The task as it is before the change, or None
+                if it does not exist yet
+        """
+        if task_id < self.next_id and task_id not in self._preserved:
+            self._preserved[task_id] = task
+
+    def get_task_by_id(self, task_id: int) -> Optional[Task]:
+        """
+        Look up a task as it was when the view was taken.
+
+        Args:
+            task_id (int): The task ID
+
+        Returns:
+            Optional[Task]: The task, or None if it did not exist then
+        """
+        self._check_open()
+        if not isinstance(task_id, int) or task_id <= 0 or task_id >= self.next_id:
+            return None
+        preserved = self._preserved
+        if task_id in preserved:
+            return preserved[task_id]
+        task = self._manager._view_lookup(task_id)
+        # A writer changing the task meanwhile preserves the original before changing anything
+        return preserved.get(task_id, task)
+
+    def __iter__(self) -> Iterator[Task]:
+        """Iterate the tasks in ID order, as they were when the view was taken."""
+        self._check_open()
+        return self._walk()
+
+    def _walk(self) -> Iterator[Task]:
+        """Read the live store one chunk of IDs at a time, swapping in preserved tasks."""
+        manager = self._manager
+        for start in range(1, self.next_id, CHUNK_SIZE):
+            self._check_open()
+            stop = min(start + CHUNK_SIZE, self.next_id)
+            tasks = manager._view_chunk(start, stop)
+            # Writers preserve a task before changing or deleting it, so with
+            # nothing preserved every task read is as it was when the view was taken
+            yield from self._visible(tasks, start, stop) if self._preserved else tasks
+
+    def _visible(self, tasks: List[Task], start: int, stop: int) -> Iterator[Task]:
+        """Restore the tasks with IDs in [start, stop) changed, deleted or added since the view was taken."""
+        preserved = self._preserved
+        revision = self.revision
+        live = {task.id: task for task in tasks}
+        for task_id in range(start, stop):
+            task = live.get(task_id)
+            if task is None or task.version > revision:
+                task = preserved.get(task_id)
+                if task is None:
+                    continue  # Added since the view was taken, or never existed
+            yield task
+
+    def iter_tasks(self, offset: int = 0, limit: Optional[int] = None,
+                   predicate: Optional[Callable[[Task], bool]] = None,
+                   completed: Optional[bool] = None) -> Iterator[Task]:
+        """
+        Iterate the tasks of the view, like TaskManager.iter_tasks().
+
+        Args:
+            offset (int): Number of (matching) tasks to skip
+            limit (int, optional): Maximum number of tasks to yield (all if None)
+            predicate (callable, optional): Only tasks for which predicate(task) is true
+            completed (bool, optional): Only completed (True) or pending (False) tasks
+
+        Returns:
+            Iterator[Task]: The selected tasks
+        """
+        if offset < 0 or (limit is not None and limit < 0):
+            raise ValueError("Offset and limit must not be negative")
+        tasks = iter(self)
+        if completed is not None:
+            tasks = (task for task in tasks if task.completed == completed)
+        if predicate is not None:
+            tasks = (task for task in tasks if predicate(task))
+        return islice(tasks, offset, None if limit is None else offset + limit)
+
+    def get_all_tasks(self) -> List[Task]:
+        """
+        Return every task of the view.
+
+        Returns:
+            List[Task]: The tasks, in the store's order
+        """
+        return list(self)
+
+    def __len__(self) -> int:
+        """Return the number of tasks when the view was taken."""
+        return self._count
+
+    def close(self) -> None:
+        """Release the view, so writers stop copying tasks for it."""
+        if not self.closed:
+            self.closed = True
+            self._manager._release_view(self)
+            self._preserved = {}
+
+    def _check_open(self) -> None:
+        """Raise ValueError if the view has been closed."""
+        if self.closed:
+            raise ValueError("Task view is closed")
+
+    def __enter__(self) -> "TaskView":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
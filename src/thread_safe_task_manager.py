@@ -0,0 +1,182 @@
+"""
+Thread-safe TaskManager for the Console Todo App.
+Guards every TaskManager operation with a reader/writer lock so one instance
+can be shared between worker threads.
+"""
+import functools
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+from change_feed import ChangeFeed
+from models.task import Task
+from storage.base import StorageBackend
+from task_manager import TaskManager
+from utils.rwlock import ReadWriteLock
+
+
+def _reader(method):
+    """Run a TaskManager method under the shared read lock."""
+    @functools.wraps(method)
+    def locked(self, *args, **kwargs):
+        with self._lock.read_locked():
+            return method(self, *args, **kwargs)
+    return locked
+
+
+def _writer(method):
+    """Run a TaskManager method under the exclusive write lock."""
+    @functools.wraps(method)
+    def locked(self, *args, **kwargs):
+        with self._lock.write_locked():
+            return method(self, *args, **kwargs)
+    return locked
+
+
+class ThreadSafeTaskManager(TaskManager):
+    """
+    TaskManager that can be shared safely across threads.
+
+    Lookups, listings, counts and searches take the read lock, so readers never
+    block each other. Every mutation takes the write lock, which also makes ID
+    allocation atomic. Listings are copied while the read lock is held, so each
+    one is a consistent snapshot even if writers run while it is consumed.
+    The Task objects handed out are still the live ones, so read their fields
+    before releasing them to other threads if a stable value matters, or read
+    through a view(): taking one holds the write lock for O(1), and reading it
+    only holds the read lock while each chunk of task IDs is read, so a long
+    export or report does not hold up writers.
+    """
+
+    def __init__(self, storage: Optional[StorageBackend] = None):
+        """
+        Initialize the manager and its lock.
+
+        Args:
+            storage (StorageBackend, optional): Persistence backend (in-memory if omitted)
+        """
+        self._lock = ReadWriteLock()
+        super().__init__(storage)
+
+    # Reads
+    get_all_tasks = _reader(TaskManager.get_all_tasks)
+    get_task_by_id = _reader(TaskManager.get_task_by_id)
+    get_next_id = _reader(TaskManager.get_next_id)
+    statistics = _reader(TaskManager.statistics)
+    __len__ = _reader(TaskManager.__len__)
+
+    # Writes
+    add_task = _writer(TaskManager.add_task)
+    update_task = _writer(TaskManager.update_task)
+    delete_task = _writer(TaskManager.delete_task)
+    toggle_task_completion = _writer(TaskManager.toggle_task_completion)
+    add_tasks = _writer(TaskManager.add_tasks)
+    update_tasks = _writer(TaskManager.update_tasks)
+    delete_tasks = _writer(TaskManager.delete_tasks)
+    set_completed = _writer(TaskManager.set_completed)
+    toggle_tasks = _writer(TaskManager.toggle_tasks)
+    undo = _writer(TaskManager.undo)
+    redo = _writer(TaskManager.redo)
+    flush = _writer(TaskManager.flush)
+    close = _writer(TaskManager.close)
+
+    # Views: registering and releasing one changes what writers copy, reading one
+    # copies from the live tasks
+    view = _writer(TaskManager.view)
+    _release_view = _writer(TaskManager._release_view)
+    _view_lookup = _reader(TaskManager._view_lookup)
+    _view_chunk = _reader(TaskManager._view_chunk)
+
+    @property
+    def tasks(self) -> List[Task]:
+        """All stored tasks in ID order, copied under the read lock."""
+        return self.get_all_tasks()
+
+    def count_tasks(self, completed: Optional[bool] = None, tags: Optional[str] = None) -> int:
+        """Count tasks; see TaskManager.count_tasks()."""
+        with self._index_lock(completed, tags=tags):
+            return super().count_tasks(completed, tags)
+
+    def tag_counts(self) -> Dict[str, int]:
+        """Count the tasks carrying each tag; see TaskManager.tag_counts()."""
+        with self._index_lock(tags=""):
+            return super().tag_counts()
+
+    def overdue_tasks(self, offset: int = 0, limit: Optional[int] = None,
+                      today: Optional[str] = None) -> List[Task]:
+        """Overdue pending tasks; see TaskManager.overdue_tasks()."""
+        with self._index_lock(sort="due"):
+            return super().overdue_tasks(offset, limit, today)
+
+    def count_overdue(self, today: Optional[str] = None) -> int:
+        """Count overdue pending tasks; see TaskManager.count_overdue()."""
+        with self._index_lock(sort="due"):
+            return super().count_overdue(today)
+
+    def iter_tasks(self, offset: int = 0, limit: Optional[int] = None, predicate=None,
+                   completed: Optional[bool] = None, sort: Optional[str] = None,
+                   tags: Optional[str] = None) -> Iterator[Task]:
+        """
+        Iterate a consistent snapshot of the selected tasks.
+
+        The selection is copied under the read lock, so the result is not
+        affected by writes made while it is being consumed.
+
+        Args:
+            offset (int): Number of (matching) tasks to skip
+            limit (int, optional): Maximum number of tasks to yield (all if None)
+            predicate (callable, optional): Only tasks for which predicate(task) is true
+            completed (bool, optional): Only completed (True) or pending (False) tasks
+            sort (str, optional): "priority" or "due" (ID order if None)
+            tags (str, optional): Only tasks matching this tag query
+
+        Returns:
+            Iterator[Task]: The selected tasks
+        """
+        with self._index_lock(completed, sort, tags):
+            selected = list(super().iter_tasks(offset, limit, predicate, completed, sort, tags))
+        return iter(selected)
+
+    def _index_lock(self, completed: Optional[bool] = None, sort: Optional[str] = None,
+                    tags: Optional[str] = None):
+        """
+        Lock for a read that may filter by status or tags or sort through a heap index.
+
+        Indexes are built on first use, which writes, so a read that needs an
+        index not built yet takes the write lock; later ones only read.
+        """
+        if ((completed is not None and "completed" not in self._field_indexes)
+                or (sort is not None and sort not in self._heap_indexes)
+                or (tags is not None and self._tag_index is None)):
+            return self._lock.write_locked()
+        return self._lock.read_locked()
+
+    def search(self, query: str, limit: int = 20, prefix: bool = True) -> List[Task]:
+        """
+        Full-text search; see TaskManager.search().
+
+        The first call builds the index under the write lock; later calls only
+        read it.
+        """
+        if self._search_index is None:
+            with self._lock.write_locked():
+                return super().search(query, limit, prefix)
+        with self._lock.read_locked():
+            return super().search(query, limit, prefix)
+
+    def _change_feed(self) -> ChangeFeed:
+        """
+        Return the change feed, creating it under the write lock on first use.
+
+        The feed has its own lock, so subscribers reading it never hold up the
+        manager's readers or writers.
+        """
+        if self._feed is None:
+            with self._lock.write_locked():
+                return super()._change_feed()
+        return self._feed
+
+    @contextmanager
+    def batch(self):
+        """Hold the write lock while grouping mutations into one storage unit."""
+        with self._lock.write_locked():
+            with super().batch():
+                yield
@@ -0,0 +1,388 @@
+"""
+Summary statistics for the Console Todo App.
+Exports task attributes to typed columns and aggregates them in whole-column
+passes: NumPy arrays when NumPy is installed, stdlib arrays otherwise.
+"""
+from array import array
+from collections import Counter
+from itertools import compress
+from operator import not_, sub
+from typing import Dict, Iterable, List
+from config import MAX_DESCRIPTION_LENGTH, MAX_PRIORITY
+from indexes.heap_index import due_number
+from models.task import Task
+from storage.columnar import SnapshotTaskMap
+
+try:
+    import numpy as np
+except ImportError:  # Optional: the array fallback gives the same results, only slower
+    np = None
+
+
+# Upper bounds of the description length histogram buckets (in characters)
+DESCRIPTION_LENGTH_BUCKETS = (0, 20, 50, 100, 200, 500, MAX_DESCRIPTION_LENGTH)
+
+# Number of busiest due dates listed by format_statistics()
+TOP_DUE_DATES = 5
+
+
+class TaskColumns:
+    """
+    Task attributes as parallel columns, one entry per task.
+
+    Attributes:
+        completed: 1 for completed tasks, 0 for pending ones (uint8)
+        priority: The priority, 0 for none (uint8)
+        due: The due date as a YYYYMMDD number, 0 for none (int32)
+        description_length: Description length in characters (int64)
+
+    Each column is a NumPy array when NumPy is available, an array.array otherwise.
+    """
+
+    def __init__(self, completed, priority, due, description_length):
+        self.completed = completed
+        self.priority = priority
+        self.due = due
+        self.description_length = description_length
+
+    def __len__(self) -> int:
+        return len(self.completed)
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Task]) -> "TaskColumns":
+        """
+        Build columns from Task objects in one pass.
+
+        Args:
+            tasks (Iterable[Task]): The tasks to export
+
+        Returns:
+            TaskColumns: The columns
+        """
+        completed = array("B")
+        priority = array("B")
+        due = array("i")
+        description_length = array("q")
+        for task in tasks:
+            completed.append(task.completed)
+            priority.append(task.priority or 0)
+            due.append(0 if task.due is None else due_number(task.due))
+            description_length.append(len(task.description))
+        return cls._wrap(completed, priority, due, description_length)
+
+    @classmethod
+    def from_task_map(cls, tasks) -> "TaskColumns":
+        """
+        Build columns from TaskManager's task mapping.
+
+        A mapping backed by a columnar snapshot is exported straight from the
+        mapped snapshot columns, and only the tasks changed since it was opened
+        are read as objects.
+
+        Args:
+            tasks (MutableMapping[int, Task]): ID-keyed tasks
+
+        Returns:
+            TaskColumns: The columns, in the mapping's iteration order
+        """
+        if not isinstance(tasks, SnapshotTaskMap):
+            return cls.from_tasks(tasks.values())
+
+        snapshot = tasks.snapshot
+        deleted, changed, added = tasks.overlay()
+        columns = cls._from_snapshot(snapshot)
+
+        if changed:
+            rows = [snapshot.find(task_id) for task_id in changed]
+            patch = cls.from_tasks(changed.values())
+            for name in ("completed", "priority", "due", "description_length"):
+                column = getattr(columns, name)
+                if np is not None:
+                    column = column.copy()  # Views of the read-only mapping
+                    column[rows] = getattr(patch, name)
+                else:
+                    for row, value in zip(rows, getattr(patch, name)):
+                        column[row] = value
+                setattr(columns, name, column)
+
+        if deleted:
+            keep = bytearray(b"\x01") * snapshot.count
+            for task_id in deleted:
+                keep[snapshot.find(task_id)] = 0
+            columns = columns._select(keep)
+
+        if added:
+            columns = columns._concat(cls.from_tasks(added.values()))
+        return columns
+
+    @classmethod
+    def _from_snapshot(cls, snapshot) -> "TaskColumns":
+        """Export the columns of a ColumnarSnapshot, without copying them when NumPy is available."""
+        count = snapshot.count
+        if np is not None:
+            completed = np.frombuffer(snapshot.completed, np.uint8)
+            if snapshot.priority is not None:
+                priority = np.frombuffer(snapshot.priority, np.uint8)
+                due = np.frombuffer(snapshot.due, np.int32)
+            else:
+                priority = np.zeros(count, np.uint8)
+                due = np.zeros(count, np.int32)
+            offsets = np.frombuffer(snapshot.offsets, np.uint64).astype(np.int64)
+            lengths = offsets[2::2] - offsets[1:-1:2]
+            blob = np.frombuffer(snapshot.blob, np.uint8)
+            if blob.size and blob.max() >= 0x80:
+                # Byte lengths overcount non-ASCII text: subtract the UTF-8
+                # continuation bytes, summed per string by reduceat
+                continuation = np.append((blob & 0xC0) == 0x80, False)
+                per_string = np.add.reduceat(continuation, offsets[:-1], dtype=np.int64)
+                lengths = np.where(lengths > 0, lengths - per_string[1::2], 0)
+            return cls(completed, priority, due, lengths)
+
+        completed = array("B")
+        completed.frombytes(snapshot.completed)
+        priority = array("B")
+        due = array("i")
+        if snapshot.priority is not None:
+            priority.frombytes(snapshot.priority)
+            due.frombytes(snapshot.due.cast("B"))
+        else:
+            priority.frombytes(bytes(count))
+            due.frombytes(bytes(4 * count))
+        offsets = array("Q")
+        offsets.frombytes(snapshot.offsets.cast("B"))
+        blob = snapshot.blob
+        if bytes(blob).isascii():
+            lengths = array("q", map(sub, offsets[2::2], offsets[1:-1:2]))
+        else:
+            lengths = array("q", (len(str(blob[start:end], "utf-8"))
+                                  for start, end in zip(offsets[1:-1:2], offsets[2::2])))
+        return cls(completed, priority, due, lengths)
+
+    @classmethod
+    def _wrap(cls, completed: array, priority: array, due: array, description_length: array) -> "TaskColumns":
+        """Build columns from stdlib arrays, viewing them as NumPy arrays when available."""
+        if np is not None:
+            return cls(np.frombuffer(completed, np.uint8), np.frombuffer(priority, np.uint8),
+                       np.frombuffer(due, np.int32), np.frombuffer(description_length, np.int64))
+        return cls(completed, priority, due, description_length)
+
+    def _select(self, keep: bytearray) -> "TaskColumns":
+        """Return the rows whose keep flag is set."""
+        if np is not None:
+            mask = np.frombuffer(keep, np.bool_)
+            return TaskColumns(self.completed[mask], self.priority[mask], self.due[mask],
+                               self.description_length[mask])
+        return TaskColumns(*(array(column.typecode, compress(column, keep)) for column in
+                             (self.completed, self.priority, self.due, self.description_length)))
+
+    def _concat(self, other: "TaskColumns") -> "TaskColumns":
+        """Return these rows followed by other's."""
+        pairs = ((self.completed, other.completed), (self.priority, other.priority),
+                 (self.due, other.due), (self.description_length, other.description_length))
+        if np is not None:
+            return TaskColumns(*(np.concatenate(pair) for pair in pairs))
+        return TaskColumns(*(first + second for first, second in pairs))
+
+
+class TaskCounts:
+    """
+    Additive aggregates of a task list.
+
+    Counts of separate task lists (e.g. shards) combine with merge(), and
+    summary() turns them into the reported statistics.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.completed = 0
+        self.overdue = 0
+        # Tasks per priority, index 0 counting tasks without one
+        self.priority_total = [0] * (MAX_PRIORITY + 1)
+        self.priority_pending = [0] * (MAX_PRIORITY + 1)
+        self.description_lengths: Dict[int, int] = {}  # Length -> tasks
+        self.due_days: Dict[int, int] = {}  # YYYYMMDD -> tasks
+
+    def merge(self, other: "TaskCounts") -> "TaskCounts":
+        """
+        Add another list's counts to these.
+
+        Args:
+            other (TaskCounts): The counts to add
+
+        Returns:
+            TaskCounts: self
+        """
+        self.total += other.total
+        self.completed += other.completed
+        self.overdue += other.overdue
+        for level in range(MAX_PRIORITY + 1):
+            self.priority_total[level] += other.priority_total[level]
+            self.priority_pending[level] += other.priority_pending[level]
+        for mine, theirs in ((self.description_lengths, other.description_lengths),
+                             (self.due_days, other.due_days)):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+        return self
+
+    def summary(self) -> dict:
+        """
+        Derive the reported statistics.
+
+        Returns:
+            dict: JSON-serializable statistics: totals and completion rate,
+                overdue count, counts by priority, the description length
+                distribution, and task counts per due date
+        """
+        by_priority = {}
+        for level in list(range(1, MAX_PRIORITY + 1)) + [0]:
+            total = self.priority_total[level]
+            pending = self.priority_pending[level]
+            by_priority[str(level) if level else "none"] = {
+                "total": total,
+                "pending": pending,
+                "completion_rate": _rate(total - pending, total),
+            }
+
+        return {
+            "total": self.total,
+            "completed": self.completed,
+            "pending": self.total - self.completed,
+            "completion_rate": _rate(self.completed, self.total),
+            "overdue": self.overdue,
+            "by_priority": by_priority,
+            "description_length": _length_distribution(self.description_lengths),
+            "due_per_day": {
+                f"{day // 10000:04d}-{day // 100 % 100:02d}-{day % 100:02d}": count
+                for day, count in sorted(self.due_days.items())
+            },
+        }
+
+
+def _rate(part: int, whole: int) -> float:
+    """Return part / whole rounded for display (0.0 for an empty whole)."""
+    return round(part / whole, 4) if whole else 0.0
+
+
+def _length_distribution(lengths: Dict[int, int]) -> dict:
+    """Summarize a {length: tasks} histogram: extremes, mean, percentiles and buckets."""
+    total = sum(lengths.values())
+    buckets = {}
+    lower = 0
+    for upper in DESCRIPTION_LENGTH_BUCKETS:
+        label = str(upper) if upper == lower else f"{lower}-{upper}"
+        buckets[label] = sum(count for length, count in lengths.items() if lower <= length <= upper)
+        lower = upper + 1
+    if not total:
+        return {"min": 0, "max": 0, "mean": 0.0, "p50": 0, "p90": 0, "p99": 0, "histogram": buckets}
+
+    percentiles = {}
+    targets = [("p50", 0.50), ("p90", 0.90), ("p99", 0.99)]
+    seen = 0
+    for length in sorted(lengths):
+        seen += lengths[length]
+        while targets and seen >= targets[0][1] * total:
+            percentiles[targets.pop(0)[0]] = length
+    return {
+        "min": min(lengths),
+        "max": max(lengths),
+        "mean": round(sum(length * count for length, count in lengths.items()) / total, 2),
+        **percentiles,
+        "histogram": buckets,
+    }
+
+
+def count_columns(columns: TaskColumns, today: str) -> TaskCounts:
+    """
+    Aggregate task columns in whole-column passes.
+
+    Args:
+        columns (TaskColumns): The exported columns
+        today (str): Reference date for overdue tasks, as "YYYY-MM-DD"
+
+    Returns:
+        TaskCounts: The aggregates
+    """
+    counts = TaskCounts()
+    counts.total = len(columns)
+    if not counts.total:
+        return counts
+    today_number = due_number(today)
+    levels = MAX_PRIORITY + 1
+
+    if np is not None:
+        pending = columns.completed == 0
+        counts.completed = counts.total - int(np.count_nonzero(pending))
+        counts.priority_total = np.bincount(columns.priority, minlength=levels)[:levels].tolist()
+        counts.priority_pending = np.bincount(columns.priority[pending], minlength=levels)[:levels].tolist()
+        counts.description_lengths = _nonzero_bins(columns.description_length)
+
+        due = columns.due
+        counts.overdue = int(np.count_nonzero(pending & (due > 0) & (due < today_number)))
+        due = due[due > 0]
+        if due.size:
+            first = int(due.min())
+            # Counting into one bin per YYYYMMDD number is much faster than sorting,
+            # unless the dates are spread over more years than there are tasks
+            if int(due.max()) - first <= max(due.size, 1 << 20):
+                counts.due_days = _nonzero_bins(due - first, first)
+            else:
+                days, day_counts = np.unique(due, return_counts=True)
+                counts.due_days = dict(zip(days.tolist(), day_counts.tolist()))
+        return counts
+
+    counts.completed = columns.completed.count(1)
+    counts.priority_total = [columns.priority.count(level) for level in range(levels)]
+    pending_priorities = Counter(compress(columns.priority, map(not_, columns.completed)))
+    counts.priority_pending = [pending_priorities.get(level, 0) for level in range(levels)]
+    counts.description_lengths = dict(Counter(columns.description_length))
+    due_days = Counter(columns.due)
+    due_days.pop(0, None)
+    counts.due_days = dict(due_days)
+    counts.overdue = sum(1 for due in compress(columns.due, map(not_, columns.completed))
+                         if 0 < due < today_number)
+    return counts
+
+
+def _nonzero_bins(values, base: int = 0) -> Dict[int, int]:
+    """Count non-negative integers with np.bincount; returns {base + value: count} for values present."""
+    bins = np.bincount(values)
+    present = np.flatnonzero(bins)
+    return dict(zip((present + base).tolist(), bins[present].tolist()))
+
+
+def format_statistics(stats: dict) -> List[str]:
+    """
+    Render the output of TaskCounts.summary() as text lines.
+
+    Args:
+        stats (dict): The statistics
+
+    Returns:
+        List[str]: Lines to print
+    """
+    lines = [
+        f"Tasks: {stats['total']} ({stats['pending']} pending, {stats['completed']} completed)",
+        f"Completion rate: {stats['completion_rate']:.1%}",
+        f"Overdue: {stats['overdue']}",
+        "",
+        "By priority:        total   pending  completed",
+    ]
+    for level, row in stats["by_priority"].items():
+        label = f"P{level}" if level != "none" else "No priority"
+        lines.append(f"  {label:<14} {row['total']:>9} {row['pending']:>9} {row['completion_rate']:>10.1%}")
+
+    lengths = stats["description_length"]
+    lines += [
+        "",
+        f"Description length: mean {lengths['mean']}, median {lengths['p50']}, "
+        f"p90 {lengths['p90']}, p99 {lengths['p99']}, max {lengths['max']}",
+    ]
+    for label, count in lengths["histogram"].items():
+        lines.append(f"  {label + ' chars':<14} {count:>9}")
+
+    due_per_day = stats["due_per_day"]
+    if due_per_day:
+        busiest = sorted(due_per_day.items(), key=lambda item: (-item[1], item[0]))[:TOP_DUE_DATES]
+        lines += ["", f"Busiest due dates ({len(due_per_day)} dates with tasks due):"]
+        lines += [f"  {day}  {count:>9}" for day, count in busiest]
+    return lines
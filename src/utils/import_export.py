@@ -0,0 +1,296 @@
+"""
+Streaming import and export of tasks in JSONL and CSV formats.
+Records flow through generators and are committed in fixed-size chunks, so
+memory use stays flat no matter how large the file is.
+"""
+import csv
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+from utils.validation import validate_completed_flag, validate_task
+
+
+FORMAT_JSONL = "jsonl"
+FORMAT_CSV = "csv"
+FORMATS = (FORMAT_JSONL, FORMAT_CSV)
+
+CSV_FIELDS = ["id", "title", "description", "completed", "due", "priority", "tags"]
+
+DEFAULT_CHUNK_SIZE = 10_000
+MAX_REPORTED_ERRORS = 100
+
+
+class ImportResult:
+    """
+    Outcome of an import run.
+
+    Attributes:
+        imported (int): Number of tasks added
+        rejected (int): Number of invalid records
+        errors (list): Up to MAX_REPORTED_ERRORS (record number, message) pairs
+    """
+
+    def __init__(self):
+        self.imported = 0
+        self.rejected = 0
+        self.errors: List[Tuple[int, str]] = []
+
+    def add_error(self, number: int, message: str) -> None:
+        """Count a rejected record, keeping only the first few messages."""
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((number, message))
+
+    def to_dict(self) -> dict:
+        """Return the result as a plain dict suitable for JSON output."""
+        return {"imported": self.imported, "rejected": self.rejected, "errors": self.errors}
+
+
+def detect_format(path: str, default: str = FORMAT_JSONL) -> str:
+    """
+    Guess the file format from its extension.
+
+    Args:
+        path (str): File path (".csv" means CSV, anything else the default)
+        default (str): Format used when the extension is not recognised
+
+    Returns:
+        str: "jsonl" or "csv"
+    """
+    return FORMAT_CSV if path.lower().endswith(".csv") else default
+
+
+# ----------------------------------------------------------------------
+# Export
+# ----------------------------------------------------------------------
+
+def export_jsonl(tasks: Iterable, out: TextIO) -> int:
+    """
+    Write tasks as one JSON object per line.
+
+    Args:
+        tasks (Iterable[Task]): Tasks to write, e.g. TaskManager.iter_tasks()
+        out (TextIO): Destination text stream
+
+    Returns:
+        int: Number of tasks written
+    """
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    count = 0
+    for task in tasks:
+        out.write(encode(task.to_dict()))
+        out.write("\n")
+        count += 1
+    return count
+
+
+def export_csv(tasks: Iterable, out: TextIO) -> int:
+    """
+    Write tasks as CSV with a header row.
+
+    Args:
+        tasks (Iterable[Task]): Tasks to write, e.g. TaskManager.iter_tasks()
+        out (TextIO): Destination text stream (opened with newline="")
+
+    Returns:
+        int: Number of tasks written
+    """
+    writer = csv.writer(out)
+    writer.writerow(CSV_FIELDS)
+    count = 0
+    for task in tasks:
+        writer.writerow([task.id, task.title, task.description, "true" if task.completed else "false",
+                         task.due or "", "" if task.priority is None else task.priority, " ".join(task.tags)])
+        count += 1
+    return count
+
+
+def export_tasks(task_manager, out: TextIO, fmt: str = FORMAT_JSONL) -> int:
+    """
+    Stream every task of a TaskManager to a text stream.
+
+    A local TaskManager is read through a point-in-time view (see
+    TaskManager.view()), so the file holds the task list as it was when the
+    export started even if other threads change tasks meanwhile.
+
+    Args:
+        task_manager (TaskManager): Source of the tasks
+        out (TextIO): Destination text stream
+        fmt (str): "jsonl" or "csv"
+
+    Returns:
+        int: Number of tasks written
+    """
+    if fmt == FORMAT_CSV:
+        export = export_csv
+    elif fmt == FORMAT_JSONL:
+        export = export_jsonl
+    else:
+        raise ValueError(f"Unknown format: {fmt}")
+
+    open_view = getattr(task_manager, "view", None)
+    if open_view is None:  # Sharded and remote managers page through copies of the tasks
+        return export(task_manager.iter_tasks(), out)
+    with open_view() as view:
+        return export(view, out)
+
+
+# ----------------------------------------------------------------------
+# Import
+# ----------------------------------------------------------------------
+
+def validate_record(record) -> Tuple[Optional[tuple], str]:
+    """
+    Validate one imported record.
+
+    Args:
+        record (dict): Fields "title" (required), "description", "completed", "due", "priority"
+            and "tags" (a list, or text separated by spaces or commas)
+
+    Returns:
+        tuple: ((title, description, completed, due, priority, tags) or None, error message)
+    """
+    if not isinstance(record, dict):
+        return None, "Record must be an object"
+
+    is_valid, error_msg, completed = validate_completed_flag(record.get("completed", False))
+    if not is_valid:
+        return None, error_msg
+
+    description = record.get("description")
+    _, error_msg, row = validate_task(record.get("title"), "" if description is None else description,
+                                      completed, record.get("due"), record.get("priority"), record.get("tags"))
+    return row, error_msg
+
+
+def _parse_jsonl_lines(numbered_lines: List[Tuple[int, str]]) -> List[Tuple[int, Optional[tuple], str]]:
+    """Parse and validate a chunk of numbered JSONL lines (runs in worker processes)."""
+    parsed = []
+    for number, line in numbered_lines:
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            parsed.append((number, None, f"Invalid JSON: {e}"))
+            continue
+        row, error_msg = validate_record(record)
+        parsed.append((number, row, error_msg))
+    return parsed
+
+
+def _numbered_chunks(lines: Iterable[str], chunk_size: int) -> Iterator[List[Tuple[int, str]]]:
+    """Group non-blank lines into lists of (line number, line)."""
+    numbered = ((number, line) for number, line in enumerate(lines, start=1) if line.strip())
+    while True:
+        chunk = list(islice(numbered, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_jsonl_chunks(lines: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      workers: int = 1) -> Iterator[List[Tuple[int, Optional[tuple], str]]]:
+    """
+    Parse and validate JSONL input chunk by chunk.
+
+    With workers > 1, chunks are parsed in a process pool. At most 2 * workers
+    chunks are in flight at a time, and results come back in input order, so
+    memory stays bounded.
+
+    Args:
+        lines (Iterable[str]): Input lines
+        chunk_size (int): Records per chunk
+        workers (int): Number of parser processes (1 parses in this process)
+
+    Returns:
+        Iterator[list]: Chunks of (line number, validated row or None, error message)
+    """
+    chunks = _numbered_chunks(lines, chunk_size)
+    if workers <= 1:
+        for chunk in chunks:
+            yield _parse_jsonl_lines(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_parse_jsonl_lines, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def iter_csv_chunks(stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Tuple[int, Optional[tuple], str]]]:
+    """
+    Parse and validate CSV input (with a header row) chunk by chunk.
+
+    CSV is always parsed in this process because quoted fields may span lines,
+    so the file cannot be split safely at arbitrary line boundaries.
+
+    Args:
+        stream (TextIO): Input stream (opened with newline="")
+        chunk_size (int): Records per chunk
+
+    Returns:
+        Iterator[list]: Chunks of (record number, validated row or None, error message)
+    """
+    reader = csv.DictReader(stream)
+    chunk = []
+    for number, record in enumerate(reader, start=2):  # Line 1 is the header
+        row, error_msg = validate_record(record)
+        chunk.append((number, row, error_msg))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def import_tasks(task_manager, stream: TextIO, fmt: str = FORMAT_JSONL,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1,
+                 skip_invalid: bool = False) -> ImportResult:
+    """
+    Stream tasks from a JSONL or CSV source into a TaskManager.
+
+    Imported tasks receive new IDs. Each record is validated once, by
+    validate_record(), and each chunk of valid records is committed with
+    TaskManager.add_tasks(validated=True), so it is stored atomically. Without
+    skip_invalid, the import stops at the first chunk containing an invalid
+    record. Chunks committed before that one are kept.
+
+    Args:
+        task_manager (TaskManager): Destination manager
+        stream (TextIO): Input stream
+        fmt (str): "jsonl" or "csv"
+        chunk_size (int): Records validated and committed together
+        workers (int): Parser processes for JSONL input
+        skip_invalid (bool): Skip invalid records instead of stopping
+
+    Returns:
+        ImportResult: Counts of imported and rejected records
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    if fmt == FORMAT_JSONL:
+        chunks = iter_jsonl_chunks(stream, chunk_size, workers)
+    elif fmt == FORMAT_CSV:
+        chunks = iter_csv_chunks(stream, chunk_size)
+    else:
+        raise ValueError(f"Unknown format: {fmt}")
+
+    result = ImportResult()
+    for chunk in chunks:
+        rows = []
+        for number, row, error_msg in chunk:
+            if row is None:
+                result.add_error(number, error_msg)
+            else:
+                rows.append(row)
+
+        if result.rejected and not skip_invalid:
+            break
+        if rows:
+            result.imported += len(task_manager.add_tasks(rows, validated=True))
+    return result
@@ -0,0 +1,317 @@
+"""
+Opt-in metrics for the Console Todo App.
+Records call counts, errors and latency histograms for instrumented functions,
+plus gauges such as task counts, and exports them as Prometheus text or JSON.
+
+Nothing is wrapped until instrumentation is requested, so a disabled
+session runs the original, unwrapped functions at no cost.
+"""
+import functools
+import json
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+# Upper bounds (seconds) of the latency histogram buckets: 1, 2.5 and 5 per decade from 1 us to 10 s
+LATENCY_BUCKETS = tuple(round(mantissa * 10.0 ** exponent, 9)
+                        for exponent in range(-6, 1) for mantissa in (1, 2.5, 5)) + (10.0,)
+
+# TaskManager (and RemoteTaskManager) methods timed by instrument_task_manager()
+TASK_MANAGER_METHODS = (
+    "add_task", "get_all_tasks", "iter_tasks", "count_tasks", "get_task_by_id",
+    "update_task", "delete_task", "toggle_task_completion", "add_tasks", "update_tasks",
+    "delete_tasks", "set_completed", "toggle_tasks", "search", "next_tasks", "overdue_tasks",
+    "count_overdue", "statistics", "tag_counts", "undo", "redo", "flush",
+)
+
+
+class Histogram:
+    """Latency histogram with fixed buckets plus a running count and sum."""
+
+    def __init__(self, bounds: Iterable[float] = LATENCY_BUCKETS):
+        """
+        Args:
+            bounds (Iterable[float]): Increasing bucket upper bounds in seconds
+        """
+        self.bounds = tuple(bounds)
+        self.buckets = [0] * (len(self.bounds) + 1)  # The last bucket is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimate a percentile as the upper bound of the bucket that contains it.
+
+        Args:
+            fraction (float): e.g. 0.95 for p95
+
+        Returns:
+            float: The estimate in seconds (inf if it falls in the overflow bucket, 0 if empty)
+        """
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        seen = 0
+        for bound, bucket in zip(self.bounds, self.buckets):
+            seen += bucket
+            if seen >= target:
+                return bound
+        return float("inf")
+
+
+class MetricsRegistry:
+    """
+    Collects metrics for one session.
+
+    Counters and histograms are keyed by the instrumented function's name.
+    Gauges are callables read when the metrics are exported, so keeping them
+    current costs nothing.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self.histograms: Dict[str, Histogram] = {}
+        self.errors: Dict[str, int] = {}
+        self.gauges: Dict[str, Callable[[], float]] = {}
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float, failed: bool = False) -> None:
+        """
+        Record one call of a function.
+
+        Args:
+            name (str): Function name, e.g. "TaskManager.add_task"
+            seconds (float): How long the call took
+            failed (bool): Whether it raised an exception
+        """
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(seconds)
+            if failed:
+                self.errors[name] = self.errors.get(name, 0) + 1
+
+    def add_gauge(self, name: str, read: Callable[[], float]) -> None:
+        """
+        Register a gauge.
+
+        Args:
+            name (str): Gauge name, optionally with Prometheus labels, e.g. 'tasks{status="pending"}'
+            read (callable): Returns the current value
+        """
+        self.gauges[name] = read
+
+    def timed(self, name: str, function: Callable) -> Callable:
+        """
+        Wrap a function so every call is recorded under name.
+
+        Args:
+            name (str): Name to record the calls under
+            function (callable): The function to wrap
+
+        Returns:
+            callable: The wrapper
+        """
+        clock = time.perf_counter
+        observe = self.observe
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            failed = False
+            try:
+                return function(*args, **kwargs)
+            except Exception:
+                failed = True
+                raise
+            finally:
+                observe(name, clock() - start, failed)
+
+        wrapper.__metrics_name__ = name
+        return wrapper
+
+    def read_gauges(self) -> Dict[str, float]:
+        """Read every gauge, skipping ones that fail (e.g. a lost server connection)."""
+        values = {}
+        for name, read in self.gauges.items():
+            try:
+                values[name] = read()
+            except Exception:
+                continue
+        return values
+
+    def to_dict(self) -> dict:
+        """
+        Export the metrics as a JSON-serializable dict.
+
+        Returns:
+            dict: {"uptime_seconds", "functions": {name: {...}}, "gauges": {name: value}}
+        """
+        with self._lock:
+            functions = {
+                name: {
+                    "calls": histogram.count,
+                    "errors": self.errors.get(name, 0),
+                    "total_seconds": histogram.sum,
+                    "mean_seconds": histogram.sum / histogram.count if histogram.count else 0.0,
+                    "p50_seconds": histogram.percentile(0.50),
+                    "p95_seconds": histogram.percentile(0.95),
+                    "p99_seconds": histogram.percentile(0.99),
+                    "buckets": dict(zip([str(bound) for bound in histogram.bounds] + ["+Inf"],
+                                        histogram.buckets)),
+                }
+                for name, histogram in sorted(self.histograms.items())
+            }
+        return {
+            "uptime_seconds": time.time() - self.started,
+            "functions": functions,
+            "gauges": self.read_gauges(),
+        }
+
+    def to_prometheus(self, prefix: str = "todo") -> str:
+        """
+        Export the metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): Prefix for every metric name
+
+        Returns:
+            str: The exposition text
+        """
+        lines = [
+            f"# TYPE {prefix}_call_duration_seconds histogram",
+        ]
+        with self._lock:
+            histograms = sorted(self.histograms.items())
+            errors = dict(self.errors)
+        for name, histogram in histograms:
+            label = f'function="{name}"'
+            cumulative = 0
+            for bound, bucket in zip(histogram.bounds, histogram.buckets):
+                cumulative += bucket
+                lines.append(f'{prefix}_call_duration_seconds_bucket{{{label},le="{bound}"}} {cumulative}')
+            lines.append(f'{prefix}_call_duration_seconds_bucket{{{label},le="+Inf"}} {histogram.count}')
+            lines.append(f"{prefix}_call_duration_seconds_sum{{{label}}} {histogram.sum}")
+            lines.append(f"{prefix}_call_duration_seconds_count{{{label}}} {histogram.count}")
+
+        lines.append(f"# TYPE {prefix}_call_errors_total counter")
+        for name, _ in histograms:
+            lines.append(f'{prefix}_call_errors_total{{function="{name}"}} {errors.get(name, 0)}')
+
+        gauges = self.read_gauges()
+        for family in sorted({name.split("{")[0] for name in gauges}):
+            lines.append(f"# TYPE {prefix}_{family} gauge")
+        for name, value in sorted(gauges.items()):
+            lines.append(f"{prefix}_{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """
+        Write the metrics to a file: JSON if the name ends in .json, Prometheus text otherwise.
+
+        Args:
+            path (str): Destination file path
+        """
+        if path.lower().endswith(".json"):
+            text = json.dumps(self.to_dict(), indent=2)
+        else:
+            text = self.to_prometheus()
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+_registry: Optional[MetricsRegistry] = None
+
+
+def enable() -> MetricsRegistry:
+    """
+    Turn metrics on for this process.
+
+    Returns:
+        MetricsRegistry: The process-wide registry (created on the first call)
+    """
+    global _registry
+    if _registry is None:
+        _registry = MetricsRegistry()
+    return _registry
+
+
+def get_registry() -> Optional[MetricsRegistry]:
+    """Return the process-wide registry, or None if metrics are disabled."""
+    return _registry
+
+
+def instrument_object(obj, names: Iterable[str], label: str) -> List[str]:
+    """
+    Replace methods of one object with timed wrappers (the class is untouched).
+
+    Args:
+        obj: The object to instrument
+        names (Iterable[str]): Method names; ones the object lacks are skipped
+        label (str): Prefix for the recorded names, e.g. "TaskManager"
+
+    Returns:
+        List[str]: The names that were instrumented
+    """
+    registry = enable()
+    done = []
+    for name in names:
+        method = getattr(obj, name, None)
+        if method is None or hasattr(method, "__metrics_name__"):
+            continue
+        setattr(obj, name, registry.timed(f"{label}.{name}", method))
+        done.append(name)
+    return done
+
+
+def instrument_namespace(namespace: dict, prefix: str, label: str) -> List[str]:
+    """
+    Replace the functions in a module namespace whose names start with prefix.
+
+    Calls that look the function up in the module at call time (as the menu
+    loop does) go through the wrapper.
+
+    Args:
+        namespace (dict): A module's globals()
+        prefix (str): Name prefix to select, e.g. "handle_"
+        label (str): Prefix for the recorded names, e.g. "main"
+
+    Returns:
+        List[str]: The names that were instrumented
+    """
+    registry = enable()
+    done = []
+    for name, value in list(namespace.items()):
+        if name.startswith(prefix) and callable(value) and not hasattr(value, "__metrics_name__"):
+            namespace[name] = registry.timed(f"{label}.{name}", value)
+            done.append(name)
+    return done
+
+
+def instrument_task_manager(task_manager) -> MetricsRegistry:
+    """
+    Time a task manager's public methods and add task-count gauges.
+
+    Args:
+        task_manager: A TaskManager, ThreadSafeTaskManager or RemoteTaskManager
+
+    Returns:
+        MetricsRegistry: The process-wide registry
+    """
+    registry = enable()
+    count_tasks = task_manager.count_tasks  # Unwrapped, so reading gauges is not itself recorded
+    instrument_object(task_manager, TASK_MANAGER_METHODS, type(task_manager).__name__)
+    registry.add_gauge("tasks", count_tasks)
+    registry.add_gauge('tasks_by_status{status="pending"}', lambda: count_tasks(completed=False))
+    registry.add_gauge('tasks_by_status{status="completed"}', lambda: count_tasks(completed=True))
+    return registry
@@ -0,0 +1,58 @@
+"""
+Session profiling for the Console Todo App.
+Wraps a whole run in cProfile and tracemalloc and writes the reports on exit.
+"""
+import cProfile
+import io
+import pstats
+import tracemalloc
+from contextlib import contextmanager
+from typing import List
+
+
+# Number of entries in the text reports
+REPORT_LINES = 40
+
+
+@contextmanager
+def profile_session(prefix: str):
+    """
+    Profile CPU time and memory allocations of the code run inside the block.
+
+    On exit (including SystemExit and Ctrl+C) it writes:
+    - PREFIX.prof: raw cProfile data, for pstats or snakeviz
+    - PREFIX.cpu.txt: the functions with the highest cumulative time
+    - PREFIX.memory.txt: peak traced memory and the largest allocation sites
+
+    Args:
+        prefix (str): Path prefix of the report files
+
+    Yields:
+        List[str]: Filled with the written file paths once the block ends
+    """
+    written: List[str] = []
+    tracemalloc.start()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield written
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        profiler.dump_stats(f"{prefix}.prof")
+        cpu_report = io.StringIO()
+        pstats.Stats(profiler, stream=cpu_report).sort_stats("cumulative").print_stats(REPORT_LINES)
+        with open(f"{prefix}.cpu.txt", "w", encoding="utf-8") as f:
+            f.write(cpu_report.getvalue())
+
+        with open(f"{prefix}.memory.txt", "w", encoding="utf-8") as f:
+            f.write(f"Current traced memory: {current / 2**20:.1f} MiB\n")
+            f.write(f"Peak traced memory: {peak / 2**20:.1f} MiB\n\n")
+            f.write(f"Top {REPORT_LINES} allocation sites still alive at exit:\n")
+            for stat in snapshot.statistics("lineno")[:REPORT_LINES]:
+                f.write(f"{stat}\n")
+
+        written.extend([f"{prefix}.prof", f"{prefix}.cpu.txt", f"{prefix}.memory.txt"])
@@ -0,0 +1,83 @@
+"""
+Render cache for the Console Todo App menu.
+Keeps the formatted text of displayed tasks, keyed by task ID and version, so
+redisplaying a list only formats the tasks that changed since it was shown.
+"""
+from collections import OrderedDict
+from typing import Callable, Tuple
+from config import RENDER_CACHE_MEMORY_BUDGET
+from models.task import Task
+
+
+# Approximate bytes an entry costs besides its text (key tuple, entry tuple, dict slot)
+ENTRY_OVERHEAD = 200
+
+
+class RenderCache:
+    """
+    Least-recently-used cache of formatted task text.
+
+    Entries are keyed by view name and task ID and hold the task version they
+    were formatted for (see Task.version), so a changed task misses and is
+    formatted again while every other task is a dictionary hit. The estimated
+    size of the cached text never exceeds memory_budget: the least recently
+    shown entries are evicted first.
+    """
+
+    def __init__(self, memory_budget: int = RENDER_CACHE_MEMORY_BUDGET):
+        """
+        Initialize an empty cache.
+
+        Args:
+            memory_budget (int): Maximum estimated bytes of cached text
+        """
+        self.memory_budget = memory_budget
+        self._entries: "OrderedDict[Tuple[str, int], Tuple[int, str]]" = OrderedDict()
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Estimated bytes currently held."""
+        return self._size
+
+    def render(self, view: str, task: Task, formatter: Callable[[Task], str]) -> str:
+        """
+        Return a task's text for a view, formatting it only if it changed.
+
+        Args:
+            view (str): Name of the view, e.g. "list"; each view caches its own text
+            task (Task): The task to show
+            formatter (callable): Builds the text of a task for this view
+
+        Returns:
+            str: The formatted text
+        """
+        key = (view, task.id)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == task.version:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        text = formatter(task)
+        if entry is not None:
+            self._size -= ENTRY_OVERHEAD + len(entry[1])
+        self._entries[key] = (task.version, text)
+        self._entries.move_to_end(key)
+        self._size += ENTRY_OVERHEAD + len(text)
+        while self._size > self.memory_budget and self._entries:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self._size -= ENTRY_OVERHEAD + len(evicted)
+        return text
+
+    def clear(self) -> None:
+        """Drop every entry, e.g. when switching to another task manager."""
+        self._entries.clear()
+        self._size = 0
@@ -0,0 +1,107 @@
+"""
+Reader/writer lock for the Console Todo App.
+Many readers may hold the lock together; a writer holds it alone.
+"""
+import threading
+from contextlib import contextmanager
+
+
+class ReadWriteLock:
+    """
+    Reentrant, writer-preferring reader/writer lock.
+
+    - Any number of threads may hold the read lock at the same time.
+    - The write lock is exclusive. Once a writer is waiting, new readers queue
+      behind it, so a steady stream of readers cannot starve writers.
+    - A thread holding the write lock may re-acquire the read or write lock
+      (e.g. a write method calling a read method). A thread holding the read
+      lock may re-acquire the read lock, but may not upgrade to the write lock.
+    """
+
+    def __init__(self):
+        """Initialize an unlocked lock."""
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._write_depth = 0
+        self._waiting_writers = 0
+        self._local = threading.local()
+
+    def _held(self) -> list:
+        """Return this thread's stack of held lock kinds ("r" or "w")."""
+        held = getattr(self._local, "held", None)
+        if held is None:
+            held = self._local.held = []
+        return held
+
+    def acquire_read(self) -> None:
+        """Acquire the lock for reading, blocking while a writer holds or awaits it."""
+        me = threading.get_ident()
+        held = self._held()
+        with self._condition:
+            if self._writer == me:
+                self._write_depth += 1
+                held.append("w")
+                return
+            if "r" not in held:
+                while self._writer is not None or self._waiting_writers:
+                    self._condition.wait()
+            self._readers += 1
+            held.append("r")
+
+    def acquire_write(self) -> None:
+        """Acquire the lock exclusively, blocking until all readers and writers leave."""
+        me = threading.get_ident()
+        held = self._held()
+        with self._condition:
+            if self._writer == me:
+                self._write_depth += 1
+                held.append("w")
+                return
+            if "r" in held:
+                raise RuntimeError("Cannot upgrade a read lock to a write lock")
+
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._write_depth = 1
+            held.append("w")
+
+    def release(self) -> None:
+        """Release the most recent acquisition made by this thread."""
+        held = self._held()
+        if not held:
+            raise RuntimeError("Cannot release an un-acquired lock")
+        kind = held.pop()
+        with self._condition:
+            if kind == "w":
+                self._write_depth -= 1
+                if self._write_depth == 0:
+                    self._writer = None
+                    self._condition.notify_all()
+            else:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def read_locked(self):
+        """Context manager holding the read lock."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release()
+
+    @contextmanager
+    def write_locked(self):
+        """Context manager holding the write lock."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release()
@@ -2,6 +2,15 @@
 Validation functions for the Console Todo App.
 These functions validate user inputs and return appropriate error messages.
 """
+from config import (EXIT_OPTION, MAX_BULK_IDS, MAX_DESCRIPTION_LENGTH, MAX_TITLE_LENGTH, MIN_PRIORITY,
+                    MAX_PRIORITY, MAX_TAG_LENGTH, MAX_TAGS_PER_TASK)
+
+
+# Characters a tag may contain besides letters and digits (never first)
+TAG_PUNCTUATION = frozenset("-_./:")
+
+# Operators of tag queries, which therefore cannot be tags
+TAG_QUERY_WORDS = frozenset({"and", "or", "not"})
 
 
 def validate_task_title(title):
@@ -20,8 +29,8 @@ def validate_task_title(title):
     if not title.strip():
         return False, "Title cannot be empty"
     
-    if len(title) > 200:
-        return False, "Title must not exceed 200 characters"
+    if len(title) > MAX_TITLE_LENGTH:
+        return False, f"Title must not exceed {MAX_TITLE_LENGTH} characters"
     
     return True, ""
 
@@ -39,12 +48,258 @@ def validate_task_description(description):
     if not isinstance(description, str):
         return False, "Description must be a string"
     
-    if len(description) > 1000:
-        return False, "Description must not exceed 1000 characters"
+    if len(description) > MAX_DESCRIPTION_LENGTH:
+        return False, f"Description must not exceed {MAX_DESCRIPTION_LENGTH} characters"
     
     return True, ""
 
 
+def validate_due_date(value):
+    """
+    Validates an optional due date given as "YYYY-MM-DD" text or a datetime.date.
+
+    Args:
+        value (str, date or None): The due date; None, empty text or "none" mean no due date
+
+    Returns:
+        tuple: (is_valid: bool, error_message: str, due: "YYYY-MM-DD" or None)
+    """
+    if value is None:
+        return True, "", None
+
+    from datetime import date, datetime
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return True, "", value.isoformat()
+
+    if not isinstance(value, str):
+        return False, "Due date must be a date in YYYY-MM-DD format", None
+
+    text = value.strip()
+    if not text or text.lower() == "none":
+        return True, "", None
+
+    try:
+        return True, "", date.fromisoformat(text).isoformat()
+    except ValueError:
+        return False, f"Due date must be a valid date in YYYY-MM-DD format, got {value!r}", None
+
+
+def validate_priority(value):
+    """
+    Validates an optional priority from MIN_PRIORITY (most urgent) to MAX_PRIORITY.
+
+    Args:
+        value (int, str or None): The priority, e.g. 1, "2" or "P3"; None, empty text
+            or "none" mean no priority
+
+    Returns:
+        tuple: (is_valid: bool, error_message: str, priority: int or None)
+    """
+    error_msg = f"Priority must be a whole number from {MIN_PRIORITY} (most urgent) to {MAX_PRIORITY}"
+    if value is None:
+        return True, "", None
+
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if not text or text == "none":
+            return True, "", None
+        try:
+            value = int(text[1:] if text.startswith("p") else text)
+        except ValueError:
+            return False, error_msg, None
+
+    if isinstance(value, bool) or not isinstance(value, int) or not MIN_PRIORITY <= value <= MAX_PRIORITY:
+        return False, error_msg, None
+    return True, "", value
+
+
+def validate_tag(text):
+    """
+    Validates and normalizes a single tag such as "work", "#Home" or "project:website".
+
+    Args:
+        text (str): The tag; a leading "#" is dropped and letters are lowercased
+
+    Returns:
+        tuple: (is_valid: bool, error_message: str, tag: str)
+    """
+    if not isinstance(text, str):
+        return False, "Tags must be strings", ""
+    tag = text.strip().lstrip("#").lower()
+    if not tag:
+        return False, "Tag cannot be empty", ""
+    if len(tag) > MAX_TAG_LENGTH:
+        return False, f"Tags must not exceed {MAX_TAG_LENGTH} characters", ""
+    if not tag[0].isalnum() or not all(ch.isalnum() or ch in TAG_PUNCTUATION for ch in tag):
+        return False, (f"Tags must start with a letter or digit and contain only letters, digits "
+                       f"and - _ . / :, got {text!r}"), ""
+    if tag in TAG_QUERY_WORDS:
+        return False, f"'{tag}' is a tag query operator and cannot be used as a tag", ""
+    return True, "", tag
+
+
+def validate_tags(value):
+    """
+    Validates an optional set of tags.
+
+    Args:
+        value (str, list, tuple, set or None): Tags as text separated by commas or
+            spaces (e.g. "work, #home"), or as a collection of strings; None, empty
+            text or "none" mean no tags
+
+    Returns:
+        tuple: (is_valid: bool, error_message: str, tags: sorted tuple of distinct normalized tags)
+    """
+    if not value or (isinstance(value, str) and value.strip().lower() == "none"):
+        return True, "", ()
+    if isinstance(value, str):
+        items = value.replace(",", " ").split()
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        items = value
+    else:
+        return False, "Tags must be text or a list of strings", ()
+
+    tags = set()
+    for item in items:
+        is_valid, error_msg, tag = validate_tag(item)
+        if not is_valid:
+            return False, error_msg, ()
+        tags.add(tag)
+    if len(tags) > MAX_TAGS_PER_TASK:
+        return False, f"A task can have at most {MAX_TAGS_PER_TASK} tags", ()
+    return True, "", tuple(sorted(tags))
+
+
+def validate_task(title, description="", completed=False, due=None, priority=None, tags=()):
+    """
+    Validates every field of a new task record in one pass.
+
+    This is the check TaskManager (and anything else creating tasks) runs once
+    per record; the result can be stored without further checks.
+
+    Args:
+        title (str): The task title
+        description (str): The task description
+        completed (bool): The completion status
+        due (str, date or None): The due date (see validate_due_date)
+        priority (int, str or None): The priority (see validate_priority)
+        tags (str, list or None): The tags (see validate_tags)
+
+    Returns:
+        tuple: (is_valid: bool, error_message: str,
+                row: (title, description, completed, due, priority, tags) or None), with
+                the title and description stripped and the other fields normalized
+    """
+    is_valid, error_msg = validate_task_title(title)
+    if is_valid:
+        is_valid, error_msg = validate_task_description(description)
+    if is_valid and not isinstance(completed, bool):
+        is_valid, error_msg = False, "Completed must be a boolean value"
+    if is_valid:
+        is_valid, error_msg, due = validate_due_date(due)
+    if is_valid:
+        is_valid, error_msg, priority = validate_priority(priority)
+    if is_valid:
+        is_valid, error_msg, tags = validate_tags(tags)
+    if not is_valid:
+        return False, error_msg, None
+    return True, "", (title.strip(), description.strip(), completed, due, priority, tags)
+
+
+def validate_task_changes(title, description, due, priority, tags, unchanged):
+    """
+    Validates the new fields of a task update in one pass.
+
+    Args:
+        title (str or None): The new title, or None to keep the current one
+        description (str or None): The new description, or None to keep the current one
+        due: The new due date (None removes it), or unchanged to keep the current one
+        priority: The new priority (None removes it), or unchanged to keep the current one
+        tags: The new tags (None removes them all), or unchanged to keep the current ones
+        unchanged: The marker meaning "keep the current due date / priority / tags"
+
+    Returns:
+        tuple: (is_valid: bool, error_message: str,
+                changes: (title, description, due, priority, tags) or None), normalized
+                like validate_task() with kept fields passed through
+    """
+    is_valid, error_msg = True, ""
+    if title is not None:
+        is_valid, error_msg = validate_task_title(title)
+    if is_valid and description is not None:
+        is_valid, error_msg = validate_task_description(description)
+    if is_valid and due is not unchanged:
+        is_valid, error_msg, due = validate_due_date(due)
+    if is_valid and priority is not unchanged:
+        is_valid, error_msg, priority = validate_priority(priority)
+    if is_valid and tags is not unchanged:
+        is_valid, error_msg, tags = validate_tags(tags)
+    if not is_valid:
+        return False, error_msg, None
+    return True, "", (None if title is None else title.strip(),
+                      None if description is None else description.strip(), due, priority, tags)
+
+
+def validate_task_batch(records):
+    """
+    Validates many new task records in one pass, collecting every error.
+
+    Args:
+        records (iterable): (title, description) pairs, optionally followed by
+            completed, due, priority and tags
+
+    Returns:
+        tuple: (rows: the normalized rows of the valid records, in order (see validate_task),
+                errors: (position, error_message) for each invalid record, counting from 1)
+    """
+    rows = []
+    errors = []
+    for position, record in enumerate(records, start=1):
+        if len(record) < 2:
+            errors.append((position, "Record must have a title and a description"))
+            continue
+        is_valid, error_msg, row = validate_task(*record[:6])
+        if is_valid:
+            rows.append(row)
+        else:
+            errors.append((position, error_msg))
+    return rows, errors
+
+
+def validate_task_changes_batch(updates, unchanged):
+    """
+    Validates many task updates in one pass, collecting every error.
+
+    Task IDs are passed through unchecked; whether they exist is up to the caller.
+
+    Args:
+        updates (iterable): (task ID, new title or None, new description or None)
+            triples, optionally followed by a new due date, priority and tags
+        unchanged: The marker meaning "keep the current due date / priority / tags";
+            it is also assumed for a missing due date, priority or tags
+
+    Returns:
+        tuple: (rows: (task ID, title, description, due, priority, tags) of the valid updates,
+                errors: (position, error_message) for each invalid update, counting from 1)
+    """
+    rows = []
+    errors = []
+    for position, update in enumerate(updates, start=1):
+        if len(update) < 3:
+            errors.append((position, "Update must have a task ID, a title and a description"))
+            continue
+        task_id, title, description, *schedule = update
+        due, priority, tags = (*schedule, unchanged, unchanged, unchanged)[:3]
+        is_valid, error_msg, changes = validate_task_changes(title, description, due, priority, tags, unchanged)
+        if is_valid:
+            rows.append((task_id, *changes))
+        else:
+            errors.append((position, error_msg))
+    return rows, errors
+
+
 def validate_task_id(task_id, task_manager):
     """
     Validates that the task ID exists in the task manager.
@@ -68,7 +323,7 @@ def validate_task_id(task_id, task_manager):
 
 def validate_menu_choice(choice):
     """
-    Validates that the menu choice is a valid option (1-6).
+    Validates that the menu choice is a valid option (1 to EXIT_OPTION).
     
     Args:
         choice (str or int): The menu choice to validate
@@ -78,10 +333,10 @@ def validate_menu_choice(choice):
     """
     try:
         choice_int = int(choice)
-        if 1 <= choice_int <= 6:
+        if 1 <= choice_int <= EXIT_OPTION:
             return True, "", choice_int
         else:
-            return False, "Menu choice must be between 1 and 6", choice_int
+            return False, f"Menu choice must be between 1 and {EXIT_OPTION}", choice_int
     except ValueError:
         return False, "Menu choice must be a number", None
 
@@ -104,4 +359,67 @@ def validate_positive_integer(value_str, field_name="Value"):
         else:
             return False, f"{field_name} must be a positive integer", value_int
     except ValueError:
-        return False, f"{field_name} must be a number", None
\ No newline at end of file
+        return False, f"{field_name} must be a number", None
+
+
+def parse_id_ranges(text):
+    """
+    Parses a list of task IDs and inclusive ID ranges such as "3-500,712".
+
+    Args:
+        text (str): Comma-separated IDs and "start-end" ranges
+
+    Returns:
+        tuple: (is_valid: bool, error_message: str, ids: list of int in input order, without repeats)
+    """
+    if not isinstance(text, str) or not text.strip():
+        return False, "Enter at least one task ID or range", []
+
+    ids = {}
+    for part in text.split(","):
+        part = part.strip()
+        if not part:
+            continue
+
+        start_str, separator, end_str = part.partition("-")
+        is_valid, error_msg, start = validate_positive_integer(start_str.strip(), "Task ID")
+        if not is_valid:
+            return False, f"{error_msg}: '{part}'", []
+        end = start
+        if separator:
+            is_valid, error_msg, end = validate_positive_integer(end_str.strip(), "Task ID")
+            if not is_valid:
+                return False, f"{error_msg}: '{part}'", []
+            if end < start:
+                return False, f"Range start must not exceed its end: '{part}'", []
+
+        if len(ids) + (end - start + 1) > MAX_BULK_IDS:
+            return False, f"Select at most {MAX_BULK_IDS} task IDs at a time", []
+        ids.update(dict.fromkeys(range(start, end + 1)))
+
+    if not ids:
+        return False, "Enter at least one task ID or range", []
+    return True, "", list(ids)
+
+
+def validate_completed_flag(value):
+    """
+    Validates a completion status given as a bool or as text such as "true", "no", "1" or "x".
+
+    Args:
+        value (bool or str): The value to validate (empty text means not completed)
+
+    Returns:
+        tuple: (is_valid: bool, error_message: str, completed: bool)
+    """
+    if isinstance(value, bool):
+        return True, "", value
+
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in ("true", "yes", "y", "1", "x", "[x]"):
+            return True, "", True
+        if text in ("", "false", "no", "n", "0", "[ ]"):
+            return True, "", False
+
+    return False, f"Completed must be true or false, got {value!r}", False